@@ -9,38 +9,117 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 import threading
 import queue
-try:
-    import pandas as pd  # type: ignore
-except Exception:
-    pd = None
-try:
-    from pandas.errors import ParserError  # type: ignore
-except Exception:
-    ParserError = Exception
-
-try:
-    import cantools  # type: ignore
-except Exception:
-    cantools = None
 from pathlib import Path
-
-try:
-    from PIL import Image, ImageTk  # type: ignore
-    PIL_AVAILABLE = True
-except Exception:
-    PIL_AVAILABLE = False
 import os
 import tempfile
 import struct
 import csv
 import re
 import math
+import json
+import gzip
+import hashlib
+import shutil
+import time
+import itertools
+import sys
+import contextlib
+import cProfile
+import io
+import pstats
+import tracemalloc
 from collections import Counter
 try:
-    import numpy as np  # type: ignore
-    NUMPY_AVAILABLE = True
+    import resource  # type: ignore  # POSIX only: peak RSS for the stage profiler
 except Exception:
-    NUMPY_AVAILABLE = False
+    resource = None
+
+_MODULE_T0 = time.perf_counter()  # startup timing reference (import of this module)
+
+# Heavy libraries are imported by load_engines(), which the GUI runs on a background
+# warm-up thread after the window has painted. Until then these stay None / False.
+pd = None
+ParserError = Exception
+cantools = None
+np = None
+NUMPY_AVAILABLE = False
+Image = ImageTk = None
+PIL_AVAILABLE = False
+_ENGINES_LOCK = threading.Lock()
+_ENGINE_IMPORT_SECONDS = {}  # library -> import time in s (None: not installed)
+
+
+def _import_pandas():
+    global pd, ParserError
+    import pandas  # type: ignore
+    pd = pandas
+    if int(pandas.__version__.split(".")[0]) < 3:
+        # Copy-on-write (always on from pandas 3): slices and shared tables stay views until written.
+        try:
+            pandas.set_option("mode.copy_on_write", True)
+        except Exception:
+            pass
+    try:
+        from pandas.errors import ParserError as pandas_parser_error  # type: ignore
+        ParserError = pandas_parser_error
+    except Exception:
+        pass
+
+
+def _import_numpy():
+    global np, NUMPY_AVAILABLE
+    import numpy  # type: ignore
+    np = numpy
+    NUMPY_AVAILABLE = True
+
+
+def _import_cantools():
+    global cantools
+    import cantools as cantools_module  # type: ignore
+    cantools = cantools_module
+
+
+def _import_pil():
+    global Image, ImageTk, PIL_AVAILABLE
+    from PIL import Image as pil_image, ImageTk as pil_imagetk  # type: ignore
+    Image, ImageTk = pil_image, pil_imagetk
+    PIL_AVAILABLE = True
+
+
+def _import_matplotlib():
+    # Only the modules the Visualization tab needs; pyplot is imported when a chart is drawn.
+    import matplotlib.figure  # type: ignore  # noqa: F401
+    import matplotlib.dates  # type: ignore  # noqa: F401
+    import matplotlib.backends.backend_tkagg  # type: ignore  # noqa: F401
+
+
+ENGINE_IMPORTS = (
+    ("numpy", _import_numpy),
+    ("pandas", _import_pandas),
+    ("cantools", _import_cantools),
+    ("PIL", _import_pil),
+    ("matplotlib", _import_matplotlib),
+)
+
+
+def load_engines():
+    """
+    Import the heavy libraries (numpy, pandas, cantools, PIL, matplotlib) once.
+
+    Safe to call from any thread and any number of times; callers that run before
+    the GUI warm-up has finished block until it is done. Returns
+    {library: import seconds, or None if it is not installed}.
+    """
+    with _ENGINES_LOCK:
+        if not _ENGINE_IMPORT_SECONDS:
+            for name, importer in ENGINE_IMPORTS:
+                started = time.perf_counter()
+                try:
+                    importer()
+                    _ENGINE_IMPORT_SECONDS[name] = time.perf_counter() - started
+                except Exception:
+                    _ENGINE_IMPORT_SECONDS[name] = None
+        return dict(_ENGINE_IMPORT_SECONDS)
 
 NXT_MAGIC = b"NXTLOG"
 NXT_VERSION = 1
@@ -52,6 +131,61 @@ ENCRYPTION_KEY = [
     0xFE, 0x34, 0x88, 0x4B
 ]
 
+# Columns that identify a row (time / frame id) rather than hold signal samples.
+EXPORT_KEY_COLUMNS = ("Date", "Time", "CAN_ID", "Timestamp", "timestamps", "UnixTime", "Microseconds")
+# Columns that stay text in typed (columnar) exports.
+EXPORT_TEXT_COLUMNS = ("GPS_Time",)
+# Canonical time axis of a decoded table: int64 ns of its Date/Time wall clock; this marks "unknown"
+# (same bit pattern as numpy's NaT, so `.view("datetime64[ns]")` shows it as NaT).
+NAT_NS = -2 ** 63
+# Parquet row groups: large enough for good compression, small enough for pruning.
+PARQUET_ROW_GROUP_ROWS = 128 * 1024
+# HDF5 table exports: rows per append, PyTables chunk cache / I/O buffer (its 16 MB defaults
+# dominate the index build at close), and compression settings.
+HDF5_APPEND_ROWS = 25_000
+HDF5_BUFFER_BYTES = 1 << 20
+HDF5_COMPLIB = "blosc"
+HDF5_COMPLEVEL = 5
+HDF5_KEY = "decoded_data"
+# NDJSON exports: rows serialized per write (a chunk's text, ~1 KB per row, is held while it is written).
+NDJSON_CHUNK_ROWS = 10_000
+# MAT exports: v5 (scipy) cannot hold variables >= 2 GB; above this switch to v7.3 (HDF5).
+MAT_V5_LIMIT_BYTES = 2 * 1024 ** 3 - 64 * 1024 ** 2
+MAT_CHUNK_ROWS = 256 * 1024
+# Arrow IPC / Feather v2: compression choices (uncompressed files can be memory-mapped zero-copy).
+ARROW_COMPRESSIONS = ("uncompressed", "lz4", "zstd")
+ARROW_CHUNK_ROWS = 64 * 1024
+ARROW_META_PREFIX = "can_decoder."
+# Concurrent exports: worker threads (writers spend most time in I/O and C code).
+EXPORT_MAX_WORKERS = max(2, min(6, os.cpu_count() or 2))
+# Rows written between cancellation checks / progress updates for row-oriented writers.
+EXPORT_CHUNK_ROWS = 50_000
+# Streaming decode -> export: log rows read, decoded and written per batch.
+DECODE_STREAM_CHUNK_ROWS = 50_000
+# Bus timing analysis: nominal bitrate (firmware default TWAI_TIMING_CONFIG_500KBITS),
+# gap threshold in multiples of an ID's period, and how many gaps are listed.
+CAN_BITRATE_BPS = 500_000
+TIMING_GAP_FACTOR = 3.0
+TIMING_MAX_GAPS_LISTED = 20
+# Signal statistics: quantile sketch size (larger = more accurate percentiles, more memory).
+QUANTILE_SKETCH_K = 200
+# Signal Values plot: decimation modes and fallback width when the canvas is not mapped yet.
+PLOT_DECIMATION_MODES = ("Min/Max", "LTTB", "Off")
+PLOT_DEFAULT_WIDTH_PX = 1200
+# Plot level-of-detail pyramid: samples per block at the finest level (levels double from there).
+PLOT_PYRAMID_BASE_BLOCK = 16
+# Stage profiling: env var that turns on deep profiling (cProfile + traced memory + JSON/pstats
+# dump). "1" writes the profile next to the log / export; any other value is a directory to write to.
+PROFILE_ENV_VAR = "CAN_DECODER_PROFILE"
+PROFILE_TOP_FUNCTIONS = 15
+# Memory readout: object columns of longer tables are sized from a block of this many rows.
+MEMORY_SAMPLE_ROWS = 500_000
+# Logger-side (non-DBC) columns grouped into their own MAT struct.
+LOGGER_COLUMNS = (
+    "LinearAccelX", "LinearAccelY", "LinearAccelZ", "Gravity",
+    "GPS_Lat", "GPS_Lon", "GPS_Alt", "GPS_Speed", "GPS_Course", "GPS_Sats", "GPS_HDOP",
+)
+
 
 def init_cipher_state(nonce):
     state = (nonce ^ 0xA5A5A5A5) & 0xFFFFFFFF
@@ -319,8 +453,2093 @@ def _load_dbc_with_fallback(dbc_path):
             continue
         filtered.append(line)
 
-    cleaned = "".join(filtered)
-    return cantools.database.load_string(cleaned, database_format="dbc")
+    cleaned = "".join(filtered)
+    return cantools.database.load_string(cleaned, database_format="dbc")
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate-quantile sketch (KLL-style compactor hierarchy).
+
+    Level h holds samples of weight 2**h. A level over its capacity is sorted
+    and every other item (random offset) is promoted to the next level, so
+    memory stays O(k log n) and rank error stays around 1% for k=200.
+    Sketches built on different chunks or processes (they pickle) combine
+    with merge().
+    """
+
+    def __init__(self, k=QUANTILE_SKETCH_K):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng()
+
+    def _capacity(self, h):
+        return max(8, int(self.k * (2 / 3) ** (len(self.levels) - 1 - h)))
+
+    def update(self, values):
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate((self.levels[h], items))
+        self.count += other.count
+        self._compress()
+
+    def _compress(self):
+        compacted = True
+        while compacted:
+            compacted = False
+            for h in range(len(self.levels)):
+                items = self.levels[h]
+                if len(items) <= self._capacity(h):
+                    continue
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                odd = len(items) % 2
+                promoted = items[odd:][self._rng.integers(2)::2]
+                self.levels[h] = items[:odd]
+                self.levels[h + 1] = np.concatenate((self.levels[h + 1], promoted))
+                compacted = True
+
+    def quantiles(self, qs):
+        items = np.concatenate(self.levels)
+        if items.size == 0:
+            return [float("nan")] * len(qs)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cum = np.cumsum(weights[order])
+        idx = np.searchsorted(cum, np.asarray(qs, dtype=float) * cum[-1], side="left")
+        return items[np.clip(idx, 0, len(items) - 1)].tolist()
+
+
+class SignalStats:
+    """
+    Single-pass count / min / max / mean / std of one signal plus a quantile sketch.
+
+    Each batch's mean and sum of squares are folded in with the pairwise
+    (Chan et al.) form of Welford's update, which is numerically stable and
+    is also how two SignalStats merge.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.sketch = QuantileSketch()
+
+    def _combine(self, n, mean, m2, vmin, vmax):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, vmin)
+        self.max = max(self.max, vmax)
+
+    def update(self, values):
+        if values.size == 0:
+            return
+        mean = float(values.mean())
+        self._combine(values.size, mean, float(((values - mean) ** 2).sum()),
+                      float(values.min()), float(values.max()))
+        self.sketch.update(values)
+
+    def merge(self, other):
+        if other.count == 0:
+            return
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class DecodeStatistics:
+    """
+    Per-signal SignalStats collected from decoded batches while decoding.
+
+    Fed the decoded samples before forward-fill, so each value counts once per
+    frame that carried it. Instances merge across chunks or processes.
+    """
+
+    QUANTILES = (0.01, 0.5, 0.95, 0.99)
+
+    def __init__(self):
+        self.signals = {}
+
+    def update(self, frame):
+        for col in frame.columns:
+            if col in EXPORT_KEY_COLUMNS or col in EXPORT_TEXT_COLUMNS:
+                continue
+            values = pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            values = values[np.isfinite(values)]
+            if values.size:
+                self.signals.setdefault(col, SignalStats()).update(values)
+
+    def merge(self, other):
+        for name, stats in other.signals.items():
+            self.signals.setdefault(name, SignalStats()).merge(stats)
+
+    def summary(self):
+        """One dict per signal (sorted by name) for display / export."""
+        rows = []
+        for name in sorted(self.signals):
+            stats = self.signals[name]
+            p01, p50, p95, p99 = stats.sketch.quantiles(self.QUANTILES)
+            rows.append({
+                'signal': name, 'count': stats.count, 'min': stats.min, 'max': stats.max,
+                'mean': stats.mean, 'std': stats.std, 'p01': p01, 'p50': p50, 'p95': p95, 'p99': p99,
+            })
+        return rows
+
+
+def _format_ns_local(ns):
+    """Epoch nanoseconds -> local 'YYYY-MM-DD HH:MM:SS.mmm' (same clock as the decoded Date/Time)."""
+    from datetime import datetime
+    return datetime.fromtimestamp(ns / 1e9).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def _frame_timing_columns(df, db_ids=None):
+    """
+    Vectorized per-frame (CAN ID, time ns, DLC, extended) arrays from raw log rows.
+
+    Time follows the decoder: UnixTime + (Microseconds % 1e6), falling back to
+    the Timestamp string; unparsable times are -1. IDs are parsed like the
+    decode loop (hex first, decimal when only that matches the DBC).
+    """
+    n = len(df)
+    codes, uniques = pd.factorize(df["ID"].astype(str).str.strip())
+    id_values = []
+    for raw in uniques:
+        if raw.lower() in ("", "nan", "none"):
+            id_values.append(-1)
+            continue
+        can_id = _safe_int_hex_or_dec(raw)
+        if db_ids and can_id not in db_ids:
+            try:
+                if int(str(raw).strip(), 10) in db_ids:
+                    can_id = int(str(raw).strip(), 10)
+            except ValueError:
+                pass
+        id_values.append(can_id)
+    ids = np.asarray(id_values + [-1], dtype=np.int64)[codes]  # code -1 (missing) -> id -1
+
+    times = np.full(n, -1, dtype=np.int64)
+    need_text = np.ones(n, dtype=bool)
+    if "UnixTime" in df.columns:
+        unix = pd.to_numeric(df["UnixTime"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        if "Microseconds" in df.columns:
+            micros = pd.to_numeric(df["Microseconds"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            micros = np.nan_to_num(micros) % 1_000_000
+        else:
+            micros = np.zeros(n)
+        ok = np.isfinite(unix) & (unix != 0)
+        times[ok] = unix[ok].astype(np.int64) * 1_000_000_000 + micros[ok].astype(np.int64) * 1_000
+        need_text = ~ok
+    if need_text.any() and "Timestamp" in df.columns:
+        parsed = pd.to_datetime(df["Timestamp"][need_text], errors="coerce")
+        times[need_text] = np.where(parsed.isna(), -1, parsed.to_numpy(dtype="datetime64[ns]").astype(np.int64))
+
+    dlc = pd.to_numeric(df["DLC"], errors="coerce").fillna(8).clip(0, 8).to_numpy(dtype=np.int8) \
+        if "DLC" in df.columns else np.full(n, 8, dtype=np.int8)
+    extended = (pd.to_numeric(df["Extended"], errors="coerce").fillna(0).to_numpy() != 0) \
+        if "Extended" in df.columns else ids > 0x7FF
+    return ids, times, dlc, extended
+
+
+def _group_quantiles(groups, values, starts, counts, qs):
+    """Per-group quantiles of `values` (already grouped contiguously by `groups`)."""
+    order = np.lexsort((values, groups))
+    ranked = values[order]
+    out = []
+    for q in qs:
+        idx = starts + np.floor(q * (counts - 1)).astype(np.int64)
+        out.append(ranked[idx])
+    return out
+
+
+def _frame_timing_analysis(ids, times, dlc=None, extended=None, gap_factor=TIMING_GAP_FACTOR,
+                           bitrate=CAN_BITRATE_BPS, max_gaps=TIMING_MAX_GAPS_LISTED):
+    """
+    Bus schedule check over all frames: per-ID period, jitter, gaps and bus load.
+
+    Period is the median inter-arrival time of each ID; jitter percentiles are
+    of |interval - period|. An interval longer than gap_factor x period is a
+    gap, and round(interval / period) - 1 frames are counted as dropped. Bus
+    gaps are stretches with no frame at all longer than gap_factor x the
+    fastest period (logger stalls such as SD write stalls). Bus load uses
+    nominal frame bits (no stuff bits) at `bitrate`. Fully vectorized (a few
+    sorts), so 10M-frame logs take seconds.
+    """
+    valid = times >= 0
+    ids = ids[valid]
+    times = times[valid]
+    dlc = np.full(len(ids), 8, dtype=np.int8) if dlc is None else dlc[valid]
+    extended = ids > 0x7FF if extended is None else extended[valid]
+    result = {'frames': int(len(ids)), 'duration_s': 0.0, 'bus_load_pct': 0.0, 'bitrate': bitrate,
+              'gap_factor': gap_factor, 'ids': [], 'gaps': [], 'bus_gaps': [], 'bus_gap_count': 0}
+    if len(ids) < 2:
+        return result
+
+    order = np.lexsort((times, ids))
+    ids_s = ids[order]
+    times_s = times[order]
+    duration_ns = int(times.max() - times.min())
+    result['duration_s'] = duration_ns / 1e9
+
+    # Nominal frame length: SOF..EOF + 3-bit intermission, 11- or 29-bit identifier.
+    bits = np.where(extended, 67, 47) + 8 * dlc.astype(np.int64)
+    if duration_ns > 0:
+        result['bus_load_pct'] = float(100.0 * bits.sum() / (duration_ns / 1e9) / bitrate)
+
+    uniq, starts, counts = np.unique(ids_s, return_index=True, return_counts=True)
+    id_bits = np.add.reduceat(bits[order], starts)
+    interval = np.diff(times_s)
+    same = ids_s[1:] == ids_s[:-1]
+    d = interval[same].astype(np.float64)
+    d_ids = ids_s[1:][same]
+    d_group = np.searchsorted(uniq, d_ids)
+    d_counts = np.bincount(d_group, minlength=len(uniq))
+    d_starts = np.concatenate(([0], np.cumsum(d_counts)[:-1]))
+    has_d = d_counts > 0
+
+    period = np.full(len(uniq), np.nan)
+    jitter = [np.full(len(uniq), np.nan) for _ in range(3)]
+    gaps = np.zeros(len(uniq), dtype=np.int64)
+    dropped = np.zeros(len(uniq), dtype=np.int64)
+    max_gap = np.full(len(uniq), np.nan)
+    gap_mask = np.zeros(len(d), dtype=bool)
+    if len(d):
+        (p50,) = _group_quantiles(d_group, d, d_starts[has_d], d_counts[has_d], (0.5,))
+        period[has_d] = p50
+        dev = np.abs(d - period[d_group])
+        for out, q in zip(jitter, _group_quantiles(d_group, dev, d_starts[has_d], d_counts[has_d],
+                                                   (0.5, 0.95, 0.99))):
+            out[has_d] = q
+        max_gap[has_d] = np.maximum.reduceat(d, d_starts[has_d])
+        per = period[d_group]
+        gap_mask = (per > 0) & (d > gap_factor * per)
+        gaps = np.bincount(d_group[gap_mask], minlength=len(uniq))
+        missed = np.rint(d[gap_mask] / per[gap_mask]).astype(np.int64) - 1
+        dropped = np.bincount(d_group[gap_mask], weights=missed, minlength=len(uniq)).astype(np.int64)
+
+    for i, can_id in enumerate(uniq):
+        span = (times_s[starts[i] + counts[i] - 1] - times_s[starts[i]]) / 1e9
+        result['ids'].append({
+            'can_id': f"0x{int(can_id):X}" if can_id >= 0 else "?",
+            'frames': int(counts[i]),
+            'rate_hz': float((counts[i] - 1) / span if span > 0 else 0.0),
+            'period_ms': float(period[i] / 1e6),
+            'jitter_p50_ms': float(jitter[0][i] / 1e6),
+            'jitter_p95_ms': float(jitter[1][i] / 1e6),
+            'jitter_p99_ms': float(jitter[2][i] / 1e6),
+            'max_interval_ms': float(max_gap[i] / 1e6),
+            'gaps': int(gaps[i]),
+            'dropped_est': int(dropped[i]),
+            'load_pct': float(100.0 * id_bits[i] / (duration_ns / 1e9) / bitrate) if duration_ns > 0 else 0.0,
+        })
+
+    # Largest per-ID gaps, with where they started.
+    if gap_mask.any():
+        gap_idx = np.flatnonzero(same)[gap_mask]
+        top = gap_idx[np.argsort(interval[gap_idx])[::-1][:max_gaps]]
+        for j in top:
+            result['gaps'].append({'can_id': f"0x{int(ids_s[j]):X}", 'start_ns': int(times_s[j]),
+                                   'length_ms': float(interval[j] / 1e6),
+                                   'period_ms': float(period[np.searchsorted(uniq, ids_s[j])] / 1e6)})
+
+    # Bus-wide silences (every ID stopped at once).
+    fastest = np.nanmin(period) if np.isfinite(period).any() else np.nan
+    if np.isfinite(fastest) and fastest > 0:
+        all_times = np.sort(times)
+        all_d = np.diff(all_times)
+        silent = np.flatnonzero(all_d > gap_factor * fastest)
+        result['bus_gap_count'] = int(len(silent))
+        for j in silent[np.argsort(all_d[silent])[::-1][:max_gaps]]:
+            result['bus_gaps'].append({'start_ns': int(all_times[j]), 'length_ms': float(all_d[j] / 1e6)})
+    return result
+
+
+def _minmax_indices(y, n_bins):
+    """
+    Indices of the min and max sample in each of `n_bins` equal-count bins, in
+    order. A line through them looks the same as the full series at `n_bins`
+    pixels wide: every spike and dropout survives. NaNs are never picked.
+    """
+    n = len(y)
+    if n <= 2 * n_bins:
+        return np.arange(n)
+    width = -(-n // n_bins)
+    n_bins = -(-n // width)
+    pad = n_bins * width - n
+    blocks = np.concatenate([y, np.full(pad, np.nan)]) if pad else y
+    blocks = blocks.reshape(n_bins, width)
+    nan = np.isnan(blocks)
+    lo = np.where(nan, np.inf, blocks).argmin(axis=1)
+    hi = np.where(nan, -np.inf, blocks).argmax(axis=1)
+    base = np.arange(n_bins) * width
+    idx = np.unique(np.concatenate([base + lo, base + hi]))
+    return idx[idx < n]
+
+
+def _lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: indices of `n_out` samples that keep the
+    visual shape of (x, y). `x` must be increasing; y must not contain NaN.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # n_out - 2 buckets between the fixed first and last points.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    keep = counts > 0
+    edges = np.append(edges[:-1][keep], n - 1)
+    counts = np.diff(edges)
+    x_avg = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    y_avg = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    x_avg = np.append(x_avg, x[-1])
+    y_avg = np.append(y_avg, y[-1])
+
+    idx = np.empty(len(counts) + 2, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(len(counts)):
+        lo, hi = edges[i], edges[i + 1]
+        xb, yb = x[lo:hi], y[lo:hi]
+        xa, ya = x[a], y[a]
+        area = np.abs((xa - x_avg[i + 1]) * (yb - ya) - (xa - xb) * (y_avg[i + 1] - ya))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+
+def _mpl_datenum_to_ns(value):
+    """Matplotlib date number (days since its epoch) -> epoch nanoseconds."""
+    import matplotlib.dates as mdates
+    epoch_ns = np.datetime64(mdates.get_epoch(), 'ns').astype(np.int64)
+    return int(epoch_ns + value * 86_400e9)
+
+
+class SignalPyramid:
+    """
+    Level-of-detail pyramid of one signal for interactive zoom and pan.
+
+    Level i holds min / max / mean (float32) of consecutive blocks of
+    PLOT_PYRAMID_BASE_BLOCK * 2**i samples, each level built from the one below,
+    so the whole pyramid costs O(n) to build and about 1.5 bytes per sample.
+    The time axis `x` is the plot cache's, shared by every signal of the table;
+    a signal with unplottable samples also keeps `rows`, the int32 positions of
+    its samples in `x` (4 bytes per sample). Raw samples are not kept: `values`
+    reads them back from the decoded table, which only happens for windows
+    small enough to draw at (near) raw resolution. `window()` answers a visible
+    x-range from the coarsest level that still gives about one block per
+    pixel, so its cost depends on the canvas width rather than on the log length.
+    """
+
+    def __init__(self, x, y, values, rows=None, base_block=PLOT_PYRAMID_BASE_BLOCK):
+        self.x = x  # shared axis: datetime64[ns] or row numbers, increasing
+        self.xi = x.view(np.int64) if x.dtype.kind == 'M' else x
+        self.rows = rows  # positions in x of the samples (None: every position)
+        self.values = values  # positions in x -> float64 samples
+        self.size = len(y)  # y: float64 samples, no NaN; only used to build the levels
+        self.base_block = base_block
+        self.levels = []  # [(block, min, max, mean)]
+        n = len(y)
+        if n <= base_block:
+            return
+        starts = np.arange(0, n, base_block)
+        counts = np.minimum(base_block, n - starts)
+        lo = np.minimum.reduceat(y, starts)
+        hi = np.maximum.reduceat(y, starts)
+        mean = np.add.reduceat(y, starts) / counts
+        block = base_block
+        while True:
+            self.levels.append((block, lo.astype(np.float32), hi.astype(np.float32), mean.astype(np.float32)))
+            if len(lo) <= 2:
+                break
+            # Next level: merge pairs of blocks.
+            pairs = np.arange(0, len(lo), 2)
+            merged_counts = np.add.reduceat(counts, pairs)
+            mean = np.add.reduceat(mean * counts, pairs) / merged_counts
+            lo = np.minimum.reduceat(lo, pairs)
+            hi = np.maximum.reduceat(hi, pairs)
+            counts = merged_counts
+            block *= 2
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """Bytes of every array this pyramid owns (levels and sample positions, not the shared axis)."""
+        total = sum(lo.nbytes + hi.nbytes + mean.nbytes for _, lo, hi, mean in self.levels)
+        return total + (self.rows.nbytes if self.rows is not None else 0)
+
+    def _positions(self, idx):
+        """Sample indices (slice or array) -> positions in the shared axis."""
+        return idx if self.rows is None else self.rows[idx]
+
+    def _samples(self, idx):
+        pos = self._positions(idx)
+        return self.x[pos], self.values(pos)
+
+    def window(self, lo=None, hi=None, width_px=PLOT_DEFAULT_WIDTH_PX, mode="Min/Max"):
+        """
+        Return (x, y, block) to draw for the x-range [lo, hi] (same units as
+        `xi`; None = open end) at about two points per pixel. `block` is the
+        number of samples summarised by each point (1 = raw samples).
+        """
+        n = self.size
+        p0 = 0 if lo is None else int(np.searchsorted(self.xi, lo, side='left'))
+        p1 = len(self.xi) if hi is None else int(np.searchsorted(self.xi, hi, side='right'))
+        if self.rows is not None:
+            p0, p1 = int(np.searchsorted(self.rows, p0)), int(np.searchsorted(self.rows, p1))
+        r0 = 0 if lo is None else max(0, p0 - 1)
+        r1 = n if hi is None else min(n, p1 + 1)
+        count = r1 - r0
+        if count <= 0:
+            return self.x[:0], np.empty(0), 1
+        if mode == "Off" or count <= 2 * width_px:
+            x, y = self._samples(slice(r0, r1))
+            return x, y, 1
+
+        if mode == "LTTB":
+            # LTTB over raw samples, or over block min/max pairs when the window is large
+            # (the extremes give the largest triangles, so spikes still survive).
+            level = self._level_for(count / (4 * width_px))
+            if level is None:
+                x, y = self._samples(slice(r0, r1))
+                idx = _lttb_indices(x.view(np.int64) if x.dtype.kind == 'M' else x, y, 2 * width_px)
+                return x[idx], y[idx], 1
+            bx, by, block = self._block_minmax(level, r0, r1)
+            idx = _lttb_indices(bx.view(np.int64) if bx.dtype.kind == 'M' else bx, by, 2 * width_px)
+            return bx[idx], by[idx], block
+
+        level = self._level_for(count / width_px)
+        if level is None:
+            x, y = self._samples(slice(r0, r1))
+            idx = _minmax_indices(y, width_px)
+            return x[idx], y[idx], 1
+        return self._block_minmax(level, r0, r1)
+
+    def _block_minmax(self, level, r0, r1):
+        """Min and max of each block covering rows [r0, r1), as a vertical stroke at the block start."""
+        block, lo_v, hi_v, _ = level
+        b0, b1 = r0 // block, min(len(lo_v), -(-r1 // block))
+        bx = np.repeat(self.x[self._positions(np.arange(b0, b1) * block)], 2)
+        by = np.column_stack([lo_v[b0:b1], hi_v[b0:b1]]).ravel()
+        return bx, by, block
+
+    def _level_for(self, max_block):
+        """Coarsest level with blocks of at most `max_block` samples (None: use raw samples)."""
+        chosen = None
+        for level in self.levels:
+            if level[0] > max_block:
+                break
+            chosen = level
+        return chosen
+
+
+def _finalize_decoded_rows(rows, columns, carry=None, stats=None, times=None):
+    """
+    Build the output table from decoded row dicts: sort by time, forward-fill
+    signals, drop rows that still have no signal data, fill the rest with 0.
+
+    `carry` is the last forward-filled signal row of the previous batch when
+    decoding in streaming mode; the returned carry continues the fill into the
+    next batch so batched output matches a single pass. `stats`
+    (DecodeStatistics) is fed the samples before forward-fill. `times` holds
+    each row's time in ns when the decoder already knows it (None otherwise).
+
+    Returns (table, carry, time_ns) where time_ns is the table's canonical
+    int64 time axis (see _decoded_time_ns), aligned with its rows.
+    """
+    output_df = pd.DataFrame(rows, columns=columns).fillna("")
+    time_ns = _decoded_time_ns(output_df, times)
+
+    # Synchronize signals: forward-fill last known values to avoid blank rows
+    fill_cols = [c for c in output_df.columns if c not in ("Date", "Time", "CAN_ID")]
+    if fill_cols:
+        # Sort by time (stable; rows without a time go last), then forward-fill
+        # (logs are normally already in time order; then the table is not reordered)
+        order = np.argsort(np.where(time_ns == NAT_NS, np.iinfo(np.int64).max, time_ns), kind="stable")
+        if (np.diff(order) != 1).any():
+            output_df = output_df.iloc[order]
+            time_ns = time_ns[order]
+        samples = output_df[fill_cols].replace("", pd.NA)
+        if stats is not None:
+            stats.update(samples)
+        filled = samples.ffill()
+        del samples
+        if carry is not None:
+            filled = filled.fillna(carry)
+        if len(filled):
+            carry = filled.iloc[-1]
+        # Drop rows that still have no signal data after fill
+        keep = ~filled.isna().all(axis=1).to_numpy()
+        if not keep.all():
+            output_df = output_df[keep]
+            filled = filled[keep]
+            time_ns = time_ns[keep]
+        # Replace any remaining missing values with 0 for signal columns
+        output_df[fill_cols] = filled.fillna(0)
+    return output_df, carry, time_ns
+
+
+def _table_memory_bytes(df, sample_rows=MEMORY_SAMPLE_ROWS):
+    """
+    Bytes held by a decoded table.
+
+    Object columns count each distinct Python object once: forward-filled cells
+    share one object, which memory_usage(deep=True) would count per cell. For
+    tables longer than `sample_rows` the objects are sized on a contiguous block
+    and scaled up.
+    """
+    total = int(df.index.memory_usage(deep=True))
+    rows = len(df)
+    if not rows:
+        return total
+    block = min(rows, sample_rows)
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if column.dtype != object:
+            total += int(column.memory_usage(index=False, deep=True))
+            continue
+        values = column.to_numpy()
+        total += values.nbytes
+        distinct = {id(v): v for v in values[:block]}
+        total += int(sum(map(sys.getsizeof, distinct.values())) * rows / block)
+    return total
+
+
+def _plot_cache_bytes(plot_cache, time_ns=None):
+    """
+    Bytes held by a plot cache: its pyramids, plus the shared axis and table-row
+    index when they are copies rather than a view of `time_ns`.
+    """
+    total = sum(p.nbytes for p in plot_cache['columns'].values())
+    axis, rows = plot_cache['x'], plot_cache['rows']
+    if time_ns is None or not np.may_share_memory(axis, time_ns):
+        total += axis.nbytes
+    return total + (rows.nbytes if rows is not None else 0)
+
+
+def _dataset_memory(df, time_ns=None, plot_cache=None, table_bytes=None):
+    """Footprint in bytes of a decoded dataset: {'table', 'time_axis', 'plot_pyramids', 'total'}."""
+    usage = {
+        'table': _table_memory_bytes(df) if table_bytes is None else table_bytes,
+        'time_axis': int(time_ns.nbytes) if time_ns is not None else 0,
+        'plot_pyramids': _plot_cache_bytes(plot_cache, time_ns)
+        if plot_cache and plot_cache.get('df') is df else 0,
+    }
+    usage['total'] = sum(usage.values())
+    return usage
+
+
+def _build_units_row(columns, signal_units, signal_names):
+    """Units row for CSV/TXT exports: logger units plus DBC units of the decoded signals."""
+    units_row = {c: "" for c in columns}
+    units_row["LinearAccelX"] = "m/s^2"
+    units_row["LinearAccelY"] = "m/s^2"
+    units_row["LinearAccelZ"] = "m/s^2"
+    units_row["Gravity"] = "m/s^2"
+    units_row["GPS_Lat"] = "deg"
+    units_row["GPS_Lon"] = "deg"
+    units_row["GPS_Alt"] = "m"
+    units_row["GPS_Speed"] = "km/h"
+    units_row["GPS_Course"] = "deg"
+    units_row["GPS_Sats"] = "count"
+    units_row["GPS_HDOP"] = "unitless"
+    units_row["GPS_Time"] = "UTC"
+    for name in signal_names:
+        if name in signal_units:
+            units_row[name] = signal_units.get(name, "")
+    return units_row
+
+
+def _parse_decoded_timestamps(df):
+    """Parse the decoded Date/Time text into a datetime64 series (NaT where unparsable)."""
+    if "Date" in df.columns and "Time" in df.columns:
+        return pd.to_datetime(df["Date"].astype(str) + " " + df["Time"].astype(str), errors="coerce")
+    if "timestamps" in df.columns:
+        return pd.to_datetime(df["timestamps"], errors="coerce")
+    if "Timestamp" in df.columns:
+        return pd.to_datetime(df["Timestamp"], errors="coerce")
+    return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+
+
+def _decoded_time_ns(df, times=None):
+    """
+    Canonical time axis of a decoded table: int64 nanoseconds of the Date/Time
+    wall clock per row, NAT_NS where unknown. Computed once while decoding and
+    then passed to sorting, plots and every exporter; only rows whose time is
+    not in `times` (or every row, without it) are parsed from text.
+
+    The wall clock is local time (UnixTime is shown with the decoding machine's
+    time zone, like the Date/Time text) counted from 1970-01-01 as if it were
+    UTC, so it is not Unix epoch time: subtract the UTC offset for that.
+    """
+    if times is None:
+        time_ns = np.full(len(df), NAT_NS, dtype=np.int64)
+    else:
+        time_ns = np.fromiter((NAT_NS if t is None else t for t in times), dtype=np.int64, count=len(df))
+    missing = time_ns == NAT_NS
+    if missing.any():
+        parsed = _parse_decoded_timestamps(df[missing] if not missing.all() else df)
+        time_ns[missing] = parsed.astype("datetime64[ns]").to_numpy().view(np.int64)
+    return time_ns
+
+
+def _time_ns_to_seconds(time_ns):
+    """Canonical time axis -> float wall-clock seconds since 1970-01-01 (NaN where unknown)."""
+    time_ns = np.asarray(time_ns, dtype=np.int64)
+    return np.where(time_ns == NAT_NS, np.nan, time_ns / 1e9)
+
+
+def _build_typed_export_df(df, time_ns=None, categories=None):
+    """
+    Build a typed copy of the decoded table for columnar exports.
+
+    The decoded table is object dtype (mixed strings/numbers). Columnar formats
+    compress and prune far better with real types, so signals become float64,
+    CAN_ID becomes categorical and a datetime64 'timestamp' column is added.
+    `categories` ({column: values}, see _export_categories) fixes the category
+    list so every chunk of a table gets the same dictionary.
+    """
+    typed = {}
+    categories = categories or {}
+    if time_ns is None:
+        time_ns = _decoded_time_ns(df)
+    typed["timestamp"] = pd.Series(np.asarray(time_ns, dtype=np.int64).view("datetime64[ns]"), index=df.index)
+    for col in df.columns:
+        if col in ("Date", "CAN_ID"):
+            # Few distinct values: stored dictionary-encoded.
+            if col in categories:
+                typed[col] = pd.Series(pd.Categorical(df[col].astype(str), categories=categories[col]),
+                                       index=df.index)
+            else:
+                typed[col] = df[col].astype(str).astype("category")
+        elif col in EXPORT_KEY_COLUMNS or col in EXPORT_TEXT_COLUMNS:
+            typed[col] = df[col].astype(str)
+        else:
+            typed[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+    # copy=False keeps the freshly built columns instead of consolidating them
+    # into a second full-size block.
+    return pd.DataFrame(typed, index=df.index, copy=False).reset_index(drop=True)
+
+
+def _export_categories(df):
+    """Sorted distinct Date / CAN_ID values of the whole table (for chunked typed exports)."""
+    return {
+        col: sorted({str(v) for v in pd.unique(df[col])})
+        for col in ("Date", "CAN_ID")
+        if col in df.columns
+    }
+
+
+class HDF5TableWriter:
+    """
+    Chunked writer for queryable, compressed HDF5 (PyTables 'table' format).
+
+    Rows are appended in chunks, so callers can feed decoded batches as they
+    are produced. `t` (local wall-clock seconds, see _decoded_time_ns) and
+    `CAN_ID` are indexed data columns:
+        pd.read_hdf(path, "decoded_data", where="t > X & t < Y & CAN_ID == '0x1A0'")
+    reads only the matching rows.
+    """
+
+    def __init__(self, filename, key=HDF5_KEY, complib=HDF5_COMPLIB, complevel=HDF5_COMPLEVEL,
+                 text_itemsize=None, units=None):
+        import tables  # noqa: F401
+        if complib.startswith("blosc") and not tables.which_lib_version("blosc"):
+            complib = "zlib"
+        self.filename = filename
+        self.key = key
+        self.text_itemsize = dict(text_itemsize or {})
+        self.units = units
+        self.rows_written = 0
+        self._store = pd.HDFStore(filename, mode="w", complib=complib, complevel=complevel,
+                                  CHUNK_CACHE_SIZE=HDF5_BUFFER_BYTES, IO_BUFFER_SIZE=HDF5_BUFFER_BYTES)
+
+    def _prepare(self, chunk, typed=False):
+        typed = chunk.copy(deep=False) if typed else _build_typed_export_df(chunk)
+        ts = typed.pop("timestamp")
+        t = ts.astype("int64").astype("float64") / 1e9
+        t[ts.isna()] = float("nan")
+        typed = typed.drop(columns=[c for c in ("Date", "Time") if c in typed.columns])
+        typed.insert(0, "t", t)
+        if "CAN_ID" in typed.columns:
+            typed["CAN_ID"] = typed["CAN_ID"].astype(str)
+        return typed
+
+    def append(self, chunk, typed=False):
+        """Append decoded rows (or rows already built by _build_typed_export_df when typed=True)."""
+        if chunk is None or len(chunk) == 0:
+            return
+        typed = self._prepare(chunk, typed=typed)
+        typed.index = pd.RangeIndex(self.rows_written, self.rows_written + len(typed))
+        min_itemsize = {}
+        for col in typed.columns:
+            if typed[col].dtype == object:
+                min_itemsize[col] = self.text_itemsize.get(col, 12 if col == "CAN_ID" else 32)
+        data_columns = [c for c in ("t", "CAN_ID") if c in typed.columns]
+        self._store.append(
+            self.key,
+            typed,
+            format="table",
+            data_columns=data_columns,
+            min_itemsize=min_itemsize or None,
+            index=False,
+        )
+        self.rows_written += len(typed)
+
+    def close(self):
+        try:
+            if self.key in self._store:
+                storer = self._store.get_storer(self.key)
+                if self.units:
+                    storer.attrs.units = dict(self.units)
+                # Build the query index once at the end (much faster than per append).
+                self._store.create_table_index(self.key, columns=storer.data_columns,
+                                               optlevel=6, kind="medium")
+        finally:
+            self._store.close()
+
+
+def _json_default(value):
+    """json.dumps fallback for numpy scalars and other non-JSON values."""
+    if hasattr(value, "item"):
+        try:
+            return value.item()
+        except Exception:
+            pass
+    return str(value)
+
+
+class NDJSONWriter:
+    """
+    Streaming newline-delimited JSON writer (one object per decoded row).
+
+    Rows are serialized chunk by chunk, so memory stays bounded by the chunk
+    size. A `.gz` filename (or compress=True) writes gzip. Optionally omits
+    empty fields and values repeated from the previous row (forward-filled),
+    keeping Date/Time/CAN_ID on every line.
+    """
+
+    ALWAYS_KEEP = ("Date", "Time", "CAN_ID")
+
+    def __init__(self, filename, drop_nulls=False, drop_repeats=False, compress=None):
+        if compress is None:
+            compress = str(filename).lower().endswith(".gz")
+        self.filename = filename
+        self.drop_nulls = drop_nulls
+        self.drop_repeats = drop_repeats
+        self.rows_written = 0
+        self._columns = None
+        self._last_row = None
+        if compress:
+            self._fh = gzip.open(filename, "wt", encoding="utf-8", compresslevel=6, newline="\n")
+        else:
+            self._fh = open(filename, "w", encoding="utf-8", newline="\n")
+
+    def append(self, chunk):
+        if chunk is None or len(chunk) == 0:
+            return
+        if not self.drop_nulls and not self.drop_repeats:
+            # Fast path: pandas' C serializer, no per-row Python work.
+            text = chunk.to_json(orient="records", lines=True, date_format="iso")
+            self._fh.write(text)
+            if not text.endswith("\n"):
+                self._fh.write("\n")
+            self.rows_written += len(chunk)
+            return
+
+        columns = list(chunk.columns)
+        if columns != self._columns:
+            self._columns = columns
+            self._last_row = None
+        values = chunk.to_numpy(dtype=object, copy=True)
+        nulls = pd.isna(values)
+        values[nulls] = None  # NaN is not valid JSON
+        keep = np.ones(values.shape, dtype=bool)
+        if self.drop_nulls:
+            keep &= ~(nulls | (values == ""))
+        if self.drop_repeats:
+            prev = np.empty_like(values)
+            if len(values) > 1:
+                prev[1:] = values[:-1]
+            prev[0] = self._last_row if self._last_row is not None else None
+            same = values == prev
+            if self._last_row is None:
+                same[0, :] = False
+            keep &= ~same
+        for i, name in enumerate(columns):
+            if name in self.ALWAYS_KEEP:
+                keep[:, i] = True
+
+        dumps = json.dumps
+        lines = []
+        for row, row_keep in zip(values, keep):
+            lines.append(dumps({c: v for c, v, k in zip(columns, row, row_keep) if k},
+                               default=_json_default, separators=(",", ":")))
+        lines.append("")
+        self._fh.write("\n".join(lines))
+        self._last_row = values[-1].copy()
+        self.rows_written += len(values)
+
+    def close(self):
+        self._fh.close()
+
+
+def _matlab_name(name, prefix="x"):
+    """Make a valid MATLAB identifier: [A-Za-z][A-Za-z0-9_]*, at most 63 chars."""
+    ident = re.sub(r"[^0-9A-Za-z_]", "_", str(name)).strip("_") or prefix
+    if not ident[0].isalpha():
+        ident = f"{prefix}_{ident}"
+    return ident[:63]
+
+
+def _mat_struct_plan(df, can_id_signals=None):
+    """
+    Plan the MAT layout: one struct per CAN ID plus a 'Logger' struct.
+
+    Returns a list of (struct_name, can_id, row_index_array, [(field, column)]).
+    CAN ID structs hold the DBC signals of that message when known, otherwise
+    every numeric signal column; 'Logger' holds IMU/GPS columns on all rows.
+    """
+    signal_cols = [c for c in df.columns
+                   if c not in EXPORT_KEY_COLUMNS and c not in EXPORT_TEXT_COLUMNS and c not in LOGGER_COLUMNS]
+    norm_cols = {re.sub(r"[^a-z0-9]", "", c.lower()): c for c in signal_cols}
+    plan = []
+    used = set()
+
+    def _unique(name):
+        candidate, i = name, 2
+        while candidate in used:
+            suffix = f"_{i}"
+            candidate = name[:63 - len(suffix)] + suffix
+            i += 1
+        used.add(candidate)
+        return candidate
+
+    if "CAN_ID" in df.columns:
+        codes, uniques = pd.factorize(df["CAN_ID"].astype(str), sort=True)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        for k, can_id in enumerate(uniques):
+            rows = order[bounds[k]:bounds[k + 1]]
+            names = (can_id_signals or {}).get(can_id)
+            if names:
+                cols = []
+                for sig in names:
+                    col = sig if sig in signal_cols else norm_cols.get(re.sub(r"[^a-z0-9]", "", sig.lower()))
+                    if col and col not in cols:
+                        cols.append(col)
+            else:
+                cols = list(signal_cols)
+            fields = [(_matlab_name(c, "sig"), c) for c in cols]
+            plan.append((_unique(_matlab_name(f"ID_{can_id}", "ID")), can_id, rows, fields))
+    else:
+        plan.append((_unique("ALL"), "", np.arange(len(df)), [(_matlab_name(c, "sig"), c) for c in signal_cols]))
+
+    # Skip logger columns that were never populated (no IMU/GPS fitted); checked
+    # chunk by chunk, stopping at the first non-zero value.
+    def _populated(col):
+        chunks = (df[col].iloc[start:start + EXPORT_CHUNK_ROWS] for start in range(0, len(df), EXPORT_CHUNK_ROWS))
+        return any(pd.to_numeric(chunk, errors="coerce").fillna(0).ne(0).any() for chunk in chunks)
+
+    logger_cols = [c for c in LOGGER_COLUMNS if c in df.columns and _populated(c)]
+    if logger_cols:
+        plan.append((_unique("Logger"), "", np.arange(len(df)), [(_matlab_name(c, "sig"), c) for c in logger_cols]))
+    return plan
+
+
+def _mat_column(df, col, rows):
+    return pd.to_numeric(df[col].iloc[rows], errors="coerce").to_numpy(dtype="float64")
+
+
+def _mat5_element(mdtype, data):
+    """One MAT v5 data element: small (<= 4 bytes, packed in the tag) or tag + data padded to 8."""
+    if len(data) <= 4:
+        return struct.pack("=I", len(data) << 16 | mdtype) + data.ljust(4, b"\0")
+    return struct.pack("=II", mdtype, len(data)) + data + b"\0" * (-len(data) % 8)
+
+
+def _mat5_matrix_header(mclass, shape, body_bytes, name=b""):
+    """miMATRIX tag, flags, dimensions and name of an array whose content is `body_bytes` long."""
+    head = (struct.pack("=IIII", 6, 8, mclass, 0)  # miUINT32 array flags, nzmax
+            + _mat5_element(5, struct.pack(f"={len(shape)}i", *shape))  # miINT32 dimensions
+            + _mat5_element(1, name))  # miINT8 name (empty below the top level)
+    return struct.pack("=II", 14, len(head) + body_bytes) + head
+
+
+def _mat5_char(text):
+    """A char row vector as scipy.io.savemat writes a str (UTF-8, shape 1 x len)."""
+    data = text.encode("utf-8")
+    body = _mat5_element(16, data)  # miUTF8
+    return _mat5_matrix_header(4, (1, len(text)) if text else (0, 0), len(body)) + body
+
+
+def _mat5_struct_header(fields, body_bytes, name=b""):
+    """Header and field names of a 1 x 1 struct whose field values take `body_bytes`."""
+    if not fields:
+        # scipy's empty struct: field name length 1, no names.
+        names = _mat5_element(5, struct.pack("=i", 1)) + _mat5_element(1, b"")
+    else:
+        length = max(len(f) for f in fields) + 1
+        names = (_mat5_element(5, struct.pack("=i", length))
+                 + _mat5_element(1, b"".join(f.encode("ascii").ljust(length, b"\0") for f in fields)))
+    return _mat5_matrix_header(2, (1, 1), len(names) + body_bytes, name) + names
+
+
+def _write_mat_v5(filename, df, plan, time_s, units, chunk_rows=MAT_CHUNK_ROWS, progress=None):
+    """
+    Write a MATLAB v5 file, streaming each struct's columns in row chunks.
+
+    The elements match what scipy.io.savemat writes for the same dict of
+    n x 1 double arrays, but byte counts are computed up front so every
+    column is converted and deflated chunk by chunk into a miCOMPRESSED
+    element; no struct is ever held in memory whole.
+    """
+    import scipy.io  # type: ignore
+    import zlib
+
+    with open(filename, "wb") as fh:
+        scipy.io.savemat(fh, {})  # file header only
+        for struct_name, can_id, rows, fields in plan:
+            if progress and can_id:
+                progress(len(rows))
+            n = len(rows)
+            columns = {"t": None}
+            unit_entry = {}
+            for field, col in fields:
+                if field in ("t", "can_id", "units"):
+                    field = f"{field}_sig"
+                columns[field] = col
+                unit_entry[field] = str((units or {}).get(col, "") or "")
+            data = _mat5_element(9, b"") if n == 0 else struct.pack("=II", 9, n * 8)  # miDOUBLE
+            column_header = _mat5_matrix_header(6, (n, 1), len(data) + n * 8) + data
+            unit_fields = [_mat5_char(u) for u in unit_entry.values()]
+            tail = (_mat5_char(can_id)
+                    + _mat5_struct_header(list(unit_entry), sum(map(len, unit_fields))) + b"".join(unit_fields))
+            body_bytes = len(columns) * (len(column_header) + n * 8) + len(tail)
+            names = list(columns) + ["can_id", "units"]
+
+            tag_pos = fh.tell()
+            fh.write(struct.pack("=II", 15, 0))  # miCOMPRESSED, byte count patched below
+            deflate = zlib.compressobj()
+            size = 0
+
+            def _put(raw):
+                nonlocal size
+                out = deflate.compress(raw)
+                fh.write(out)
+                size += len(out)
+
+            _put(_mat5_struct_header(names, body_bytes, struct_name.encode("latin1")))
+            for col in columns.values():
+                _put(column_header)
+                for start in range(0, n, chunk_rows):
+                    part = rows[start:start + chunk_rows]
+                    values = time_s[part] if col is None else _mat_column(df, col, part)
+                    _put(np.ascontiguousarray(values, dtype="float64").tobytes())
+            _put(tail)
+            out = deflate.flush()
+            fh.write(out)
+            size += len(out)
+            end = fh.tell()
+            fh.seek(tag_pos + 4)
+            fh.write(struct.pack("=I", size))
+            fh.seek(end)
+
+
+def _write_mat_v73(filename, df, plan, time_s, units, chunk_rows=MAT_CHUNK_ROWS, progress=None):
+    """
+    Write a MATLAB v7.3 file (HDF5 with a 512-byte MAT header userblock).
+
+    Arrays are written in row chunks, so each signal column is converted
+    chunk by chunk instead of being materialised in full.
+    """
+    import h5py  # type: ignore
+    from datetime import datetime
+
+    def _mark(obj, cls):
+        obj.attrs["MATLAB_class"] = np.bytes_(cls)
+
+    def _fields_attr(group, names):
+        vlen = h5py.vlen_dtype(np.dtype("S1"))
+        data = np.empty(len(names), dtype=object)
+        for i, n in enumerate(names):
+            data[i] = np.frombuffer(n.encode("ascii"), dtype="S1")
+        group.attrs.create("MATLAB_fields", data, dtype=vlen)
+
+    def _write_char(group, name, text):
+        codes = np.frombuffer(str(text).encode("utf-16-le"), dtype="<u2") if text else np.zeros(0, "<u2")
+        if codes.size == 0:
+            dset = group.create_dataset(name, data=np.array([0, 0], dtype="<u8"))
+            _mark(dset, "char")
+            dset.attrs["MATLAB_empty"] = np.uint8(1)
+        else:
+            dset = group.create_dataset(name, data=codes.reshape(-1, 1))
+            _mark(dset, "char")
+        dset.attrs["MATLAB_int_decode"] = np.int32(2)
+
+    def _write_column(group, name, n, fill):
+        # MATLAB is column-major: an n x 1 vector is stored with HDF5 shape (1, n).
+        dset = group.create_dataset(
+            name, shape=(1, n), dtype="<f8",
+            chunks=(1, max(1, min(n, chunk_rows))) if n else None,
+            compression="gzip" if n else None, compression_opts=4 if n else None,
+        )
+        _mark(dset, "double")
+        for start in range(0, n, chunk_rows):
+            dset[0, start:start + chunk_rows] = fill(start, min(start + chunk_rows, n))
+
+    with h5py.File(filename, "w", userblock_size=512) as h5:
+        for struct_name, can_id, rows, fields in plan:
+            if progress and can_id:
+                progress(len(rows))
+            grp = h5.create_group(struct_name)
+            _mark(grp, "struct")
+            n = len(rows)
+            names = ["t"]
+            _write_column(grp, "t", n, lambda a, b, r=rows: time_s[r[a:b]])
+            unit_pairs = []
+            for field, col in fields:
+                if field in ("t", "can_id", "units"):
+                    field = f"{field}_sig"
+                _write_column(grp, field, n, lambda a, b, c=col, r=rows: _mat_column(df, c, r[a:b]))
+                names.append(field)
+                unit_pairs.append((field, str((units or {}).get(col, "") or "")))
+            _write_char(grp, "can_id", can_id)
+            names.append("can_id")
+            ugrp = grp.create_group("units")
+            _mark(ugrp, "struct")
+            for field, unit in unit_pairs:
+                _write_char(ugrp, field, unit)
+            _fields_attr(ugrp, [f for f, _ in unit_pairs])
+            names.append("units")
+            _fields_attr(grp, names)
+
+    created = datetime.now().strftime("%a %b %d %H:%M:%S %Y")
+    text = f"MATLAB 7.3 MAT-file, Platform: PCWIN64, Created on: {created} HDF5 schema 1.00 ."
+    header = text.encode("ascii").ljust(116, b" ") + b" " * 8 + b"\x00\x02" + b"IM"
+    with open(filename, "r+b") as fh:
+        fh.write(header.ljust(512, b"\x00"))
+
+
+def _write_mat(filename, df, units=None, can_id_signals=None, force_v73=False, time_ns=None,
+               progress=None):
+    """
+    Export the decoded table as MATLAB structs (one per CAN ID) of double arrays
+    with a shared time vector `t` (local wall-clock seconds, see
+    _decoded_time_ns). Uses v5 via scipy when it fits, switching to v7.3
+    (HDF5) for datasets beyond v5's 2 GB limit.
+    Returns the MAT version written ("5" or "7.3").
+    """
+    time_s = _time_ns_to_seconds(_decoded_time_ns(df) if time_ns is None else time_ns)
+    plan = _mat_struct_plan(df, can_id_signals)
+    est_bytes = sum(len(rows) * (len(fields) + 1) * 8 for _, _, rows, fields in plan)
+    if force_v73 or est_bytes >= MAT_V5_LIMIT_BYTES:
+        _write_mat_v73(filename, df, plan, time_s, units, progress=progress)
+        return "7.3"
+    _write_mat_v5(filename, df, plan, time_s, units, progress=progress)
+    return "5"
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _arrow_export_schema(schema, units=None, provenance=None):
+    """
+    Attach units and provenance to the typed Arrow schema.
+
+    Units are attached per field (field metadata 'unit') and, with the decode
+    provenance (log, DBC, hashes), as JSON schema metadata.
+    """
+    import pyarrow as pa  # type: ignore
+
+    units = {k: str(v) for k, v in (units or {}).items() if v}
+    fields = []
+    for field in schema:
+        unit = units.get(field.name)
+        fields.append(field.with_metadata({"unit": unit}) if unit else field)
+    metadata = dict(schema.metadata or {})
+    metadata[(ARROW_META_PREFIX + "units").encode()] = json.dumps(units).encode("utf-8")
+    metadata[(ARROW_META_PREFIX + "provenance").encode()] = json.dumps(provenance or {}, default=str).encode("utf-8")
+    return pa.schema(fields, metadata=metadata)
+
+
+def _write_arrow_ipc(df, filename, compression="uncompressed", units=None, provenance=None,
+                     chunk_rows=ARROW_CHUNK_ROWS, time_ns=None, progress=None):
+    """
+    Write the decoded table as Arrow IPC file format (Feather v2).
+
+    The table is typed and converted one chunk at a time, so only a chunk's
+    worth of typed/Arrow data exists besides the decoded table. Date/CAN_ID
+    categories are fixed up front: the IPC file format needs one dictionary
+    for all batches.
+    """
+    import pyarrow as pa  # type: ignore
+
+    if compression not in ARROW_COMPRESSIONS:
+        raise ValueError(f"Unsupported Arrow compression: {compression}")
+    if time_ns is None:
+        time_ns = _decoded_time_ns(df)
+    time_ns = np.asarray(time_ns, dtype=np.int64)
+    categories = _export_categories(df)
+    options = pa.ipc.IpcWriteOptions(compression=None if compression == "uncompressed" else compression)
+    schema = None
+    writer = None
+    with pa.OSFile(str(filename), "wb") as sink:
+        try:
+            for start in range(0, max(len(df), 1), chunk_rows):
+                chunk = df.iloc[start:start + chunk_rows]
+                typed = _build_typed_export_df(chunk, time_ns=time_ns[start:start + chunk_rows],
+                                               categories=categories)
+                table = pa.Table.from_pandas(typed, preserve_index=False)
+                del typed
+                if schema is None:
+                    schema = _arrow_export_schema(table.schema, units=units, provenance=provenance)
+                    writer = pa.ipc.new_file(sink, schema, options=options)
+                writer.write_table(table.cast(schema), max_chunksize=chunk_rows)
+                if progress and table.num_rows:
+                    progress(table.num_rows)
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+def _read_arrow_ipc(filename):
+    """
+    Open an Arrow IPC / Feather v2 export via memory-mapping.
+
+    Uncompressed numeric columns come back zero-copy (read-only, backed by the
+    page cache), so even multi-GB decodes reopen almost instantly.
+    Returns (decoded_df, units, provenance, time_ns); the stored 'timestamp'
+    column becomes the canonical time axis instead of re-parsing Date/Time.
+    """
+    import pyarrow as pa  # type: ignore
+
+    # The mapping must outlive the arrays that reference it, so no `with` here.
+    source = pa.memory_map(str(filename), "r")
+    table = pa.ipc.open_file(source).read_all()
+    metadata = table.schema.metadata or {}
+
+    def _meta(key):
+        raw = metadata.get((ARROW_META_PREFIX + key).encode())
+        try:
+            return json.loads(raw.decode("utf-8")) if raw else {}
+        except Exception:
+            return {}
+
+    df = table.to_pandas(split_blocks=True, self_destruct=False)
+    time_ns = None
+    if "timestamp" in df.columns and "Date" in df.columns and "Time" in df.columns:
+        time_ns = df["timestamp"].astype("datetime64[ns]").to_numpy().view(np.int64)
+        df = df.drop(columns=["timestamp"])
+    if time_ns is None:
+        time_ns = _decoded_time_ns(df)
+    return df, _meta("units"), _meta("provenance"), time_ns
+
+
+def _write_parquet_dataset(df, root_dir, row_group_size=PARQUET_ROW_GROUP_ROWS, time_ns=None,
+                           chunk_rows=EXPORT_CHUNK_ROWS, progress=None):
+    """
+    Write the typed decoded table as a hive-partitioned Parquet dataset:
+      <root_dir>/date=YYYY-MM-DD/CAN_ID=0x.../part-0.parquet
+
+    Each file keeps min/max statistics per row group so engines (pyarrow,
+    DuckDB, Spark) can prune partitions by date/ID and row groups by time/value.
+    Partitions are written one after another in time order, one typed chunk
+    (= one row group of at most `chunk_rows`) at a time; only the sort keys
+    are built for the whole table, so nothing else is buffered.
+
+    The dataset is written to a hidden staging folder inside root_dir and
+    swapped in when complete: a re-export replaces every previous date=*
+    partition (also IDs/dates no longer present), and a failed or cancelled
+    one leaves them untouched. Other files in root_dir are kept.
+    """
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+    from urllib.parse import quote
+
+    if time_ns is None:
+        time_ns = _decoded_time_ns(df)
+    time_ns = np.asarray(time_ns, dtype=np.int64)
+
+    def _partition_key(values, fmt=str):
+        # (codes, labels): labels[codes] is the partition value of each row, labels
+        # sorted; only the distinct values become strings, not one per row.
+        codes, uniques = pd.factorize(values, sort=True)
+        labels = [fmt(v) or "unknown" for v in uniques] + ["unknown"]  # code -1: missing
+        order, labels = pd.factorize(np.array(labels, dtype=object), sort=True)
+        return order[codes].astype(np.int32), np.asarray(labels, dtype=object)
+
+    if "Date" in df.columns and not (df["Date"].astype(str) == "").all():
+        date_codes, date_labels = _partition_key(df["Date"].astype(str))
+    else:
+        days = np.where(time_ns == NAT_NS, NAT_NS, time_ns // (86_400 * 10 ** 9))
+        date_codes, date_labels = _partition_key(
+            pd.Series(days).where(days != NAT_NS),
+            fmt=lambda day: np.datetime64(int(day), "D").astype(str))
+    if "CAN_ID" in df.columns:
+        can_codes, can_labels = _partition_key(df["CAN_ID"].astype(str))
+    else:
+        can_codes, can_labels = np.zeros(len(df), dtype=np.int32), np.array(["unknown"], dtype=object)
+    # Time-ordered rows inside each partition keep row-group min/max tight
+    # (stable, unknown times last, like sort_values on the typed table).
+    order = np.lexsort((
+        np.where(time_ns == NAT_NS, np.iinfo(np.int64).max, time_ns),
+        can_codes,
+        date_codes,
+    ))
+
+    def _typed_chunk(rows, keys=False):
+        typed = _build_typed_export_df(df.iloc[rows], time_ns=time_ns[rows])
+        typed = typed.drop(columns=["Date"], errors="ignore")
+        if not keys:
+            return typed.drop(columns=["CAN_ID"], errors="ignore")
+        typed["date"] = date_labels[date_codes[rows]]
+        typed["CAN_ID"] = can_labels[can_codes[rows]]
+        return typed
+
+    # Files hold every column but the partition keys (the hive layout pyarrow.dataset
+    # writes); their pandas metadata still lists date / CAN_ID.
+    schema = pa.Schema.from_pandas(_typed_chunk(order[:chunk_rows], keys=True), preserve_index=False)
+    file_schema = schema.remove(schema.get_field_index("date"))
+    file_schema = file_schema.remove(file_schema.get_field_index("CAN_ID"))
+    # A partition starts wherever the sorted date or ID code changes.
+    date_sorted, can_sorted = date_codes[order], can_codes[order]
+    starts = np.flatnonzero((date_sorted[1:] != date_sorted[:-1]) | (can_sorted[1:] != can_sorted[:-1])) + 1
+    bounds = np.concatenate(([0], starts, [len(order)])) if len(order) else []
+    partitions = [(lo, hi, date_labels[date_sorted[lo]], can_labels[can_sorted[lo]])
+                  for lo, hi in zip(bounds[:-1], bounds[1:])]
+    del date_sorted, can_sorted, starts
+    date_codes = can_codes = None  # only the partition labels are needed from here on
+
+    root_dir = os.fspath(root_dir)
+    os.makedirs(root_dir, exist_ok=True)
+    # Dot-prefixed, so dataset readers skip it if it is ever left behind.
+    staging = tempfile.mkdtemp(prefix=".partial-", dir=root_dir)
+    try:
+        for lo, hi, date_label, can_label in partitions:
+            folder = os.path.join(staging, f"date={quote(date_label, safe='')}",
+                                  f"CAN_ID={quote(can_label, safe='')}")
+            os.makedirs(folder, exist_ok=True)
+            with pq.ParquetWriter(os.path.join(folder, "part-0.parquet"), file_schema, compression="zstd",
+                                  use_dictionary=True, write_statistics=True) as writer:
+                for start in range(lo, hi, chunk_rows):
+                    rows = order[start:min(start + chunk_rows, hi)]
+                    table = pa.Table.from_pandas(_typed_chunk(rows), schema=file_schema, preserve_index=False)
+                    writer.write_table(table, row_group_size=row_group_size)
+                    del table
+                    if progress:
+                        progress(len(rows))
+        for name in os.listdir(root_dir):
+            if name.startswith("date=") and os.path.isdir(os.path.join(root_dir, name)):
+                shutil.rmtree(os.path.join(root_dir, name))
+        for name in os.listdir(staging):
+            os.replace(os.path.join(staging, name), os.path.join(root_dir, name))
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _remove_output(path):
+    """Best-effort removal of a partially written export file or folder."""
+    try:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
+
+
+class ExportSink:
+    """
+    Streaming export writer shared by the export tab and the streaming decoder.
+
+    Usage: open(columns) once, write_batch(batch) for every decoded batch (a
+    DataFrame with those columns), then close(). abort() closes and deletes the
+    partial output. Nothing beyond the current batch (plus small per-format
+    state) is held, so decode -> export runs in bounded memory.
+    """
+
+    # Rows per batch when a materialized table is fed through the sink.
+    batch_rows = EXPORT_CHUNK_ROWS
+
+    def __init__(self, filename, units=None, signal_units=None, options=None):
+        self.filename = filename
+        self.units = units if isinstance(units, dict) else None
+        self.signal_units = signal_units or {}
+        self.options = options or {}
+        self.columns = None
+        self.rows_written = 0
+        self._opened = False
+
+    def open(self, columns):
+        self.columns = list(columns)
+        self._open()
+        self._opened = True
+
+    def write_batch(self, batch, time_ns=None):
+        """Write one batch; `time_ns` is its slice of the canonical time axis, if known."""
+        if batch is None or len(batch) == 0:
+            return
+        if list(batch.columns) != self.columns:
+            batch = batch.reindex(columns=self.columns)
+        self._write(batch, time_ns)
+        self.rows_written += len(batch)
+
+    def close(self):
+        if self._opened:
+            self._opened = False
+            self._close()
+
+    def abort(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+        _remove_output(self.filename)
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _write(self, batch, time_ns):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class CSVSink(ExportSink):
+    """CSV: header row, units row (like `23-01.csv`), then data rows."""
+
+    sep = ","
+    lineterminator = "\r\n"
+
+    def _open(self):
+        self._fh = open(self.filename, "w", newline="", encoding="utf-8")
+        writer = csv.writer(self._fh, delimiter=self.sep, lineterminator=self.lineterminator)
+        writer.writerow(self.columns)
+        if self.units is not None:
+            writer.writerow([self.units.get(c, "") for c in self.columns])
+
+    def _write(self, batch, time_ns):
+        batch.to_csv(self._fh, sep=self.sep, header=False, index=False, lineterminator=self.lineterminator)
+
+    def _close(self):
+        self._fh.close()
+
+
+class TXTSink(CSVSink):
+    """Tab-separated text with the same header + units rows."""
+
+    sep = "\t"
+    lineterminator = os.linesep
+
+
+class ParquetSink(ExportSink):
+    """
+    Single typed Parquet file (see _build_typed_export_df), zstd, min/max statistics.
+
+    Batches are buffered up to PARQUET_ROW_GROUP_ROWS so row groups keep the
+    same size whatever the batch size is.
+    """
+
+    def __init__(self, filename, row_group_size=PARQUET_ROW_GROUP_ROWS, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.row_group_size = row_group_size
+
+    def _open(self):
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+        self._pa = pa
+        self._pq = pq
+        self._writer = None
+        self._schema = None
+        self._pending = []
+        self._pending_rows = 0
+
+    def _table_schema(self, typed):
+        """
+        Schema shared by every batch. pandas picks the categorical index width
+        per batch (int8 up to 127 categories), so CAN_ID / Date get a fixed
+        dictionary(int32, string) instead of the first batch's type.
+        """
+        pa = self._pa
+        schema = pa.Schema.from_pandas(typed, preserve_index=False)
+        for i, field in enumerate(schema):
+            if pa.types.is_dictionary(field.type):
+                schema = schema.set(i, field.with_type(pa.dictionary(pa.int32(), pa.string())))
+        return schema
+
+    def _write(self, batch, time_ns):
+        typed = _build_typed_export_df(batch, time_ns=time_ns)
+        if self._schema is None:
+            self._schema = self._table_schema(typed)
+        table = self._pa.Table.from_pandas(typed, schema=self._schema, preserve_index=False)
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        if self._pending_rows >= self.row_group_size:
+            self._flush(final=False)
+
+    def _flush(self, final):
+        if not self._pending:
+            return
+        table = self._pa.concat_tables(self._pending)
+        full = table.num_rows if final else (table.num_rows // self.row_group_size) * self.row_group_size
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(
+                self.filename,
+                self._schema,
+                compression="zstd",
+                use_dictionary=["CAN_ID", "Date"],
+                write_statistics=True,
+            )
+        if full:
+            self._writer.write_table(table.slice(0, full), row_group_size=self.row_group_size)
+        rest = table.slice(full)
+        self._pending = [rest] if rest.num_rows else []
+        self._pending_rows = rest.num_rows
+
+    def _close(self):
+        if self._schema is None:
+            self._schema = self._table_schema(_build_typed_export_df(pd.DataFrame(columns=self.columns)))
+        self._flush(final=True)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.filename, self._schema, compression="zstd")
+        self._writer.close()
+
+
+class SQLiteSink(ExportSink):
+    """
+    SQLite table `decoded_data`, replaced by the first batch and appended afterwards.
+
+    SQLite column names are case-insensitive, so a DBC signal that differs from
+    a fixed column only by case (CONTROLLER_TEMP vs Controller_temp) gets a
+    numeric suffix.
+    """
+
+    table = "decoded_data"
+
+    def _open(self):
+        import sqlite3
+        self._conn = sqlite3.connect(self.filename)
+        self._created = False
+        self._sql_columns = []
+        seen = set()
+        for col in self.columns:
+            name = str(col)
+            n = 2
+            while name.lower() in seen:
+                name = f"{col}_{n}"
+                n += 1
+            seen.add(name.lower())
+            self._sql_columns.append(name)
+
+    def _write(self, batch, time_ns):
+        batch = batch.set_axis(self._sql_columns, axis=1)
+        batch.to_sql(self.table, self._conn, if_exists="append" if self._created else "replace", index=False)
+        self._created = True
+
+    def _close(self):
+        try:
+            if not self._created:
+                pd.DataFrame(columns=self._sql_columns).to_sql(self.table, self._conn, if_exists="replace",
+                                                               index=False)
+        finally:
+            self._conn.close()
+
+
+class HDF5Sink(ExportSink):
+    """
+    Queryable PyTables table via HDF5TableWriter.
+
+    Text column widths are fixed by the first batch (at least the writer's
+    defaults), as PyTables cannot widen a column after creation.
+    """
+
+    batch_rows = HDF5_APPEND_ROWS
+
+    def _open(self):
+        self._writer = None
+
+    def _write(self, batch, time_ns):
+        if self._writer is None:
+            text_itemsize = {}
+            for col in batch.columns:
+                if col in ("Date", "Time"):
+                    continue
+                if col in EXPORT_KEY_COLUMNS or col in EXPORT_TEXT_COLUMNS:
+                    longest = batch[col].astype(str).str.len().max()
+                    text_itemsize[col] = max(int(longest or 0), 12 if col == "CAN_ID" else 32)
+            self._writer = HDF5TableWriter(self.filename, text_itemsize=text_itemsize, units=self.units)
+        self._writer.append(_build_typed_export_df(batch, time_ns=time_ns), typed=True)
+
+    def _close(self):
+        if self._writer is None:
+            self._writer = HDF5TableWriter(self.filename, units=self.units)
+        self._writer.close()
+
+
+class NDJSONSink(ExportSink):
+    """NDJSON via NDJSONWriter; options `ndjson_drop_nulls` / `ndjson_drop_repeats`."""
+
+    batch_rows = NDJSON_CHUNK_ROWS
+
+    def _open(self):
+        self._writer = NDJSONWriter(self.filename,
+                                    drop_nulls=self.options.get("ndjson_drop_nulls", False),
+                                    drop_repeats=self.options.get("ndjson_drop_repeats", False))
+
+    def _write(self, batch, time_ns):
+        self._writer.append(batch)
+
+    def _close(self):
+        self._writer.close()
+
+
+def _strictly_increasing(ts, prev=None, step=1e-6):
+    """Make a time vector strictly increasing (MDF requirement), continuing after `prev`."""
+    ts = np.asarray(ts, dtype=float)
+    ts = pd.Series(np.where(np.isfinite(ts), ts, np.nan)).ffill()
+    ts = ts.fillna(prev if prev is not None else 0.0).to_numpy()
+    if prev is not None:
+        ts = np.concatenate(([prev], ts))
+    ramp = np.arange(len(ts)) * step
+    ts = np.maximum.accumulate(ts - ramp) + ramp
+    return ts[1:] if prev is not None else ts
+
+
+class MF4Sink(ExportSink):
+    """
+    MDF4 with one channel group per CAN ID (asammdf).
+
+    A group is created the first time its CAN ID is seen and extended with
+    every later batch; time is seconds since the first timestamp, kept
+    strictly increasing per group across batches. Gaps in a channel are
+    forward-filled from the previous batch.
+    """
+
+    def _open(self):
+        from asammdf import MDF, Signal  # type: ignore
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy not installed")
+        self._mdf = MDF()
+        self._Signal = Signal
+        self._groups = {}  # can_id -> [group index, channels, last time, last values]
+        self._t0 = None
+        self._last_ts = None
+
+    def _time_seconds(self, batch, time_ns):
+        # Seconds since the first timestamp; unknown times are forward-filled across batches
+        if time_ns is None:
+            time_ns = _decoded_time_ns(batch)
+        time_ns = np.asarray(time_ns, dtype=np.int64)
+        valid = time_ns != NAT_NS
+        if self._t0 is None and valid.any():
+            self._t0 = int(time_ns[valid][0])
+        if self._t0 is None:
+            return np.zeros(len(batch))
+        t = pd.Series(np.where(valid, (time_ns - self._t0) / 1e9, np.nan)).ffill()
+        if self._last_ts is not None:
+            t = t.fillna(self._last_ts)
+        if len(t) and pd.notna(t.iloc[-1]):
+            self._last_ts = t.iloc[-1]
+        return t.fillna(0).to_numpy()
+
+    def _write(self, batch, time_ns):
+        time_s = self._time_seconds(batch, time_ns)
+        if "CAN_ID" not in batch.columns:
+            self._write_group(None, batch, time_s)
+            return
+        for can_id, pos in batch.groupby("CAN_ID").indices.items():
+            self._write_group(can_id, batch.iloc[pos], time_s[pos])
+
+    def _write_group(self, can_id, rows, id_ts):
+        order = id_ts.argsort(kind="mergesort")
+        rows = rows.iloc[order]
+        state = self._groups.get(can_id)
+        values = rows[[c for c in rows.columns if c not in EXPORT_KEY_COLUMNS]].apply(pd.to_numeric, errors="coerce")
+        if state is None:
+            channels = [c for c in values.columns if values[c].notna().any()]
+            state = [None, channels, None, None]
+        channels = state[1]
+        values = values[channels].ffill()
+        if state[3] is not None:
+            values = values.fillna(state[3])
+        state[3] = values.iloc[-1]
+        values = values.fillna(0)
+        id_ts = _strictly_increasing(id_ts[order], prev=state[2])
+        state[2] = id_ts[-1]
+
+        # Normalize CAN ID value
+        can_id_int = -1
+        if can_id is not None:
+            can_id_str = str(can_id)
+            try:
+                if can_id_str.lower().startswith("0x"):
+                    can_id_int = int(can_id_str, 16)
+                else:
+                    can_id_int = int(float(can_id_str))
+            except Exception:
+                can_id_int = -1
+        id_samples = np.full(len(rows), can_id_int)
+
+        if state[0] is not None:
+            columns = [(id_ts, None)]
+            if can_id is not None:
+                columns.append((id_samples, None))
+            columns += [(values[c].to_numpy(), None) for c in channels]
+            self._mdf.extend(state[0], columns)
+            return
+
+        signals = []
+        if can_id is not None:
+            signals.append(self._Signal(
+                samples=id_samples,
+                timestamps=id_ts,
+                name="CAN_ID",
+                unit="",
+                comment=f"CAN Message ID {can_id_str}",
+            ))
+        for col in channels:
+            unit = self.signal_units.get(col, "")
+            signals.append(self._Signal(
+                samples=values[col].to_numpy(),
+                timestamps=id_ts,
+                name=str(col),
+                unit=str(unit) if unit else "",
+                comment=str(unit) if unit else "",
+            ))
+        if not signals:
+            return
+        self._mdf.append(signals, common_timebase=True)
+        state[0] = len(self._mdf.groups) - 1
+        self._groups[can_id] = state
+
+    def _close(self):
+        try:
+            self._mdf.save(self.filename, overwrite=True)
+        finally:
+            self._mdf.close()
+
+    def abort(self):
+        if self._opened:
+            self._opened = False
+            try:
+                self._mdf.close()
+            except Exception:
+                pass
+        _remove_output(self.filename)
+
+
+# Formats that can be written batch by batch (export tab and streaming decode).
+EXPORT_SINKS = {
+    "CSV": CSVSink,
+    "TXT": TXTSink,
+    "PARQUET": ParquetSink,
+    "SQLITE": SQLiteSink,
+    "HDF5": HDF5Sink,
+    "NDJSON": NDJSONSink,
+    "MF4": MF4Sink,
+    "MDF": MF4Sink,
+}
+
+
+def _write_through_sink(sink, df, time_ns=None, progress=None):
+    """Feed a materialized decoded table through `sink` in batches (aborts on error)."""
+    try:
+        sink.open(df.columns)
+        for start in range(0, len(df), sink.batch_rows):
+            batch = df.iloc[start:start + sink.batch_rows]
+            ts = None if time_ns is None else time_ns[start:start + sink.batch_rows]
+            sink.write_batch(batch, time_ns=ts)
+            if progress:
+                progress(len(batch))
+        sink.close()
+    except BaseException:
+        sink.abort()
+        raise
+    return sink.rows_written
+
+
+# Export formats: dialog title, default extension / file types, optional dependency hint.
+EXPORT_FORMATS = {
+    "CSV": {"title": "Save Decoded Data as CSV", "ext": ".csv",
+            "filetypes": [("CSV files", "*.csv")]},
+    "XLSX": {"title": "Save Decoded Data as Excel (.xlsx)", "ext": ".xlsx",
+             "filetypes": [("Excel files", "*.xlsx")],
+             "requires": "XLSX export requires openpyxl. Install with: pip install openpyxl"},
+    "MAT": {"title": "Save Decoded Data as MATLAB (.mat)", "ext": ".mat",
+            "filetypes": [("MATLAB files", "*.mat")],
+            "requires": "MAT export requires scipy (v5) or h5py (v7.3, large files). Install with: pip install scipy h5py"},
+    "NDJSON": {"title": "Save Decoded Data as NDJSON (use .gz for gzip)", "ext": ".ndjson",
+               "filetypes": [("NDJSON files", "*.ndjson;*.jsonl"), ("Gzipped NDJSON", "*.ndjson.gz;*.jsonl.gz")]},
+    "TXT": {"title": "Save Decoded Data as TXT (tab-separated)", "ext": ".txt",
+            "filetypes": [("Text files", "*.txt")]},
+    "HDF5": {"title": "Save Decoded Data as HDF5", "ext": ".h5",
+             "filetypes": [("HDF5 files", "*.h5;*.hdf5")],
+             "requires": "HDF5 export requires pytables. Install with: pip install tables"},
+    "PARQUET": {"title": "Save Decoded Data as Parquet", "ext": ".parquet",
+                "filetypes": [("Parquet files", "*.parquet")],
+                "requires": "Parquet export requires pyarrow or fastparquet. Install with: pip install pyarrow"},
+    "PARQUET_DATASET": {"title": "Select folder for partitioned Parquet dataset (date / CAN_ID)",
+                        "ext": "", "filetypes": [], "directory": True,
+                        "requires": "Parquet dataset export requires pyarrow. Install with: pip install pyarrow"},
+    "ARROW": {"title": "Save Decoded Data as Arrow IPC / Feather v2", "ext": ".arrow",
+              "filetypes": [("Arrow IPC / Feather", "*.arrow;*.feather")],
+              "requires": "Arrow export requires pyarrow. Install with: pip install pyarrow"},
+    "SQLITE": {"title": "Save Decoded Data as SQLite Database", "ext": ".db",
+               "filetypes": [("SQLite files", "*.db")]},
+    "MF4": {"title": "Save Decoded Data as MF4", "ext": ".mf4",
+            "filetypes": [("MDF files", "*.mf4;*.mdf")],
+            "requires": "MDF/MF4 export requires asammdf and numpy. Install with: pip install asammdf numpy"},
+    "MDF": {"title": "Save Decoded Data as MDF", "ext": ".mdf",
+            "filetypes": [("MDF files", "*.mf4;*.mdf")],
+            "requires": "MDF/MF4 export requires asammdf and numpy. Install with: pip install asammdf numpy"},
+    "PROMETHEUS": {"title": "Save Decoded Data as Prometheus exposition format", "ext": ".prom",
+                   "filetypes": [("Prometheus files", "*.prom;*.txt")]},
+}
+EXPORT_EXTENSIONS = {spec["ext"] for spec in EXPORT_FORMATS.values() if spec["ext"]}
+
+
+class SharedExportData:
+    """
+    One decoded table shared read-only by every exporter of an export run.
+
+    `time_ns` is the table's canonical time axis from decode; it is derived
+    once, on first use, when not given. Typed columnar views are built per
+    chunk by each writer rather than for the whole table, so an export never
+    holds a second full-size copy. Building a shared view is recorded as a
+    stage of `profiler` (a StageProfiler) when one is given.
+    """
+
+    def __init__(self, df, raw_df=None, units=None, signal_units=None, provenance=None,
+                 can_id_signals=None, options=None, time_ns=None, profiler=None):
+        self.df = df
+        self.raw_df = raw_df
+        self.units = units
+        self.signal_units = signal_units or {}
+        self.provenance = provenance or {}
+        self.can_id_signals = can_id_signals or {}
+        self.options = options or {}
+        self._lock = threading.Lock()
+        self._time_ns = time_ns
+        self.profiler = profiler
+
+    def _stage(self, name):
+        if self.profiler is None:
+            return contextlib.nullcontext({})
+        return self.profiler.stage(name, rows_in=len(self.df))
+
+    def time_ns(self):
+        with self._lock:
+            if self._time_ns is None:
+                with self._stage("time axis (shared)"):
+                    self._time_ns = _decoded_time_ns(self.df)
+            return self._time_ns
+
+
+class ExportCancelled(Exception):
+    """Raised inside an export writer when the user cancels the export."""
+
+
+class ExportJob:
+    """
+    Progress / cancellation handle for one format of an export run.
+
+    Writers call advance(rows) after every chunk they write; this is also where
+    a pending cancel is raised, so a writer stops at the next chunk boundary.
+    Counters are plain ints updated by one worker thread and only read by the
+    GUI poll loop.
+    """
+
+    def __init__(self, export_format, target, cancel_event):
+        self.format = export_format
+        self.target = target
+        self.cancel_event = cancel_event
+        self.status = 'queued'
+        self.rows_written = 0
+        self.error = None
+        self.elapsed = None
+        self._existed = os.path.exists(target)
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check(self):
+        if self.cancel_event.is_set():
+            raise ExportCancelled(self.format)
+
+    def advance(self, rows):
+        self.check()
+        self.rows_written += int(rows)
+
+    def bytes_out(self):
+        try:
+            if os.path.isdir(self.target):
+                return sum(p.stat().st_size for p in Path(self.target).rglob("*") if p.is_file())
+            return os.path.getsize(self.target)
+        except OSError:
+            return 0
+
+    def remove_partial(self):
+        """
+        Delete whatever this job wrote. A dataset folder that existed before is
+        left alone: _write_parquet_dataset only swaps in complete exports.
+        """
+        try:
+            if os.path.isdir(self.target):
+                if not self._existed:
+                    shutil.rmtree(self.target, ignore_errors=True)
+            elif os.path.exists(self.target):
+                os.remove(self.target)
+        except OSError:
+            pass
+
+
+def _peak_rss_bytes():
+    """Process peak resident set size in bytes, or None where it cannot be read."""
+    if resource is not None:
+        try:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Linux reports KB, macOS bytes.
+            return peak if sys.platform == "darwin" else peak * 1024
+        except Exception:
+            pass
+    try:
+        import psutil  # type: ignore
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    except Exception:
+        return None
+
+
+def _profile_env_setting():
+    """(enabled, directory or None) from the CAN_DECODER_PROFILE environment variable."""
+    value = os.environ.get(PROFILE_ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return False, None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True, None
+    return True, value
+
+
+class StageProfiler:
+    """
+    Wall time, rows in/out and peak-memory growth per stage of a decode or export run.
+
+    Stages are opened with begin()/end() or the stage() context manager and may
+    nest (per thread); repeated stages (per chunk, per frame) accumulate into one
+    row. Memory is the growth of the process peak RSS during the stage, which is
+    cheap enough to leave on. With deep=True, Python/NumPy allocations are traced
+    instead (exact per-stage peaks, several times slower) and every thread that
+    calls profile_thread() runs under cProfile; dump() writes JSON and pstats.
+    """
+
+    def __init__(self, title, deep=False):
+        self.title = title
+        self.deep = deep
+        self.stages = {}
+        self.context = {}
+        self.started = time.perf_counter()
+        self.total = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiles = []
+        self._owns_tracemalloc = False
+        if deep and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+
+    @property
+    def memory_metric(self):
+        return "traced peak" if self.deep else "peak RSS growth"
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _memory(self):
+        if self.deep:
+            return tracemalloc.get_traced_memory()[1]
+        return _peak_rss_bytes()
+
+    def _record(self, name, depth):
+        record = self.stages.get(name)
+        if record is None:
+            record = self.stages[name] = {'name': name, 'depth': depth, 'seconds': 0.0, 'calls': 0,
+                                          'rows_in': None, 'rows_out': None, 'mem_delta_mb': None,
+                                          'note': ''}
+        return record
+
+    def begin(self, name):
+        stack = self._stack()
+        with self._lock:
+            self._record(name, len(stack))  # rows are listed in the order stages start
+        if self.deep:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1]['mem_peak'] = max(stack[-1]['mem_peak'], peak)
+            tracemalloc.reset_peak()
+            mem_start = current
+        else:
+            mem_start = self._memory()
+        stack.append({'name': name, 't0': time.perf_counter(), 'mem_start': mem_start, 'mem_peak': mem_start})
+
+    def end(self, rows_in=None, rows_out=None, note=None):
+        stack = self._stack()
+        frame = stack.pop()
+        elapsed = time.perf_counter() - frame['t0']
+        mem_delta = None
+        if self.deep:
+            peak = max(frame['mem_peak'], tracemalloc.get_traced_memory()[1])
+            mem_delta = peak - frame['mem_start']
+            if stack:
+                stack[-1]['mem_peak'] = max(stack[-1]['mem_peak'], peak)
+            tracemalloc.reset_peak()
+        elif frame['mem_start'] is not None:
+            mem_delta = (self._memory() or frame['mem_start']) - frame['mem_start']
+        self.add(frame['name'], elapsed, rows_in=rows_in, rows_out=rows_out, note=note,
+                 mem_delta=mem_delta, depth=len(stack))
+        return elapsed
+
+    @contextlib.contextmanager
+    def stage(self, name, rows_in=None):
+        """Time the enclosed block; set counts['rows_out'] / counts['note'] inside it."""
+        counts = {'rows_in': rows_in, 'rows_out': None, 'note': None}
+        self.begin(name)
+        try:
+            yield counts
+        finally:
+            self.end(**counts)
+
+    def add(self, name, seconds, rows_in=None, rows_out=None, note=None, mem_delta=None, depth=None):
+        """Accumulate an already measured interval (hot loops time themselves)."""
+        if depth is None:
+            depth = len(self._stack())
+        with self._lock:
+            record = self._record(name, depth)
+            record['seconds'] += seconds
+            record['calls'] += 1
+            if rows_in is not None:
+                record['rows_in'] = (record['rows_in'] or 0) + int(rows_in)
+            if rows_out is not None:
+                record['rows_out'] = (record['rows_out'] or 0) + int(rows_out)
+            if mem_delta is not None:
+                mb = mem_delta / 1e6
+                record['mem_delta_mb'] = mb if record['mem_delta_mb'] is None else max(record['mem_delta_mb'], mb)
+            if note:
+                record['note'] = note
+
+    @contextlib.contextmanager
+    def profile_thread(self):
+        """Run the enclosed block of the current thread under cProfile (deep mode only)."""
+        if not self.deep:
+            yield
+            return
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._profiles.append(profile)
+
+    def finish(self):
+        if self.total is None:
+            self.total = time.perf_counter() - self.started
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def _stats(self):
+        if not self._profiles:
+            return None
+        stats = pstats.Stats(self._profiles[0])
+        for profile in self._profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def report_lines(self):
+        total = self.total if self.total is not None else time.perf_counter() - self.started
+        lines = [
+            f"Stage profile ({self.title}): {total:.2f} s total; memory = {self.memory_metric}"
+            + (" (concurrent stages share one process)" if self.title == "export" else ""),
+            f"  {'Stage':<34}{'Time (s)':>10}{'Calls':>8}{'Rows in':>12}{'Rows out':>12}{'Mem (MB)':>10}  Note",
+        ]
+        for record in self.stages.values():
+            name = ("  " * record['depth'] + record['name'])[:34]
+            rows_in = f"{record['rows_in']:,}" if record['rows_in'] is not None else ""
+            rows_out = f"{record['rows_out']:,}" if record['rows_out'] is not None else ""
+            mem = f"{record['mem_delta_mb']:.1f}" if record['mem_delta_mb'] is not None else ""
+            lines.append(f"  {name:<34}{record['seconds']:>10.3f}{record['calls']:>8}"
+                         f"{rows_in:>12}{rows_out:>12}{mem:>10}  {record['note']}")
+        lines.append("  (indented stages are included in the stage above them)")
+        stats = self._stats()
+        if stats is not None:
+            buffer = io.StringIO()
+            stats.stream = buffer
+            stats.sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+            lines.append("")
+            lines.append(f"Top {PROFILE_TOP_FUNCTIONS} functions by cumulative time:")
+            lines.extend(line for line in buffer.getvalue().splitlines()
+                         if line.strip() and not line.lstrip().startswith(("Ordered by", "List reduced")))
+        return lines
+
+    def to_dict(self):
+        from datetime import datetime
+        return {
+            'title': self.title,
+            'created': datetime.now().isoformat(timespec="seconds"),
+            'deep': self.deep,
+            'total_s': self.total,
+            'memory_metric': self.memory_metric,
+            'stages': list(self.stages.values()),
+            'context': self.context,
+        }
+
+    def dump(self, directory, stem):
+        """Write <stem>_<title>_profile_<time>.json (and .pstats when deep); returns the paths."""
+        from datetime import datetime
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        base = directory / f"{stem}_{self.title}_profile_{datetime.now():%Y%m%d_%H%M%S}"
+        paths = [str(base) + ".json"]
+        with open(paths[0], "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, indent=2, default=_json_default)
+        stats = self._stats()
+        if stats is not None:
+            paths.append(str(base) + ".pstats")
+            stats.dump_stats(paths[1])
+        return paths
+
 
 class DBCDecoderGUI:
     def __init__(self, root):
@@ -365,6 +2584,7 @@ class DBCDecoderGUI:
         
         # Store decoded data for tabs
         self.decoded_df = None
+        self.decoded_time_ns = None  # canonical int64 ns time axis of decoded_df (NAT_NS = unknown)
         self.raw_df = None
         self.stats_data = {}
         self.all_signal_names = set()
@@ -372,7 +2592,13 @@ class DBCDecoderGUI:
         self.signal_offsets = {}  # {signal_name: offset_value} - for verification
         self.signal_scales = {}  # {signal_name: scale_value} - for verification
         self.db = None  # Store DBC database for signal info access
+        self.can_id_signals = {}  # {"0x1A0": [signal_name, ...]} - from DBC, for per-ID exports
+        self.decode_provenance = {}  # source log / DBC details stored in export metadata
+        self.decode_profile = None  # StageProfiler of the last decode (per-stage time / rows / memory)
+        self.export_running = False
         self.logo_img = None  # Logo image cache
+        self.engines_ready = False  # heavy libraries imported (see load_engines)
+        self.startup_times = {}  # seconds since module import: window_painted, engines_ready
         
         # Thread-safe queue for GUI updates from background threads
         self.gui_queue = queue.Queue()
@@ -381,6 +2607,43 @@ class DBCDecoderGUI:
         
         # Start processing GUI update queue
         self.process_gui_queue()
+
+        # Heavy imports run in the background once the window has painted.
+        self.root.after_idle(self._start_engine_warmup)
+
+    def _start_engine_warmup(self):
+        self.startup_times['window_painted'] = time.perf_counter() - _MODULE_T0
+
+        def _warm_up():
+            timings = load_engines()
+            self.safe_gui_update(lambda: self._on_engines_ready(timings))
+
+        threading.Thread(target=_warm_up, name="engine-warmup", daemon=True).start()
+
+    def _ensure_engines(self):
+        """Make sure the heavy libraries are loaded before a main-thread action uses them."""
+        if not self.engines_ready:
+            self.update_status("Loading engines...")
+            self._on_engines_ready(load_engines())
+
+    def _on_engines_ready(self, timings):
+        """Main thread: finish the parts of the window that needed the heavy libraries."""
+        if self.engines_ready:
+            return
+        self.engines_ready = True
+        self.startup_times['engines_ready'] = time.perf_counter() - _MODULE_T0
+        self.startup_times['imports'] = timings
+        if self.logo_img is None and PIL_AVAILABLE:
+            self._draw_logo()
+        self._build_plot_canvas()
+        missing = [name for name, seconds in timings.items() if seconds is None]
+        try:
+            self.engines_label.config(
+                text=f"✓ Engines ready ({self.startup_times['engines_ready']:.1f} s)"
+                     + (f" - missing: {', '.join(missing)}" if missing else ""),
+                fg=self.colors['warning'] if missing else self.colors['success'])
+        except Exception:
+            pass
         
     def process_gui_queue(self):
         """Process GUI update queue from background threads - called periodically from main thread"""
@@ -446,6 +2709,12 @@ class DBCDecoderGUI:
                         return None
         return None
 
+    def _draw_logo(self):
+        self.logo_img = self._load_logo_image()
+        if self.logo_img is not None:
+            self.header_canvas.create_image(28, 22, anchor="nw", image=self.logo_img)
+            self.header_canvas.move("header_text", self.logo_img.width() + 16, 0)
+
     def create_widgets(self):
         # Header Section with artistic banner + logo
         header_frame = tk.Frame(self.root, bg=self.colors['header_bg'], height=140)
@@ -467,30 +2736,27 @@ class DBCDecoderGUI:
                                      fill="#111827", outline="")
         header_canvas.create_rectangle(0, 132, 2000, 140, fill=self.colors['accent_alt'], outline="")
 
-        # Logo
-        self.logo_img = self._load_logo_image()
-
-        text_x = 28
-        if self.logo_img is not None:
-            header_canvas.create_image(28, 22, anchor="nw", image=self.logo_img)
-            text_x = 28 + self.logo_img.width() + 16
-
+        self.header_canvas = header_canvas
         header_canvas.create_text(
-            text_x,
+            28,
             28,
             anchor="nw",
             text="Naxatra Labs CAN Decoder",
             font=("Segoe UI", 22, "bold"),
             fill=self.colors['header_text'],
+            tags=("header_text",),
         )
         header_canvas.create_text(
-            text_x,
+            28,
             64,
             anchor="nw",
             text="Decode logs, inspect signals, and export clean datasets.",
             font=("Segoe UI", 11),
             fill=self.colors['header_subtext'],
+            tags=("header_text",),
         )
+        # Logo (PNG without PIL now; other formats once PIL has loaded in the background)
+        self._draw_logo()
 
         # Main container with padding
 
@@ -657,6 +2923,16 @@ class DBCDecoderGUI:
                              bd=0,
                              command=self.clear_output)
         clear_btn.pack(side=tk.LEFT)
+
+        self.deep_profile_var = tk.BooleanVar(value=_profile_env_setting()[0])
+        tk.Checkbutton(button_frame,
+                       text="Deep profiling (cProfile + JSON)",
+                       variable=self.deep_profile_var,
+                       font=("Segoe UI", 9),
+                       bg=self.colors['bg_card'],
+                       fg=self.colors['text_secondary'],
+                       activebackground=self.colors['bg_card'],
+                       selectcolor=self.colors['bg_input']).pack(side=tk.RIGHT)
         
         # Progress Bar
         progress_frame = tk.Frame(main_frame, bg=self.colors['bg_main'])
@@ -675,14 +2951,30 @@ class DBCDecoderGUI:
         self.progress = ttk.Progressbar(progress_frame, mode='indeterminate', style='TProgressbar')
         self.progress.pack(fill=tk.X)
         
-        # Status Label
-        self.status_label = tk.Label(progress_frame,
+        # Status Label, with the background engine warm-up state on the right
+        status_row = tk.Frame(progress_frame, bg=self.colors['bg_main'])
+        status_row.pack(fill=tk.X, pady=(5, 0))
+        self.engines_label = tk.Label(status_row,
+                                      text="⏳ Loading engines...",
+                                      font=("Segoe UI", 9),
+                                      bg=self.colors['bg_main'],
+                                      fg=self.colors['text_muted'],
+                                      anchor='e')
+        self.engines_label.pack(side=tk.RIGHT)
+        self.memory_label = tk.Label(status_row,
+                                     text="",
+                                     font=("Segoe UI", 9),
+                                     bg=self.colors['bg_main'],
+                                     fg=self.colors['text_muted'],
+                                     anchor='e')
+        self.memory_label.pack(side=tk.RIGHT, padx=(0, 15))
+        self.status_label = tk.Label(status_row,
                                     text="● Ready",
                                     font=("Segoe UI", 10),
                                     bg=self.colors['bg_main'],
                                     fg=self.colors['success'],
                                     anchor='w')
-        self.status_label.pack(fill=tk.X, pady=(5, 0))
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Create Notebook for Tabs
         self.notebook = ttk.Notebook(main_frame)
@@ -761,27 +3053,10 @@ class DBCDecoderGUI:
         viz_frame = tk.Frame(self.notebook, bg=self.colors['bg_main'])
         self.notebook.add(viz_frame, text="📉 Visualization")
         
-        # Try to import matplotlib
-        try:
-            import matplotlib.pyplot as plt
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-            from matplotlib.figure import Figure
-            MATPLOTLIB_AVAILABLE = True
-        except ImportError:
-            MATPLOTLIB_AVAILABLE = False
-        
-        if not MATPLOTLIB_AVAILABLE:
-            error_label = tk.Label(viz_frame,
-                                  text="Matplotlib not available.\n\nInstall with: pip install matplotlib",
-                                  font=("Segoe UI", 12),
-                                  bg=self.colors['bg_main'],
-                                  fg=self.colors['error'],
-                                  justify=tk.CENTER)
-            error_label.pack(expand=True)
-            self.fig = None
-            self.canvas = None
-            return
-        
+        # The matplotlib figure is created by _build_plot_canvas once the engines have loaded.
+        self.fig = None
+        self.canvas = None
+
         # Control frame
         control_frame = tk.Frame(viz_frame, bg=self.colors['bg_main'])
         control_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
@@ -824,12 +3099,85 @@ class DBCDecoderGUI:
                             bd=0,
                             command=self.generate_plot)
         plot_btn.pack(side=tk.LEFT)
-        
-        # Matplotlib figure
+
+        # Signal Values: signals to overlay and how to decimate them to the canvas width
+        signal_frame = tk.Frame(viz_frame, bg=self.colors['bg_main'])
+        signal_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+
+        tk.Label(signal_frame,
+                 text="Signals:",
+                 font=("Segoe UI", 10, "bold"),
+                 bg=self.colors['bg_main'],
+                 fg=self.colors['text']).pack(side=tk.LEFT, anchor=tk.N, padx=(0, 10))
+
+        list_frame = tk.Frame(signal_frame, bg=self.colors['bg_main'])
+        list_frame.pack(side=tk.LEFT, padx=(0, 10))
+        self.plot_signal_list = tk.Listbox(list_frame,
+                                           selectmode=tk.EXTENDED,
+                                           exportselection=False,
+                                           height=4,
+                                           width=32,
+                                           font=("Segoe UI", 9),
+                                           bg=self.colors['bg_input'],
+                                           fg=self.colors['text'],
+                                           relief=tk.FLAT)
+        signal_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.plot_signal_list.yview)
+        self.plot_signal_list.configure(yscrollcommand=signal_scroll.set)
+        self.plot_signal_list.pack(side=tk.LEFT)
+        signal_scroll.pack(side=tk.LEFT, fill=tk.Y)
+
+        tk.Label(signal_frame,
+                 text="Decimation:",
+                 font=("Segoe UI", 10, "bold"),
+                 bg=self.colors['bg_main'],
+                 fg=self.colors['text']).pack(side=tk.LEFT, anchor=tk.N, padx=(0, 10))
+        self.plot_decimation_var = tk.StringVar(value=PLOT_DECIMATION_MODES[0])
+        ttk.Combobox(signal_frame,
+                     textvariable=self.plot_decimation_var,
+                     values=PLOT_DECIMATION_MODES,
+                     state="readonly",
+                     width=10,
+                     font=("Segoe UI", 9)).pack(side=tk.LEFT, anchor=tk.N, padx=(0, 10))
+
+        self.plot_info_label = tk.Label(signal_frame,
+                                        text="",
+                                        font=("Segoe UI", 9),
+                                        bg=self.colors['bg_main'],
+                                        fg=self.colors['text_secondary'],
+                                        justify=tk.LEFT)
+        self.plot_info_label.pack(side=tk.LEFT, anchor=tk.N)
+
+        self.plot_area = tk.Frame(viz_frame, bg=self.colors['bg_main'])
+        self.plot_area.pack(fill=tk.BOTH, expand=True)
+        self.plot_placeholder = tk.Label(self.plot_area,
+                                         text="Loading plotting engine...",
+                                         font=("Segoe UI", 12),
+                                         bg=self.colors['bg_main'],
+                                         fg=self.colors['text_muted'],
+                                         justify=tk.CENTER)
+        self.plot_placeholder.pack(expand=True)
+
+    def _build_plot_canvas(self):
+        """Create the matplotlib figure in the Visualization tab (after the engines have loaded)."""
+        if not hasattr(self, 'plot_area') or self.canvas is not None:
+            return
+        try:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+            from matplotlib.figure import Figure
+        except ImportError:
+            self.plot_placeholder.config(text="Matplotlib not available.\n\nInstall with: pip install matplotlib",
+                                         fg=self.colors['error'])
+            return
         try:
+            self.plot_placeholder.destroy()
             self.fig = Figure(figsize=(12, 6), facecolor='white', dpi=100)
-            self.canvas = FigureCanvasTkAgg(self.fig, viz_frame)
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+            self.canvas = FigureCanvasTkAgg(self.fig, self.plot_area)
+            # Zoom / pan toolbar; the mouse wheel zooms the time axis
+            toolbar_frame = tk.Frame(self.plot_area, bg=self.colors['bg_main'])
+            toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 10))
+            NavigationToolbar2Tk(self.canvas, toolbar_frame)
+            self.canvas.mpl_connect('scroll_event', self._on_plot_scroll)
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
         except Exception as e:
             print(f"Warning: Could not create matplotlib figure: {e}")
             self.fig = None
@@ -864,15 +3212,27 @@ class DBCDecoderGUI:
                                anchor='w')
         format_label.pack(side=tk.LEFT, padx=(0, 10))
         
-        formats = ["CSV", "XLSX", "MAT", "JSON", "TXT", "HDF5", "PARQUET", "SQLITE", "MF4", "MDF", "PROMETHEUS"]
-        self.export_format_var = tk.StringVar(value="CSV")
-        format_combo = ttk.Combobox(format_inner,
-                                   textvariable=self.export_format_var,
-                                   values=formats,
-                                   state="readonly",
-                                   width=20,
-                                   font=("Segoe UI", 9))
-        format_combo.pack(side=tk.LEFT, padx=(0, 15))
+        # Multi-select: several formats are exported concurrently from one decode.
+        self.export_format_list = tk.Listbox(format_inner,
+                                             selectmode=tk.EXTENDED,
+                                             exportselection=False,
+                                             height=6,
+                                             width=22,
+                                             font=("Segoe UI", 9),
+                                             bg=self.colors['bg_input'],
+                                             fg=self.colors['text'],
+                                             selectbackground=self.colors['accent'],
+                                             selectforeground='white',
+                                             relief=tk.FLAT,
+                                             highlightthickness=1,
+                                             highlightbackground=self.colors['border'])
+        for fmt in EXPORT_FORMATS:
+            self.export_format_list.insert(tk.END, fmt)
+        self.export_format_list.selection_set(0)
+        format_scroll = ttk.Scrollbar(format_inner, orient=tk.VERTICAL, command=self.export_format_list.yview)
+        self.export_format_list.config(yscrollcommand=format_scroll.set)
+        self.export_format_list.pack(side=tk.LEFT)
+        format_scroll.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 15))
         
         export_btn = tk.Button(format_inner,
                               text="💾 Export Data",
@@ -887,15 +3247,154 @@ class DBCDecoderGUI:
                               bd=0,
                               command=self.export_decoded_data)
         export_btn.pack(side=tk.LEFT)
+
+        self.export_cancel_btn = tk.Button(format_inner,
+                                           text="✖ Cancel Export",
+                                           font=("Segoe UI", 10, "bold"),
+                                           bg=self.colors['error'],
+                                           fg='white',
+                                           activebackground=self.colors['error'],
+                                           relief=tk.FLAT,
+                                           padx=15,
+                                           pady=10,
+                                           cursor='hand2',
+                                           bd=0,
+                                           state=tk.DISABLED,
+                                           command=self.cancel_export)
+        self.export_cancel_btn.pack(side=tk.LEFT, padx=(10, 0))
+
+        stream_btn = tk.Button(format_inner,
+                               text="⚡ Decode → Export (streaming)",
+                               font=("Segoe UI", 10, "bold"),
+                               bg=self.colors['accent'],
+                               fg='white',
+                               activebackground=self.colors['accent_hover'],
+                               relief=tk.FLAT,
+                               padx=15,
+                               pady=10,
+                               cursor='hand2',
+                               bd=0,
+                               command=self.start_stream_decode)
+        stream_btn.pack(side=tk.LEFT, padx=(10, 0))
+
+        # Format options (NDJSON)
+        options_inner = tk.Frame(format_frame, bg=self.colors['bg_card'])
+        options_inner.pack(fill=tk.X, padx=20, pady=(0, 10))
+        self.ndjson_drop_nulls_var = tk.BooleanVar(value=False)
+        self.ndjson_drop_repeats_var = tk.BooleanVar(value=False)
+        for text, var in (("NDJSON: omit empty fields", self.ndjson_drop_nulls_var),
+                          ("NDJSON: omit repeated (forward-filled) values", self.ndjson_drop_repeats_var)):
+            tk.Checkbutton(options_inner,
+                           text=text,
+                           variable=var,
+                           font=("Segoe UI", 9),
+                           bg=self.colors['bg_card'],
+                           fg=self.colors['text_secondary'],
+                           activebackground=self.colors['bg_card'],
+                           selectcolor=self.colors['bg_input']).pack(side=tk.LEFT, padx=(0, 15))
+
+        tk.Label(options_inner,
+                 text="Arrow compression:",
+                 font=("Segoe UI", 9),
+                 bg=self.colors['bg_card'],
+                 fg=self.colors['text_secondary']).pack(side=tk.LEFT, padx=(0, 5))
+        self.arrow_compression_var = tk.StringVar(value=ARROW_COMPRESSIONS[0])
+        ttk.Combobox(options_inner,
+                     textvariable=self.arrow_compression_var,
+                     values=list(ARROW_COMPRESSIONS),
+                     state="readonly",
+                     width=14,
+                     font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(0, 15))
+
+        open_arrow_btn = tk.Button(options_inner,
+                                   text="📂 Open Decoded (.arrow)",
+                                   font=("Segoe UI", 9, "bold"),
+                                   bg=self.colors['accent_alt'],
+                                   fg='white',
+                                   activebackground=self.colors['accent_alt_hover'],
+                                   activeforeground='white',
+                                   relief=tk.FLAT,
+                                   padx=15,
+                                   pady=4,
+                                   cursor='hand2',
+                                   bd=0,
+                                   command=self.open_arrow_export)
+        open_arrow_btn.pack(side=tk.RIGHT)
         
         # Info label
         info_label = tk.Label(format_frame,
-                             text="💡 Select a format and click Export to save your decoded data",
+                             text="💡 Select one or more formats (Ctrl/Shift-click) and click Export; several formats are written in parallel",
                              font=("Segoe UI", 9, "italic"),
                              bg=self.colors['bg_card'],
                              fg=self.colors['text_muted'])
-        info_label.pack(padx=20, pady=(0, 15))
+        info_label.pack(padx=20, pady=(0, 5))
+
+        self.export_progress_label = tk.Label(format_frame,
+                                              text="",
+                                              font=("Segoe UI", 9),
+                                              bg=self.colors['bg_card'],
+                                              fg=self.colors['text_secondary'],
+                                              anchor='w',
+                                              justify=tk.LEFT,
+                                              wraplength=900)
+        self.export_progress_label.pack(fill=tk.X, padx=20, pady=(0, 15))
         
+    def open_arrow_export(self):
+        """Reload a previous ARROW export (memory-mapped) as the current decoded dataset."""
+        self._ensure_engines()
+        if pd is None:
+            messagebox.showerror("Error", "pandas is required to open decoded data.")
+            return
+        filename = filedialog.askopenfilename(
+            title="Open Decoded Data (Arrow IPC / Feather)",
+            filetypes=[("Arrow IPC / Feather", "*.arrow;*.feather;*.ipc"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            df, units, provenance, time_ns = _read_arrow_ipc(filename)
+        except ImportError:
+            messagebox.showerror("Error", "Opening Arrow files requires pyarrow. Install with: pip install pyarrow")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open Arrow file:\n{e}")
+            return
+
+        units_row = {c: "" for c in df.columns}
+        units_row.update({k: v for k, v in units.items() if k in units_row})
+        self.decoded_df = df
+        self.decoded_time_ns = time_ns
+        self.raw_df = df
+        self._plot_cache = None  # holds the previous table; rebuilt on the next plot
+        self.decoded_units_row = units_row
+        self.signal_units = dict(units)
+        self.can_id_signals = dict(provenance.get("can_id_signals") or {})
+        self.all_signal_names = {c for c in df.columns
+                                 if c not in EXPORT_KEY_COLUMNS and c not in EXPORT_TEXT_COLUMNS}
+        self.decode_provenance = provenance
+        self.append_output(self._update_memory_readout())
+        try:
+            can_id_distribution = df['CAN_ID'].astype(str).value_counts().to_dict()
+        except Exception:
+            can_id_distribution = {}
+        self.stats_data = {
+            'total_messages': provenance.get('input_messages', len(df)),
+            'decoded_count': provenance.get('decoded_count', len(df)),
+            'error_count': provenance.get('error_count', 0),
+            'success_rate': provenance.get('success_rate', 100.0),
+            'unique_signals': len(self.all_signal_names),
+            'total_rows': len(df),
+            'can_id_distribution': can_id_distribution,
+        }
+        self.update_statistics_display()
+        self._refresh_plot_signals()
+        self.append_output(f"\nOpened decoded dataset: {filename}")
+        self.append_output(f"  Rows: {len(df)}  Columns: {len(df.columns)}")
+        if provenance:
+            self.append_output(f"  Source log: {provenance.get('log_file', '?')}")
+            self.append_output(f"  DBC: {provenance.get('dbc_file', '?')} (sha256 {str(provenance.get('dbc_sha256', ''))[:12]})")
+        self.update_status(f"Loaded {len(df)} rows from {Path(filename).name}")
+
     def browse_csv_file(self):
         filename = filedialog.askopenfilename(
             title="Select Log File",
@@ -931,6 +3430,25 @@ class DBCDecoderGUI:
         self.stats_label.config(text="No messages decoded yet", fg=self.colors['text_muted'])
         self.update_status("Ready")
     
+    def _deep_profile_enabled(self):
+        try:
+            return bool(self.deep_profile_var.get())
+        except Exception:
+            return _profile_env_setting()[0]
+
+    def _report_profile(self, prof, directory, stem):
+        """Print a stage profile to the Output tab; deep profiles are also written to disk."""
+        self.append_output("")
+        for line in prof.report_lines():
+            self.append_output(line)
+        if prof.deep:
+            try:
+                for path in prof.dump(directory, stem):
+                    self.append_output(f"Profile saved: {path}")
+            except Exception as e:
+                self.append_output(f"Profile not saved: {e}")
+        self.append_output("")
+
     def append_output(self, text):
         """Append text to output - can be called from any thread"""
         if threading.current_thread() == threading.main_thread():
@@ -945,33 +3463,126 @@ class DBCDecoderGUI:
                 self.output_text.see(tk.END)
             ))
 
-    def _ensure_timestamps_column(self, df):
-        """Ensure a 'timestamps' column exists for plotting/export."""
-        if df is None or 'timestamps' in df.columns:
-            return df
-        if 'Date' in df.columns and 'Time' in df.columns:
-            df['timestamps'] = df['Date'].astype(str) + " " + df['Time'].astype(str)
-        elif 'Timestamp' in df.columns:
-            df['timestamps'] = df['Timestamp'].astype(str)
-        return df
-
-    def _get_timestamp_series(self, df):
-        """Return pandas datetime series for plotting if possible."""
-        if df is None or pd is None:
-            return None
-        if 'timestamps' in df.columns:
-            t = pd.to_datetime(df['timestamps'], errors='coerce')
-        elif 'Date' in df.columns and 'Time' in df.columns:
-            t = pd.to_datetime(df['Date'].astype(str) + " " + df['Time'].astype(str), errors='coerce')
-        elif 'Timestamp' in df.columns:
-            t = pd.to_datetime(df['Timestamp'], errors='coerce')
-        else:
+    def _decoded_time_axis(self):
+        """Canonical time axis of the current decoded table as datetime64[ns] (None if unknown)."""
+        time_ns = getattr(self, 'decoded_time_ns', None)
+        if time_ns is None or self.decoded_df is None or len(time_ns) != len(self.decoded_df):
             return None
-        if t is None or t.isna().all():
+        if not (time_ns != NAT_NS).any():
             return None
-        return t
+        return time_ns.view('datetime64[ns]')
+
+    def _plot_signal_columns(self, df):
+        """Columns of the decoded table that can be drawn as signal traces."""
+        excluded = {
+            'Date', 'Time', 'Timestamp', 'timestamps',
+            'UnixTime', 'Microseconds', 'ID', 'CAN_ID',
+            'Extended', 'RTR', 'DLC'
+        }
+        return [c for c in df.columns
+                if c not in excluded and c not in EXPORT_TEXT_COLUMNS and not str(c).startswith('Data')]
+
+    def _refresh_plot_signals(self):
+        """Fill the visualization signal list from the current decoded table."""
+        listbox = getattr(self, 'plot_signal_list', None)
+        if listbox is None:
+            return
+        listbox.delete(0, tk.END)
+        if self.decoded_df is None:
+            return
+        for col in self._plot_signal_columns(self.decoded_df):
+            listbox.insert(tk.END, col)
+        if listbox.size():
+            listbox.selection_set(0)
+
+    def _build_plot_cache(self, df, x):
+        """
+        Plot cache of a decoded table: the time axis shared by every signal and
+        a SignalPyramid per signal, built the first time it is plotted.
+
+        The axis is `x` itself (datetime64) when every row has a time, else the
+        rows that have one (`rows`: their table rows); without any time it is
+        the row numbers.
+        """
+        rows = None
+        if x is None:
+            axis = np.arange(len(df))
+        elif np.isnat(x).any():
+            rows = np.flatnonzero(~np.isnat(x))
+            axis = x[rows]
+        else:
+            axis = x
+        return {'df': df, 'x': axis, 'rows': rows, 'has_time': x is not None, 'columns': {}}
+
+    def _plot_cache_column(self, cache, col):
+        column, table_rows = cache['df'][col], cache['rows']
+
+        def values(pos):
+            cells = column.iloc[pos if table_rows is None else table_rows[pos]]
+            return pd.to_numeric(cells, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+        y = values(slice(None))
+        keep = np.isfinite(y)
+        rows = None
+        if not keep.all():
+            rows = np.flatnonzero(keep).astype(np.int32 if len(y) < 2 ** 31 else np.int64)
+            y = y[rows]
+        pyramid = SignalPyramid(cache['x'], y, values, rows=rows)
+        cache['columns'][col] = pyramid
+        return pyramid
+
+    def _plot_pyramids(self, columns):
+        """
+        Return (has_time, {column: SignalPyramid}) for the Signal Values plot.
+        Pyramid x is datetime64 (row numbers when the table has no usable
+        timestamps); unplottable rows are already dropped. Pyramids are built
+        here, only for the signals being plotted.
+        """
+        df = self.decoded_df
+        cache = getattr(self, '_plot_cache', None)
+        if cache is None or cache['df'] is not df:
+            cache = self._plot_cache = self._build_plot_cache(df, self._decoded_time_axis())
+        pyramids = {}
+        built = False
+        for col in columns:
+            pyramid = cache['columns'].get(col)
+            if pyramid is None:
+                pyramid = self._plot_cache_column(cache, col)
+                built = True
+            pyramids[col] = pyramid
+        if built:
+            self._update_memory_readout()
+        return cache['has_time'], pyramids
+
+    def _update_memory_readout(self):
+        """Measure the current decoded dataset and show its footprint (any thread)."""
+        df = self.decoded_df
+        if df is None:
+            self.dataset_memory = None
+            text = ""
+        else:
+            cached = getattr(self, '_table_bytes', None)
+            usage = _dataset_memory(df, getattr(self, 'decoded_time_ns', None), getattr(self, '_plot_cache', None),
+                                    table_bytes=cached[1] if cached and cached[0] is df else None)
+            self._table_bytes = (df, usage['table'])
+            self.dataset_memory = usage
+            text = (f"Dataset in memory: {usage['total'] / 1e6:,.0f} MB (table {usage['table'] / 1e6:,.0f}, "
+                    f"time {usage['time_axis'] / 1e6:,.0f}, plot {usage['plot_pyramids'] / 1e6:,.0f})")
+        self.safe_gui_update(lambda: self.memory_label.config(text=text))
+        return text
+
+    def _plot_width_px(self):
+        """Drawable width of the plot canvas in pixels."""
+        try:
+            width = self.canvas.get_tk_widget().winfo_width()
+        except Exception:
+            width = 0
+        if width <= 1:
+            width = int(self.fig.get_figwidth() * self.fig.dpi) if self.fig is not None else PLOT_DEFAULT_WIDTH_PX
+        return max(100, width)
     
     def view_dbc_messages(self):
+        self._ensure_engines()
         if cantools is None:
             messagebox.showerror(
                 "Missing Dependency",
@@ -1024,7 +3635,11 @@ class DBCDecoderGUI:
             messagebox.showerror("Error", f"Failed to load DBC file:\n{str(e)}")
             self.update_status("Error loading DBC file")
     
-    def start_decode(self):
+    def start_stream_decode(self):
+        """Decode the selected log straight into the selected export formats (bounded memory)."""
+        self.start_decode(stream=True)
+
+    def start_decode(self, stream=False):
         if self.decoding:
             # Check if decoding is actually running by checking progress bar state
             try:
@@ -1072,14 +3687,37 @@ class DBCDecoderGUI:
             messagebox.showerror("Error", f"DBC file not found:\n{dbc_file}")
             return
         
+        stream_targets = None
+        stream_options = None
+        if stream:
+            formats = self._selected_export_formats()
+            unsupported = [fmt for fmt in formats if fmt not in EXPORT_SINKS]
+            if not formats or unsupported:
+                messagebox.showwarning(
+                    "Warning",
+                    "Select one or more streamable formats in the Export tab: "
+                    + ", ".join(EXPORT_SINKS)
+                    + (f"\n\nNot streamable: {', '.join(unsupported)}" if unsupported else "")
+                )
+                return
+            stream_targets = self._ask_export_targets(formats)
+            if not stream_targets:
+                return
+            stream_options = self._export_options()
+
         # Start decoding in a separate thread
         thread = threading.Thread(target=self.decode_messages, 
-                                 args=(csv_file, dbc_file))
+                                 args=(csv_file, dbc_file, stream_targets, stream_options,
+                                       self._deep_profile_enabled()))
         thread.daemon = True
         thread.start()
     
-    def decode_messages(self, csv_file, dbc_file):
+    def decode_messages(self, csv_file, dbc_file, stream_targets=None, stream_options=None, profile=None):
+        # stream_targets ({format: path}): decode the log in batches and write each
+        # batch straight to export sinks instead of keeping the decoded table.
+        # profile: deep profiling on/off (None: from the CAN_DECODER_PROFILE env var).
         # Dependencies are optional for launching; decoding requires them.
+        load_engines()
         if pd is None or cantools is None:
             missing = []
             if pd is None:
@@ -1103,6 +3741,14 @@ class DBCDecoderGUI:
             return
 
         self.decoding = True
+        temp_plaintext = None
+        sinks = []
+        deep_profile, profile_dir = _profile_env_setting()
+        if profile is not None:
+            deep_profile = bool(profile)
+        prof = StageProfiler("decode", deep=deep_profile)
+        profile_scope = contextlib.ExitStack()
+        profile_scope.enter_context(prof.profile_thread())
         self.safe_gui_update(lambda: self.decode_button.config(state='disabled'))
         self.safe_gui_update(lambda: self.progress.start(10))
         self.safe_gui_update(lambda: self.update_status("Starting decoding..."))
@@ -1118,7 +3764,9 @@ class DBCDecoderGUI:
             # Load DBC database
             self.update_status("Loading DBC file...")
             self.append_output(f"Loading DBC file: {dbc_file}")
-            db = _load_dbc_with_fallback(dbc_file)
+            with prof.stage("load DBC") as counts:
+                db = _load_dbc_with_fallback(dbc_file)
+                counts['note'] = f"{len(db.messages)} messages"
             self.append_output(f"Loaded {len(db.messages)} message definitions")
             self.append_output("")
             
@@ -1128,6 +3776,10 @@ class DBCDecoderGUI:
             self.signal_offsets = {}  # {signal_name: offset_value} for verification
             self.signal_scales = {}  # {signal_name: scale_value} for verification
             
+            self.can_id_signals = {
+                f"0x{message.frame_id:X}": [signal.name for signal in message.signals]
+                for message in db.messages
+            }
             for message in db.messages:
                 for signal in message.signals:
                     signal_name = signal.name
@@ -1151,7 +3803,9 @@ class DBCDecoderGUI:
                 if csv_file.lower().endswith('.nxt'):
                     self.update_status("Decrypting encrypted log...")
                     self.append_output(f"Decrypting encrypted log: {csv_file}")
-                    temp_plaintext = decrypt_nxt_file(csv_file)
+                    with prof.stage("decrypt") as counts:
+                        temp_plaintext = decrypt_nxt_file(csv_file)
+                        counts['note'] = f"{os.path.getsize(temp_plaintext) / 1e6:.1f} MB plaintext"
                     input_path = temp_plaintext
                 self.update_status("Reading log file...")
                 self.append_output(f"Reading log file: {input_path}")
@@ -1167,42 +3821,57 @@ class DBCDecoderGUI:
                             kwargs["warn_bad_lines"] = True
                             return pd.read_csv(input_path, **kwargs)
                         raise
-                try:
-                    df = pd.read_csv(input_path, encoding="utf-8")
-                except (UnicodeDecodeError, ParserError):
+                prof.begin("parse CSV")
+                if stream_targets:
+                    # Bounded memory: read the log in chunks while decoding.
+                    reader = pd.read_csv(input_path, encoding="utf-8", encoding_errors="replace",
+                                         on_bad_lines="skip", chunksize=DECODE_STREAM_CHUNK_ROWS)
+                    df = next(reader, None)
+                    if df is None:
+                        raise ValueError("Log file is empty.")
+                    reader = itertools.chain([df], reader)
+                else:
                     try:
-                        df = _read_csv_with_kwargs(
-                            encoding="utf-8",
-                            engine="python",
-                            on_bad_lines="skip",
-                        )
+                        df = pd.read_csv(input_path, encoding="utf-8")
                     except (UnicodeDecodeError, ParserError):
                         try:
-                            df = pd.read_csv(input_path, encoding="latin-1")
+                            df = _read_csv_with_kwargs(
+                                encoding="utf-8",
+                                engine="python",
+                                on_bad_lines="skip",
+                            )
                         except (UnicodeDecodeError, ParserError):
                             try:
-                                df = _read_csv_with_kwargs(
-                                    encoding="latin-1",
-                                    engine="python",
-                                    on_bad_lines="skip",
-                                )
-                            except Exception:
-                                # Last-resort: replace invalid bytes before parsing
-                                import io
-                                with open(input_path, "r", encoding="utf-8", errors="replace") as fh:
-                                    df = pd.read_csv(
-                                        io.StringIO(fh.read()),
+                                df = pd.read_csv(input_path, encoding="latin-1")
+                            except (UnicodeDecodeError, ParserError):
+                                try:
+                                    df = _read_csv_with_kwargs(
+                                        encoding="latin-1",
                                         engine="python",
                                         on_bad_lines="skip",
                                     )
+                                except Exception:
+                                    # Last-resort: replace invalid bytes before parsing
+                                    import io
+                                    with open(input_path, "r", encoding="utf-8", errors="replace") as fh:
+                                        df = pd.read_csv(
+                                            io.StringIO(fh.read()),
+                                            engine="python",
+                                            on_bad_lines="skip",
+                                        )
+                prof.end(rows_out=len(df), note="first chunk" if stream_targets else None)
             finally:
-                if temp_plaintext and os.path.exists(temp_plaintext):
+                # A streamed log is still being read; it is removed once decoding ends.
+                if temp_plaintext and not stream_targets and os.path.exists(temp_plaintext):
                     try:
                         os.remove(temp_plaintext)
                     except OSError:
                         pass
 
-            self.append_output(f"Loaded {len(df)} CAN messages")
+            if stream_targets:
+                self.append_output(f"Streaming log in batches of {DECODE_STREAM_CHUNK_ROWS} rows")
+            else:
+                self.append_output(f"Loaded {len(df)} CAN messages")
             self.append_output("")
             self.append_output("Decoding messages...")
             self.append_output("-" * 80)
@@ -1254,6 +3923,8 @@ class DBCDecoderGUI:
             # Phase_current_RMS, Power_mode, SW_version, Speed, Status_feedback1, Status_feedback2,
             # Status_feedback3, Subtotal_mileage, Vendor_code, Wheel_circumference
             decoded_rows = []
+            # Wall-clock ns per decoded row when known from UnixTime (None: parsed from Date/Time text)
+            decoded_times = []
             decoded_count = 0
             error_count = 0
             all_signal_names = set()
@@ -1287,8 +3958,82 @@ class DBCDecoderGUI:
                 "Subtotal_mileage", "Vendor_code", "Wheel_circumference"
             ]
 
+            if stream_targets:
+                # Streaming: the output schema must be fixed before the first batch, so it
+                # is taken from the DBC (and pass-through columns) instead of the decoded rows.
+                dbc_signal_names = set(self.signal_units)
+                if not has_raw_data:
+                    dbc_signal_names |= {c for c in df.columns
+                                         if c not in ("Date", "Time", "Timestamp", "Microseconds", "ID", "CAN_ID", "DLC")}
+                final_cols = base_cols + sorted(dbc_signal_names - set(base_cols))
+                units_row = _build_units_row(final_cols, self.signal_units, final_cols)
+                for fmt, path in stream_targets.items():
+                    sink = EXPORT_SINKS[fmt](path, units=units_row, signal_units=self.signal_units,
+                                             options=stream_options)
+                    sinks.append(sink)
+                    sink.open(final_cols)
+                    self.append_output(f"Streaming {fmt} -> {path}")
+                self.append_output("")
+            else:
+                final_cols = list(base_cols)
+
+            input_messages = 0
+            output_rows = 0
+            stream_carry = None
+            stream_id_counts = Counter()
+            # Per-signal count/min/max/mean/std/percentiles, built batch by batch.
+            decode_stats = DecodeStatistics() if NUMPY_AVAILABLE else None
+            # Raw per-frame (ID, time, DLC, extended) columns for the bus timing analysis.
+            timing_parts = []
+            columns_in = list(df.columns)
+
+            def _flush_stream_batch():
+                nonlocal output_rows, stream_carry
+                if not decoded_rows:
+                    return
+                with prof.stage("sort / forward-fill", rows_in=len(decoded_rows)) as counts:
+                    batch, stream_carry, batch_time_ns = _finalize_decoded_rows(
+                        decoded_rows, final_cols, carry=stream_carry, stats=decode_stats, times=decoded_times)
+                    counts['rows_out'] = len(batch)
+                decoded_rows.clear()
+                decoded_times.clear()
+                if len(batch):
+                    with prof.stage("write export sinks", rows_in=len(batch)):
+                        for sink in sinks:
+                            sink.write_batch(batch, time_ns=batch_time_ns)
+                    output_rows += len(batch)
+                    stream_id_counts.update(batch["CAN_ID"].value_counts(dropna=False).to_dict())
+                self.safe_gui_update(lambda c=output_rows: self.update_status(f"Streamed {c} rows..."))
+
+            def _iter_log_rows():
+                nonlocal input_messages
+                if not stream_targets:
+                    input_messages = len(df)
+                    yield from df.iterrows()
+                    return
+                chunks = iter(reader)
+                while True:
+                    with prof.stage("parse CSV (chunks)") as counts:
+                        chunk = next(chunks, None)
+                        counts['rows_out'] = 0 if chunk is None else len(chunk)
+                    if chunk is None:
+                        return
+                    chunk.columns = columns_in
+                    input_messages += len(chunk)
+                    if NUMPY_AVAILABLE:
+                        timing_parts.append(_frame_timing_columns(chunk, db_ids))
+                    yield from chunk.iterrows()
+                    # Runs once every row of this chunk has been decoded.
+                    _flush_stream_batch()
+
+            # Bus_current correction cost, accumulated locally (one profiler entry after the loop)
+            bus_fix_seconds = 0.0
+            bus_fix_checked = 0
+            bus_fix_changed = 0
+
             # Iterate every row 1:1
-            for idx, row in df.iterrows():
+            prof.begin("DBC decode")
+            for idx, row in _iter_log_rows():
                 try:
                     if not has_raw_data:
                         # Pass-through for already-decoded files
@@ -1345,6 +4090,7 @@ class DBCDecoderGUI:
 
 
                         decoded_rows.append(row_out)
+                        decoded_times.append(None)
                         decoded_count += 1
                         continue
 
@@ -1374,17 +4120,21 @@ class DBCDecoderGUI:
 
                     # Timestamp formatting: derive from UnixTime + Microseconds when available
                     ts_formatted = ''
+                    row_time_ns = None
                     try:
                         unix_time = row.get('UnixTime', '')
                         micros_val = row.get('Microseconds', None)
                         if unix_time and not pd.isna(unix_time):
-                            from datetime import datetime
+                            from datetime import datetime, timedelta
                             unix_int = int(unix_time)
                             base_dt = datetime.fromtimestamp(unix_int)
                             if micros_val is not None and str(micros_val).strip():
                                 micros_int = int(micros_val)
                                 base_dt = base_dt.replace(microsecond=micros_int % 1_000_000)
                             ts_formatted = base_dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+                            # Canonical time axis: same local wall clock as Date/Time (not
+                            # Unix epoch, see _decoded_time_ns), full µs resolution
+                            row_time_ns = (base_dt - datetime(1970, 1, 1)) // timedelta(microseconds=1) * 1000
                         else:
                             ts_formatted = _format_timestamp_high_res(row.get('Timestamp', ''), row.get('Microseconds', None))
                     except Exception:
@@ -1404,6 +4154,8 @@ class DBCDecoderGUI:
                     except Exception:
                         decoded = {}
                     # Sanity fix for Bus_current if it is out of expected range
+                    bus_t0 = time.perf_counter()
+                    bus_before = decoded.get("Bus_current")
                     try:
                         if "Bus_current" in decoded:
                             bus_val = decoded.get("Bus_current")
@@ -1483,6 +4235,10 @@ class DBCDecoderGUI:
                                 last_bus_current = bus_float
                     except Exception:
                         pass
+                    if bus_before is not None:
+                        bus_fix_seconds += time.perf_counter() - bus_t0
+                        bus_fix_checked += 1
+                        bus_fix_changed += decoded.get("Bus_current") is not bus_before
 
 
                     # Build output row following new.csv schema
@@ -1527,6 +4283,7 @@ class DBCDecoderGUI:
                         extra_signal_cols.add(sig_name)
 
                     decoded_rows.append(row_out)
+                    decoded_times.append(row_time_ns)
                     decoded_count += 1
 
                     if decoded_count % 500 == 0:
@@ -1536,68 +4293,87 @@ class DBCDecoderGUI:
                     error_count += 1
                     if error_count <= 8:
                         self.append_output(f"ERROR processing row {idx}: {e}")
+            if bus_fix_checked:
+                prof.add("Bus_current correction", bus_fix_seconds, rows_in=bus_fix_checked,
+                         rows_out=bus_fix_changed, note="rows out = values replaced")
+            prof.end(rows_in=input_messages, rows_out=decoded_count, note=f"{error_count} errors")
 
-            if not decoded_rows:
+            if not decoded_count:
                 raise ValueError("No CAN frames were processed into decoded rows.")
 
-            final_cols = base_cols + sorted(extra_signal_cols - set(base_cols))
-            output_df = pd.DataFrame(decoded_rows, columns=final_cols).fillna("")
-
-            # Synchronize signals: forward-fill last known values to avoid blank rows
-            fill_cols = [c for c in output_df.columns if c not in ("Date", "Time", "CAN_ID")]
-            # Ensure columns exist (safe if schema changes)
-            fill_cols = [c for c in fill_cols if c in output_df.columns]
-            if fill_cols:
-                # Sort by timestamp when possible, then forward-fill
+            timing_report = None
+            if NUMPY_AVAILABLE:
+                prof.begin("bus timing analysis")
                 try:
-                    time_key = output_df["Date"].astype(str) + " " + output_df["Time"].astype(str)
-                    output_df["_time_key"] = pd.to_datetime(time_key, errors="coerce")
-                    output_df = output_df.sort_values(by=["_time_key"], kind="stable")
-                except Exception:
-                    pass
-                output_df[fill_cols] = output_df[fill_cols].replace("", pd.NA).ffill()
-                # Drop rows that still have no signal data after fill
-                mask = output_df[fill_cols].isna().all(axis=1)
-                output_df = output_df[~mask].copy()
-                if "_time_key" in output_df.columns:
-                    output_df = output_df.drop(columns=["_time_key"])
-                # Replace any remaining missing values with 0 for signal columns
-                output_df[fill_cols] = output_df[fill_cols].fillna(0).replace("", 0)
-            raw_df = output_df.copy()
-
-            # Units row for CSV/TXT exports
-            units_row = {c: "" for c in output_df.columns}
-            units_row["LinearAccelX"] = "m/s^2"
-            units_row["LinearAccelY"] = "m/s^2"
-            units_row["LinearAccelZ"] = "m/s^2"
-            units_row["Gravity"] = "m/s^2"
-            units_row["GPS_Lat"] = "deg"
-            units_row["GPS_Lon"] = "deg"
-            units_row["GPS_Alt"] = "m"
-            units_row["GPS_Speed"] = "km/h"
-            units_row["GPS_Course"] = "deg"
-            units_row["GPS_Sats"] = "count"
-            units_row["GPS_HDOP"] = "unitless"
-            units_row["GPS_Time"] = "UTC"
-            for name in all_signal_names:
-                if name in self.signal_units:
-                    units_row[name] = self.signal_units.get(name, "")
+                    if not stream_targets:
+                        timing_parts.append(_frame_timing_columns(df, db_ids))
+                    timing_report = _frame_timing_analysis(
+                        *(np.concatenate(cols) for cols in zip(*timing_parts)))
+                except Exception as e:
+                    self.append_output(f"Bus timing analysis skipped: {e}")
+                timing_parts = None
+                prof.end(rows_in=input_messages)
+
+            if stream_targets:
+                with prof.stage("close export sinks"):
+                    for sink in sinks:
+                        sink.close()
+                self._plot_cache = None
+                output_df = None
+                raw_df = None
+                output_time_ns = None
+                output_columns = final_cols
+            else:
+                final_cols = base_cols + sorted(extra_signal_cols - set(base_cols))
+                with prof.stage("sort / forward-fill", rows_in=len(decoded_rows)) as counts:
+                    output_df, _, output_time_ns = _finalize_decoded_rows(decoded_rows, final_cols, stats=decode_stats,
+                                                                          times=decoded_times)
+                    counts['rows_out'] = len(output_df)
+                # The decoded table is never modified after this point, so the "raw" table
+                # (XLSX per-ID sheets) shares it instead of holding a second copy.
+                raw_df = output_df
+                output_rows = len(output_df)
+                output_columns = list(output_df.columns)
+
+                # Units row for CSV/TXT exports
+                units_row = _build_units_row(output_columns, self.signal_units, all_signal_names)
+
+                # Plot cache for the Signal Values plot; each signal's level-of-detail
+                # pyramid (zoom / pan) is built when it is first plotted.
+                x = output_time_ns.view('datetime64[ns]') if (output_time_ns != NAT_NS).any() else None
+                self._plot_cache = self._build_plot_cache(output_df, x)
             self.decoded_units_row = units_row
+            try:
+                dbc_sha256 = _file_sha256(dbc_file)
+            except OSError:
+                dbc_sha256 = ""
+            self.decode_provenance = {
+                'decoder': Path(__file__).name,
+                'log_file': str(csv_file),
+                'dbc_file': str(dbc_file),
+                'dbc_sha256': dbc_sha256,
+                'dbc_messages': len(db.messages),
+                'can_id_signals': self.can_id_signals,
+                'input_messages': input_messages,
+                'decoded_count': decoded_count,
+                'error_count': error_count,
+                'success_rate': (decoded_count / input_messages * 100) if input_messages > 0 else 0,
+            }
 
             # Display decoding results
             self.append_output("")
             self.append_output("=" * 80)
             self.append_output("DECODING COMPLETE - ALL MESSAGES PRESERVED")
             self.append_output("=" * 80)
-            self.append_output(f"Input messages: {len(df)}")
-            self.append_output(f"Output rows: {len(output_df)} (1:1 with input frames)")
+            self.append_output(f"Input messages: {input_messages}")
+            self.append_output(f"Output rows: {output_rows} (1:1 with input frames)")
             self.append_output(f"Successfully decoded: {decoded_count}")
             self.append_output(f"Errors: {error_count}")
-            self.append_output(f"Columns: {len(output_df.columns)}")
+            self.append_output(f"Columns: {len(output_columns)}")
             # Compute unique CAN IDs from CAN_ID column
             try:
                 uniq_ids = set()
-                for cid in output_df.get("CAN_ID", []):
+                for cid in (stream_id_counts if stream_targets else output_df.get("CAN_ID", [])):
                     if isinstance(cid, str) and cid.startswith("0x"):
                         try:
                             uniq_ids.add(int(cid, 16))
@@ -1607,56 +4383,96 @@ class DBCDecoderGUI:
             except Exception:
                 self.append_output("Unique CAN IDs: (unable to compute)")
             self.append_output(f"Unique signals: {len(all_signal_names)}")
+            if timing_report:
+                self.append_output(f"Bus load: {timing_report['bus_load_pct']:.1f}% of "
+                                   f"{timing_report['bitrate'] // 1000} kbit/s over {timing_report['duration_s']:.1f} s; "
+                                   f"logger gaps: {timing_report['bus_gap_count']}; "
+                                   f"estimated dropped frames: {sum(r['dropped_est'] for r in timing_report['ids'])}")
             self.append_output("")
             
             # Statistics for display
-            try:
-                can_id_distribution = output_df['CAN_ID'].value_counts(dropna=False).to_dict()
-            except Exception:
-                can_id_distribution = {cid: 0 for cid in set(output_df.get('CAN_ID', []))}
+            if stream_targets:
+                can_id_distribution = dict(stream_id_counts)
+            else:
+                try:
+                    can_id_distribution = output_df['CAN_ID'].value_counts(dropna=False).to_dict()
+                except Exception:
+                    can_id_distribution = {cid: 0 for cid in set(output_df.get('CAN_ID', []))}
             self.stats_data = {
-                'total_messages': len(df),
+                'total_messages': input_messages,
                 'decoded_count': decoded_count,
                 'error_count': error_count,
-                'success_rate': (decoded_count/len(df)*100) if len(df) > 0 else 0,
+                'success_rate': (decoded_count/input_messages*100) if input_messages > 0 else 0,
                 'unique_signals': len(all_signal_names),
-                'total_rows': len(output_df),
+                'total_rows': output_rows,
                 'can_id_distribution': can_id_distribution,
+                'signal_stats': decode_stats.summary() if decode_stats is not None else [],
+                'timing': timing_report,
             }
+            self.decode_statistics = decode_stats
+            if stream_targets:
+                self.append_output("Streamed export written to:")
+                for sink in sinks:
+                    self.append_output(f"  {sink.filename} ({sink.rows_written} rows)")
+                self.append_output("The decoded table was not kept in memory; decode normally to plot it.")
+                self.append_output("")
             
             # Store decoded data
             self.decoded_df = output_df
+            self.decoded_time_ns = output_time_ns
             self.raw_df = raw_df
             self.all_signal_names = all_signal_names
+            with prof.stage("memory accounting", rows_in=output_rows):
+                memory_text = self._update_memory_readout()
+            if memory_text:
+                self.append_output(memory_text)
+
+            profile_scope.close()
+            prof.finish()
+            prof.context.update(log_file=str(csv_file), dbc_file=str(dbc_file), streaming=bool(stream_targets),
+                                input_messages=input_messages, output_rows=output_rows)
+            self._report_profile(prof, profile_dir or str(Path(csv_file).resolve().parent), Path(csv_file).stem)
+            self.decode_profile = prof
 
             # Update statistics display
             self.update_statistics_display()
+            self.safe_gui_update(self._refresh_plot_signals)
             
             # Show success message
             self.safe_gui_update(lambda: messagebox.showinfo("Success", 
                               f"Decoding complete!\n\n"
-                              f"Input: {len(df)} messages\n"
-                              f"Output: {len(output_df)} rows (synchronized cycles)\n"
-                              f"Success rate: {(decoded_count/len(df)*100):.1f}%\n"
+                              f"Input: {input_messages} messages\n"
+                              f"Output: {output_rows} rows (synchronized cycles)\n"
+                              f"Success rate: {(decoded_count/input_messages*100):.1f}%\n"
                               f"Unique CAN IDs: (see output log)\n"
                               f"Unique signals: {len(all_signal_names)}\n\n"
                               f"Synchronized rows created and signals decoded via DBC scaling."))
             
-            self.safe_gui_update(lambda: self.update_status(f"Decoding complete! {len(output_df)} rows ready"))
+            self.safe_gui_update(lambda: self.update_status(f"Decoding complete! {output_rows} rows ready"))
             
         except Exception as e:
             import traceback
+            for sink in sinks:
+                sink.abort()
             error_msg = f"Error during decoding:\n{str(e)}\n\n{traceback.format_exc()}"
             self.append_output("")
             self.append_output("ERROR: " + error_msg)
             self.safe_gui_update(lambda: messagebox.showerror("Error", error_msg))
         finally:
+            profile_scope.close()
+            prof.finish()
+            if stream_targets and temp_plaintext and os.path.exists(temp_plaintext):
+                try:
+                    os.remove(temp_plaintext)
+                except OSError:
+                    pass
             self.decoding = False
             self.safe_gui_update(lambda: self.decode_button.config(state='normal'))
             self.safe_gui_update(lambda: self.progress.stop())
     
     def generate_plot(self):
         """Generate visualization plot"""
+        self._ensure_engines()
         try:
             import matplotlib.pyplot as plt
             MATPLOTLIB_AVAILABLE = True
@@ -1672,6 +4488,7 @@ class DBCDecoderGUI:
             return
         
         plot_type = self.plot_type_var.get()
+        plot_info = None
         self.fig.clear()
         ax = self.fig.add_subplot(111)
         ax.set_facecolor('white')
@@ -1714,20 +4531,20 @@ class DBCDecoderGUI:
             ax.set_title("Data Processing Summary")
 
         elif plot_type == "Message Rate":
-            t = self._get_timestamp_series(self.decoded_df)
+            t = self._decoded_time_axis()
             if t is None:
                 ax.text(0.5, 0.5, 'No timestamps available for rate plot.', 
                         ha='center', va='center', transform=ax.transAxes)
                 ax.set_title("Message Rate (per second)")
             else:
-                t = t.dropna()
-                if t.empty:
+                t = t[~np.isnat(t)]
+                if not len(t):
                     ax.text(0.5, 0.5, 'No valid timestamps available.', 
                             ha='center', va='center', transform=ax.transAxes)
                     ax.set_title("Message Rate (per second)")
                 else:
-                    rate = t.dt.floor('S').value_counts().sort_index()
-                    ax.plot(rate.index, rate.values, color=self.colors['accent'], linewidth=1.5)
+                    seconds, counts = np.unique(t.astype('datetime64[s]'), return_counts=True)
+                    ax.plot(seconds, counts, color=self.colors['accent'], linewidth=1.5)
                     ax.set_xlabel("Time")
                     ax.set_ylabel("Messages/sec")
                     ax.set_title("Message Rate (per second)")
@@ -1739,47 +4556,101 @@ class DBCDecoderGUI:
                        ha='center', va='center', transform=ax.transAxes)
                 ax.set_title("Signal Values")
             else:
-                sig = None
-                excluded = {
-                    'Date', 'Time', 'Timestamp', 'timestamps',
-                    'UnixTime', 'Microseconds', 'ID', 'CAN_ID',
-                    'Extended', 'RTR', 'DLC'
-                }
-                for col in self.decoded_df.columns:
-                    if col in excluded or col.startswith('Data'):
-                        continue
-                    series = pd.to_numeric(self.decoded_df[col], errors='coerce')
-                    if series.notna().any():
-                        sig = col
-                        break
+                started = time.perf_counter()
+                listbox = getattr(self, 'plot_signal_list', None)
+                selected = [listbox.get(i) for i in listbox.curselection()] if listbox is not None else []
+                if not selected:
+                    # Nothing picked: fall back to the first numeric signal
+                    for col in self._plot_signal_columns(self.decoded_df):
+                        if len(self._plot_pyramids([col])[1][col]):
+                            selected = [col]
+                            break
+                has_time, pyramids = self._plot_pyramids(selected)
+                pyramids = {c: p for c, p in pyramids.items() if len(p)}
 
-                if not sig:
+                if not pyramids:
                     ax.text(0.5, 0.5, 'No numeric signal columns available.',
                             ha='center', va='center', transform=ax.transAxes)
                     ax.set_title("Signal Values")
                 else:
-                    t = self._get_timestamp_series(self.decoded_df)
-                    if t is None:
-                        x = list(range(len(self.decoded_df)))
-                        x_label = "Sample #"
+                    width_px = self._plot_width_px()
+                    mode = self.plot_decimation_var.get() if hasattr(self, 'plot_decimation_var') else "Min/Max"
+                    units = self.signal_units if isinstance(self.signal_units, dict) else {}
+                    traces = []
+                    drawn = block = 0
+                    for n, (sig, pyramid) in enumerate(pyramids.items()):
+                        xs, ys, b = pyramid.window(width_px=width_px, mode=mode)
+                        unit = units.get(sig, '')
+                        line, = ax.plot(xs, ys,
+                                        color=self.colors['accent'] if n == 0 else None,
+                                        linewidth=1.2 if len(pyramids) == 1 else 1.0,
+                                        label=f"{sig} ({unit})" if unit else sig)
+                        traces.append((line, pyramid))
+                        drawn += len(ys)
+                        block = max(block, b)
+                    ax.set_xlabel("Time" if has_time else "Sample #")
+                    if len(pyramids) == 1:
+                        sig = next(iter(pyramids))
+                        unit = units.get(sig, '')
+                        ax.set_ylabel(f"{sig} {f'({unit})' if unit else ''}")
+                        ax.set_title(f"{sig} vs Time")
                     else:
-                        x = t
-                        x_label = "Time"
-
-                    y_raw = self.decoded_df[sig]
-                    y = pd.to_numeric(y_raw, errors='coerce')
-                    ax.plot(x, y, color=self.colors['accent'], linewidth=1.2)
-                    unit = ''
-                    try:
-                        unit = self.signal_units.get(sig, '')
-                    except Exception:
-                        unit = ''
-                    ax.set_xlabel(x_label)
-                    ax.set_ylabel(f"{sig} {f'({unit})' if unit else ''}")
-                    ax.set_title(f"{sig} vs Time")
+                        ax.legend(loc='upper right', fontsize=8)
+                        ax.set_title(f"{len(pyramids)} signals vs Time")
+                    if has_time:
+                        plt.setp(ax.xaxis.get_majorticklabels(), rotation=30, ha='right')
+                    # Zoom / pan refetch each trace from its pyramid for the visible range.
+                    self._plot_view = {'ax': ax, 'traces': traces, 'has_time': has_time,
+                                       'mode': mode, 'width_px': width_px}
+                    ax.callbacks.connect('xlim_changed', self._on_plot_xlim_changed)
+                    plot_info = self._plot_info_text(drawn, block)
         
+        if plot_info is None:
+            self._plot_view = None
         self.fig.tight_layout()
         self.canvas.draw()
+        if hasattr(self, 'plot_info_label'):
+            if plot_info:
+                plot_info += f"\nredrawn in {(time.perf_counter() - started) * 1000:.0f} ms"
+            self.plot_info_label.config(text=plot_info or "")
+
+    def _plot_info_text(self, drawn, block):
+        view = self._plot_view
+        total = sum(len(p) for _, p in view['traces'])
+        level = "raw samples" if block <= 1 else f"min/max of {block:,}-sample blocks"
+        return (f"{drawn:,} of {total:,} points drawn ({view['mode']}, {level}, "
+                f"{view['width_px']} px)")
+
+    def _on_plot_xlim_changed(self, ax):
+        """Zoom / pan on the Signal Values plot: redraw each trace from the right pyramid level."""
+        view = getattr(self, '_plot_view', None)
+        if not view or view['ax'] is not ax:
+            return
+        started = time.perf_counter()
+        lo, hi = ax.get_xlim()
+        if view['has_time']:
+            lo, hi = _mpl_datenum_to_ns(lo), _mpl_datenum_to_ns(hi)
+        drawn = block = 0
+        for line, pyramid in view['traces']:
+            xs, ys, b = pyramid.window(lo, hi, view['width_px'], view['mode'])
+            line.set_data(xs, ys)
+            drawn += len(ys)
+            block = max(block, b)
+        self.canvas.draw_idle()
+        if hasattr(self, 'plot_info_label'):
+            self.plot_info_label.config(
+                text=self._plot_info_text(drawn, block)
+                + f"\nwindow fetched in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def _on_plot_scroll(self, event):
+        """Mouse wheel over the Signal Values plot zooms the time axis around the cursor."""
+        view = getattr(self, '_plot_view', None)
+        if not view or event.inaxes is not view['ax'] or event.xdata is None:
+            return
+        factor = 0.8 if event.button == 'up' else 1.25
+        x0, x1 = view['ax'].get_xlim()
+        c = event.xdata
+        view['ax'].set_xlim(c - (c - x0) * factor, c + (x1 - c) * factor)
     
     def update_statistics_display(self):
         """Update statistics tab with comprehensive data analysis"""
@@ -1799,10 +4670,26 @@ class DBCDecoderGUI:
             wrap=tk.WORD,
             bg=self.colors['bg_input'],
             fg=self.colors['text'],
-            font=('Segoe UI', 10),
+            font=('Consolas', 10),
             relief=tk.FLAT,
             borderwidth=1
         )
+        timing = self.stats_data.get('timing')
+        if timing:
+            toolbar = tk.Frame(self.stats_frame, bg=self.colors['bg_main'])
+            toolbar.pack(fill=tk.X, padx=10, pady=(10, 0))
+            tk.Button(toolbar,
+                      text="💾 Export Timing Report",
+                      font=("Segoe UI", 9, "bold"),
+                      bg=self.colors['button'],
+                      fg='white',
+                      activebackground=self.colors['button_hover'],
+                      relief=tk.FLAT,
+                      padx=15,
+                      pady=4,
+                      cursor='hand2',
+                      bd=0,
+                      command=self.export_timing_report).pack(side=tk.RIGHT)
         stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Generate statistics text
@@ -1823,425 +4710,439 @@ CAN ID Distribution:
 """
         for can_id, count in sorted(self.stats_data.get('can_id_distribution', {}).items()):
             stats_content += f"  {can_id}: {count} messages\n"
+
+        if timing:
+            stats_content += f"""
+BUS TIMING (gap = interval > {timing['gap_factor']:g} x period; load excludes stuff bits)
+{'-' * 80}
+Frames: {timing['frames']}   Duration: {timing['duration_s']:.1f} s   Bus load: {timing['bus_load_pct']:.2f}% of {timing['bitrate'] // 1000} kbit/s
+Logger gaps (no frame on any ID): {timing['bus_gap_count']}
+
+{'CAN ID':<12}{'Frames':>9}{'Rate Hz':>10}{'Period ms':>11}{'Jit50 ms':>10}{'Jit95 ms':>10}{'Jit99 ms':>10}{'Max ms':>10}{'Gaps':>6}{'Dropped':>9}{'Load %':>8}
+"""
+            for r in timing['ids']:
+                stats_content += (f"{r['can_id']:<12}{r['frames']:>9}{r['rate_hz']:>10.2f}{r['period_ms']:>11.3f}"
+                                  f"{r['jitter_p50_ms']:>10.3f}{r['jitter_p95_ms']:>10.3f}{r['jitter_p99_ms']:>10.3f}"
+                                  f"{r['max_interval_ms']:>10.1f}{r['gaps']:>6}{r['dropped_est']:>9}{r['load_pct']:>8.2f}\n")
+            if timing['bus_gaps']:
+                stats_content += "\nLongest logger gaps:\n"
+                for g in timing['bus_gaps']:
+                    stats_content += f"  {_format_ns_local(g['start_ns'])}  {g['length_ms']:.1f} ms\n"
+            if timing['gaps']:
+                stats_content += "\nLongest per-ID gaps:\n"
+                for g in timing['gaps']:
+                    stats_content += (f"  {g['can_id']:<12}{_format_ns_local(g['start_ns'])}  {g['length_ms']:.1f} ms "
+                                      f"(period {g['period_ms']:.2f} ms)\n")
+
+        signal_stats = self.stats_data.get('signal_stats') or []
+        if signal_stats:
+            stats_content += f"""
+SIGNAL STATISTICS (decoded samples, percentiles approximate)
+{'-' * 80}
+{'Signal':<24}{'Count':>9}{'Min':>11}{'Max':>11}{'Mean':>11}{'Std':>11}{'P50':>11}{'P95':>11}{'P99':>11}
+"""
+            for st in signal_stats:
+                stats_content += (f"{str(st['signal'])[:23]:<24}{st['count']:>9}"
+                                  + "".join(f"{st[k]:>11.4g}" for k in ('min', 'max', 'mean', 'std', 'p50', 'p95', 'p99'))
+                                  + "\n")
         
         stats_text.insert('1.0', stats_content)
         stats_text.config(state='disabled')
     
+    def export_timing_report(self):
+        """Save the bus timing analysis: per-ID table as CSV, or the full report as JSON."""
+        timing = (getattr(self, 'stats_data', None) or {}).get('timing')
+        if not timing:
+            messagebox.showwarning("Warning", "No timing analysis available. Please decode a log first.")
+            return
+        filename = filedialog.asksaveasfilename(
+            title="Save Bus Timing Report",
+            defaultextension=".csv",
+            filetypes=[("CSV (per CAN ID)", "*.csv"), ("JSON (full report)", "*.json"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        try:
+            if filename.lower().endswith(".json"):
+                report = dict(timing)
+                # NaN (IDs seen once have no period) is not valid JSON.
+                report['ids'] = [{k: (None if isinstance(v, float) and math.isnan(v) else v) for k, v in r.items()}
+                                 for r in timing['ids']]
+                for key in ('gaps', 'bus_gaps'):
+                    report[key] = [dict(g, start=_format_ns_local(g['start_ns'])) for g in timing[key]]
+                with open(filename, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2, default=_json_default)
+            else:
+                pd.DataFrame(timing['ids']).to_csv(filename, index=False)
+            self.update_status(f"Timing report saved: {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save timing report:\n{e}")
+
+    def _selected_export_formats(self):
+        """Formats selected in the export list (keeps list order)."""
+        try:
+            picked = [self.export_format_list.get(i) for i in self.export_format_list.curselection()]
+        except Exception:
+            picked = []
+        return picked
+
+    def _ask_export_target(self, export_format):
+        """Ask where to save a single export; returns a path or '' if cancelled."""
+        spec = EXPORT_FORMATS[export_format]
+        if spec.get("directory"):
+            return filedialog.askdirectory(title=spec["title"])
+        return filedialog.asksaveasfilename(
+            title=spec["title"],
+            defaultextension=spec["ext"],
+            filetypes=spec["filetypes"] + [("All files", "*.*")]
+        )
+
     def export_decoded_data(self):
-        """Export decoded data to various formats"""
+        """Export decoded data to one or more formats (several run concurrently)"""
         if self.decoded_df is None or self.decoded_df.empty:
             messagebox.showwarning("Warning", "No decoded data to export. Please decode messages first.")
             return
+        if pd is None:
+            messagebox.showerror("Error", "pandas is required for exporting data.")
+            return
+        if getattr(self, 'export_running', False):
+            messagebox.showinfo("Info", "An export is already running.")
+            return
 
-        try:
-            if pd is None:
-                messagebox.showerror("Error", "pandas is required for exporting data.")
+        formats = self._selected_export_formats()
+        if not formats:
+            messagebox.showwarning("Warning", "Select at least one export format.")
+            return
+
+        # Pick targets up front on the main thread; workers never touch Tk.
+        targets = self._ask_export_targets(formats)
+        if not targets:
+            return
+
+        profiler = StageProfiler("export", deep=self._deep_profile_enabled())
+        data = SharedExportData(
+            self.decoded_df,
+            raw_df=getattr(self, 'raw_df', None),
+            units=getattr(self, 'decoded_units_row', None),
+            signal_units=dict(getattr(self, 'signal_units', {}) or {}),
+            provenance=getattr(self, 'decode_provenance', None),
+            can_id_signals=getattr(self, 'can_id_signals', None),
+            options=self._export_options(),
+            time_ns=getattr(self, 'decoded_time_ns', None),
+            profiler=profiler,
+        )
+        self._run_exports(data, targets)
+
+    def _ask_export_targets(self, formats):
+        """Ask for output paths: one dialog for a single format, else one base name for all."""
+        targets = {}
+        if len(formats) == 1:
+            target = self._ask_export_target(formats[0])
+            if not target:
+                return {}
+            targets[formats[0]] = target
+            return targets
+        base = filedialog.asksaveasfilename(
+            title=f"Base name for {len(formats)} exports (extension is added per format)",
+            filetypes=[("All files", "*.*")]
+        )
+        if not base:
+            return {}
+        stem = str(Path(base).with_suffix("")) if Path(base).suffix.lower() in EXPORT_EXTENSIONS else base
+        for fmt in formats:
+            spec = EXPORT_FORMATS[fmt]
+            targets[fmt] = stem + ("_dataset" if spec.get("directory") else spec["ext"])
+        return targets
+
+    def _export_options(self):
+        return {
+            'ndjson_drop_nulls': self.ndjson_drop_nulls_var.get(),
+            'ndjson_drop_repeats': self.ndjson_drop_repeats_var.get(),
+            'arrow_compression': self.arrow_compression_var.get(),
+        }
+
+    def _run_exports(self, data, targets):
+        """
+        Run the selected exports on background workers over one shared, read-only table.
+
+        Progress (rows written, bytes on disk) is polled from the Tk thread; job
+        completion and the final result are delivered through the GUI queue.
+        Cancelling stops every writer at its next chunk and removes partial output.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.export_running = True
+        self.export_cancel_event = threading.Event()
+        jobs = {fmt: ExportJob(fmt, target, self.export_cancel_event) for fmt, target in targets.items()}
+        self.export_jobs = jobs
+        total_rows = len(data.df)
+        started = time.perf_counter()
+        remaining = [len(jobs)]
+        if data.profiler is None:
+            data.profiler = StageProfiler("export", deep=self._deep_profile_enabled())
+        profiler = data.profiler
+
+        def _job(job):
+            job.status = 'running'
+            t0 = time.perf_counter()
+            profiler.begin(f"export {job.format}")
+            try:
+                with profiler.profile_thread():
+                    job.check()
+                    self._export_writer(job.format)(data, job.target, job)
+                    job.check()
+                job.status = 'done'
+            except ExportCancelled:
+                job.status = 'cancelled'
+            except ImportError as e:
+                job.status = 'failed'
+                job.error = f"{e}\n{EXPORT_FORMATS[job.format].get('requires', '')}".strip()
+            except Exception as e:
+                job.status = 'cancelled' if job.cancelled else 'failed'
+                job.error = str(e)
+            finally:
+                job.elapsed = time.perf_counter() - t0
+                profiler.end(rows_in=total_rows, rows_out=job.rows_written,
+                             note=f"{job.status}, {job.bytes_out() / 1e6:.1f} MB")
+                if job.status != 'done':
+                    job.remove_partial()
+                self.safe_gui_update(_job_finished)
+
+        def _job_finished():
+            remaining[0] -= 1
+            self._show_export_progress(jobs, total_rows)
+            if remaining[0] == 0:
+                _finish()
+
+        def _poll():
+            if not self.export_running:
                 return
-            # Get export format from user
-            export_format = self.export_format_var.get()
-            
-            # Helper: dataframe used for exports (optionally with units row for text formats)
-            export_df = self.decoded_df.copy()
-
-            # Excel cannot handle certain control characters in cell values.
-            illegal_re = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
-            def _sanitize_excel_value(value):
-                if isinstance(value, str):
-                    return illegal_re.sub("", value)
-                return value
-            def _sanitize_excel_df(df):
-                cleaned = df.copy()
-                for col in cleaned.columns:
-                    if cleaned[col].dtype == object:
-                        cleaned[col] = cleaned[col].map(_sanitize_excel_value)
-                return cleaned
-
-            if export_format == "CSV":
-                filename = filedialog.asksaveasfilename(
-                    title="Save Decoded Data as CSV",
-                    defaultextension=".csv",
-                    filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-                )
-                if filename:
-                    # Write header + units row (like `23-01.csv`) + data rows
-                    with open(filename, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow(list(export_df.columns))
-                        units = getattr(self, 'decoded_units_row', None)
-                        if isinstance(units, dict):
-                            writer.writerow([units.get(c, '') for c in export_df.columns])
-                        for _, r in export_df.iterrows():
-                            writer.writerow([r.get(c, '') for c in export_df.columns])
-                    messagebox.showinfo("Success", f"Data exported to {filename}")
-                    self.update_status(f"Exported to {filename}")
-            elif export_format == "XLSX":
-                try:
-                    filename = filedialog.asksaveasfilename(
-                        title="Save Decoded Data as Excel (.xlsx)",
-                        defaultextension=".xlsx",
-                        filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
-                    )
-                    if filename:
-                        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                            safe_df = _sanitize_excel_df(export_df)
-                            base_df = self.raw_df.copy() if getattr(self, 'raw_df', None) is not None else export_df
-                            safe_base = _sanitize_excel_df(base_df)
-                            units = getattr(self, 'decoded_units_row', None)
-                            safe_units = None
-                            if isinstance(units, dict):
-                                safe_units = {k: _sanitize_excel_value(v) for k, v in units.items()}
-            
-                            def _safe_sheet_name(name, used):
-                                base = re.sub(r"[\\/?*\[\]:]", "_", str(name)).strip()
-                                if not base:
-                                    base = "Unknown"
-                                base = base[:31]
-                                candidate = base
-                                i = 2
-                                while candidate in used:
-                                    suffix = f"_{i}"
-                                    candidate = base[:31 - len(suffix)] + suffix
-                                    i += 1
-                                used.add(candidate)
-                                return candidate
-            
-                            used_names = set()
-                            if "CAN_ID" in safe_base.columns:
-                                id_series = safe_base["CAN_ID"].fillna("").astype(str)
-                                for can_id in id_series.unique():
-                                    if can_id == "":
-                                        can_id = "Unknown"
-                                    df_id = safe_base[id_series == can_id]
-                                    cols_keep = []
-                                    for col in df_id.columns:
-                                        if col in ("Date", "Time", "CAN_ID"):
-                                            cols_keep.append(col)
-                                            continue
-                                        series = df_id[col]
-                                        if series.replace("", pd.NA).isna().all():
-                                            continue
-                                        cols_keep.append(col)
-                                    df_id = df_id[cols_keep]
-                                    sheet_name = _safe_sheet_name(can_id, used_names)
-                                    df_id.to_excel(writer, index=False, sheet_name=sheet_name)
-                            else:
-                                data_name = _safe_sheet_name("data", used_names)
-                                safe_base.to_excel(writer, index=False, sheet_name=data_name)
-            
-                            # Combined sheet with all IDs
-                            all_name = _safe_sheet_name("ALL_IDS", used_names)
-                            safe_df.to_excel(writer, index=False, sheet_name=all_name)
-            
-                            if safe_units is not None:
-                                units_name = _safe_sheet_name("units", used_names)
-                                pd.DataFrame([safe_units]).to_excel(writer, index=False, sheet_name=units_name)
-                        messagebox.showinfo("Success", f"Data exported to {filename}")
-                        self.update_status(f"Exported to {filename}")
-                except ImportError:
-                    messagebox.showerror("Error", "XLSX export requires openpyxl. Install with: pip install openpyxl")
+            self._show_export_progress(jobs, total_rows)
+            self.root.after(250, _poll)
 
+        def _finish():
+            self.export_running = False
+            self._set_export_cancel_enabled(False)
+            total = time.perf_counter() - started
+            ok = [fmt for fmt, job in jobs.items() if job.status == 'done']
+            cancelled = [fmt for fmt, job in jobs.items() if job.status == 'cancelled']
+            failed = [fmt for fmt, job in jobs.items() if job.status == 'failed']
+            self.append_output(f"\nExport finished in {total:.2f} s: {', '.join(ok) or 'none'}")
+            self.append_output(f"  Rows: {total_rows}")
+            self.append_output(f"  Columns: {len(data.df.columns)}")
+            for fmt, job in jobs.items():
+                self.append_output(f"  {fmt:<16} {job.status:<9} {job.elapsed or 0:7.2f} s  "
+                                   f"{job.bytes_out() / 1e6:8.2f} MB  {job.target}")
+            if cancelled:
+                self.append_output(f"  Cancelled (partial files removed): {', '.join(cancelled)}")
+            profiler.finish()
+            profiler.context.update(rows=total_rows, columns=len(data.df.columns),
+                                    targets={fmt: job.target for fmt, job in jobs.items()})
+            first_target = Path(next(iter(jobs.values())).target)
+            self._report_profile(profiler, _profile_env_setting()[1] or str(first_target.resolve().parent),
+                                 first_target.stem)
+            if failed:
+                details = "\n\n".join(f"{fmt}: {jobs[fmt].error}" for fmt in failed)
+                messagebox.showerror("Error", f"Export failed for {', '.join(failed)}:\n\n{details}")
+            if ok:
+                messagebox.showinfo("Success", "Data exported to:\n" + "\n".join(jobs[f].target for f in ok))
+                self.update_status(f"Exported {', '.join(ok)} in {total:.1f} s")
+            elif cancelled:
+                self.update_status("Export cancelled")
+            else:
+                self.update_status("Export failed")
 
-            
-            elif export_format == "MAT":
-                try:
-                    import scipy.io
-                    filename = filedialog.asksaveasfilename(
-                        title="Save Decoded Data as MATLAB (.mat)",
-                        defaultextension=".mat",
-                        filetypes=[("MATLAB files", "*.mat"), ("All files", "*.*")]
-                    )
-                    if filename:
-                        # Convert DataFrame to dictionary for MATLAB
-                        mat_data = {}
-                        for col in export_df.columns:
-                            mat_data[col] = export_df[col].values
-                        scipy.io.savemat(filename, mat_data)
-                        messagebox.showinfo("Success", f"Data exported to {filename}")
-                        self.update_status(f"Exported to {filename}")
-                except ImportError:
-                    messagebox.showerror("Error", "scipy library not installed. Please install it using: pip install scipy")
-            
-            elif export_format == "SQLITE":
-                try:
-                    import sqlite3
-                    filename = filedialog.asksaveasfilename(
-                        title="Save Decoded Data as SQLite Database",
-                        defaultextension=".db",
-                        filetypes=[("SQLite files", "*.db"), ("All files", "*.*")]
-                    )
-                    if filename:
-                        conn = sqlite3.connect(filename)
-                        export_df.to_sql('decoded_data', conn, if_exists='replace', index=False)
-                        conn.close()
-                        messagebox.showinfo("Success", f"Data exported to {filename}")
-                        self.update_status(f"Exported to {filename}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to export to SQLite: {str(e)}")
-            elif export_format in ("MF4", "MDF"):
-                try:
-                    from asammdf import MDF, Signal  # type: ignore
-                    if not NUMPY_AVAILABLE:
-                        raise ImportError("numpy not installed")
-                    filename = filedialog.asksaveasfilename(
-                        title=f"Save Decoded Data as {export_format}",
-                        defaultextension=(".mf4" if export_format == "MF4" else ".mdf"),
-                        filetypes=[("MDF files", "*.mf4;*.mdf"), ("All files", "*.*")]
-                    )
-                    if filename:
-                        export_df_ts = self.decoded_df.copy()
-                        # Ensure numeric UnixTime/Microseconds if present
-                        if "UnixTime" in export_df_ts.columns:
-                            export_df_ts["UnixTime"] = pd.to_numeric(export_df_ts["UnixTime"], errors="coerce").fillna(0)
-                        if "Microseconds" in export_df_ts.columns:
-                            export_df_ts["Microseconds"] = pd.to_numeric(export_df_ts["Microseconds"], errors="coerce").fillna(0)
-
-                        def build_time_seconds(df):
-                            # Prefer UnixTime + Microseconds when available (as per MDF corrections)
-                            if "UnixTime" in df.columns:
-                                unix = pd.to_numeric(df["UnixTime"], errors="coerce").fillna(0)
-                                if "Microseconds" in df.columns:
-                                    micro = pd.to_numeric(df["Microseconds"], errors="coerce").fillna(0)
-                                else:
-                                    micro = pd.Series(0, index=df.index)
-                                if (unix != 0).any() or (micro != 0).any():
-                                    unix = unix.fillna(method="ffill").fillna(0).astype(float)
-                                    micro = micro.fillna(0).astype(float)
-                                    return (unix + (micro / 1e6)).to_numpy()
-                            # Fallback to timestamps/Date/Time columns
-                            if "timestamps" in df.columns:
-                                t = pd.to_datetime(df["timestamps"], errors="coerce")
-                            elif "Date" in df.columns and "Time" in df.columns:
-                                t = pd.to_datetime(
-                                    df["Date"].astype(str) + " " + df["Time"].astype(str),
-                                    errors="coerce",
-                                )
-                            elif "Timestamp" in df.columns:
-                                t = pd.to_datetime(df["Timestamp"], errors="coerce")
-                            else:
-                                t = None
-
-                            if t is None or t.isna().all():
-                                return (pd.Series(range(len(df))) * 0.0).to_numpy()
-                            t = t.fillna(method="ffill")
-                            t0 = t.dropna().iloc[0] if t.notna().any() else pd.Timestamp.utcnow()
-                            return (t - t0).dt.total_seconds().fillna(0).to_numpy()
-
-                        time_s = build_time_seconds(export_df_ts)
-
-                        def ensure_monotonic_timestamps(ts):
-                            ts = np.asarray(ts, dtype=float)
-                            if ts.size == 0:
-                                return ts
-                            # Replace non-finite values
-                            for i in range(len(ts)):
-                                if not np.isfinite(ts[i]):
-                                    ts[i] = ts[i - 1] if i > 0 else 0.0
-                            for i in range(1, len(ts)):
-                                if ts[i] <= ts[i - 1]:
-                                    ts[i] = ts[i - 1] + 1e-6
-                            return ts
-
-                        mdf = MDF()
-
-                        if "CAN_ID" in export_df_ts.columns:
-                            for can_id, id_df in export_df_ts.groupby("CAN_ID"):
-                                if id_df.empty:
-                                    continue
-                                idx = id_df.index.to_numpy()
-                                id_ts = time_s[idx]
-                                order = id_ts.argsort(kind="mergesort")
-                                id_ts = id_ts[order]
-                                id_ts = ensure_monotonic_timestamps(id_ts)
-                                id_df = id_df.iloc[order]
-            
-                                # Normalize CAN ID value
-                                can_id_str = str(can_id)
-                                try:
-                                    if can_id_str.lower().startswith("0x"):
-                                        can_id_int = int(can_id_str, 16)
-                                    else:
-                                        can_id_int = int(float(can_id_str))
-                                except Exception:
-                                    can_id_int = -1
-            
-                                channels = []
-                                channels.append(Signal(
-                                    samples=np.full(len(id_df), can_id_int),
-                                    timestamps=id_ts,
-                                    name="CAN_ID",
-                                    unit="",
-                                    comment=f"CAN Message ID {can_id_str}",
-                                ))
-            
-                                for col in id_df.columns:
-                                    if col in ("Date", "Time", "CAN_ID", "Timestamp", "timestamps", "UnixTime", "Microseconds"):
-                                        continue
-                                    vals = pd.to_numeric(id_df[col], errors="coerce")
-                                    if vals.isna().all():
-                                        continue
-                                    unit = ""
-                                    try:
-                                        unit = self.signal_units.get(col, "")
-                                    except Exception:
-                                        unit = ""
-                                    channels.append(Signal(
-                                        samples=vals.fillna(method="ffill").fillna(0).to_numpy(),
-                                        timestamps=id_ts,
-                                        name=str(col),
-                                        unit=str(unit) if unit else "",
-                                        comment=str(unit) if unit else "",
-                                    ))
-            
-                                if channels:
-                                    mdf.append(channels, common_timebase=True)
-                        else:
-                            # Fallback: single group
-                            id_ts = ensure_monotonic_timestamps(time_s)
-                            channels = []
-                            for col in export_df_ts.columns:
-                                if col in ("Date", "Time", "CAN_ID", "Timestamp", "timestamps", "UnixTime", "Microseconds"):
-                                    continue
-                                vals = pd.to_numeric(export_df_ts[col], errors="coerce")
-                                if vals.isna().all():
-                                    continue
-                                unit = ""
-                                try:
-                                    unit = self.signal_units.get(col, "")
-                                except Exception:
-                                    unit = ""
-                                channels.append(Signal(
-                                    samples=vals.fillna(method="ffill").fillna(0).to_numpy(),
-                                    timestamps=id_ts,
-                                    name=str(col),
-                                    unit=str(unit) if unit else "",
-                                    comment=str(unit) if unit else "",
-                                ))
-                            if channels:
-                                mdf.append(channels, common_timebase=True)
-
-                        mdf.save(filename, overwrite=True)
-                        messagebox.showinfo("Success", f"Data exported to {filename}")
-                        self.update_status(f"Exported to {filename}")
-                except ImportError:
-                    messagebox.showerror("Error", "MDF/MF4 export requires asammdf and numpy.\nInstall with: pip install asammdf numpy")
-
-            elif export_format == "JSON":
-
-                filename = filedialog.asksaveasfilename(
-                    title="Save Decoded Data as JSON",
-                    defaultextension=".json",
-                    filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-                )
-                if filename:
-                    export_df.to_json(filename, orient='records', indent=2)
-                    messagebox.showinfo("Success", f"Data exported to {filename}")
-                    self.update_status(f"Exported to {filename}")
-
-            elif export_format == "TXT":
-                filename = filedialog.asksaveasfilename(
-                    title="Save Decoded Data as TXT (tab-separated)",
-                    defaultextension=".txt",
-                    filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
-                )
-                if filename:
-                    # include units row
-                    units = getattr(self, 'decoded_units_row', None)
-                    out_df = export_df.copy()
-                    if isinstance(units, dict):
-                        out_df = pd.concat([pd.DataFrame([units]), out_df], ignore_index=True)
-                    out_df.to_csv(filename, sep='\t', index=False)
-                    messagebox.showinfo("Success", f"Data exported to {filename}")
-                    self.update_status(f"Exported to {filename}")
-
-            elif export_format == "HDF5":
-                filename = filedialog.asksaveasfilename(
-                    title="Save Decoded Data as HDF5",
-                    defaultextension=".h5",
-                    filetypes=[("HDF5 files", "*.h5;*.hdf5"), ("All files", "*.*")]
-                )
-                if filename:
-                    try:
-                        import tables  # noqa: F401
-                        export_df.to_hdf(filename, key='decoded_data', mode='w')
-                        messagebox.showinfo("Success", f"Data exported to {filename}")
-                        self.update_status(f"Exported to {filename}")
-                    except Exception as e:
-                        messagebox.showerror("Error", f"HDF5 export requires pytables. Install with: pip install tables\n\nDetails: {e}")
-
-            elif export_format == "PARQUET":
-                filename = filedialog.asksaveasfilename(
-                    title="Save Decoded Data as Parquet",
-                    defaultextension=".parquet",
-                    filetypes=[("Parquet files", "*.parquet"), ("All files", "*.*")]
-                )
-                if filename:
+        pool = ThreadPoolExecutor(max_workers=min(len(jobs), EXPORT_MAX_WORKERS),
+                                  thread_name_prefix="export")
+        for job in jobs.values():
+            pool.submit(_job, job)
+        pool.shutdown(wait=False)
+        self._set_export_cancel_enabled(True)
+        self.update_status(f"Exporting {', '.join(jobs)}...")
+        self.root.after(250, _poll)
+
+    def cancel_export(self):
+        """Ask running export writers to stop; partial files are removed by the workers."""
+        event = getattr(self, 'export_cancel_event', None)
+        if not getattr(self, 'export_running', False) or event is None:
+            return
+        event.set()
+        self._set_export_cancel_enabled(False)
+        self.update_status("Cancelling export...")
+
+    def _set_export_cancel_enabled(self, enabled):
+        try:
+            self.export_cancel_btn.config(state=tk.NORMAL if enabled else tk.DISABLED)
+        except Exception:
+            pass
+
+    def _show_export_progress(self, jobs, total_rows):
+        lines = []
+        for fmt, job in jobs.items():
+            mb = job.bytes_out() / 1e6
+            if job.status == 'queued':
+                lines.append(f"{fmt}: queued")
+            elif job.status == 'running':
+                pct = (100.0 * job.rows_written / total_rows) if total_rows else 100.0
+                lines.append(f"{fmt}: {job.rows_written:,}/{total_rows:,} rows ({pct:.0f}%), {mb:.1f} MB")
+            elif job.status == 'done':
+                lines.append(f"{fmt}: done ({job.elapsed:.1f} s, {mb:.1f} MB)")
+            else:
+                lines.append(f"{fmt}: {job.status}")
+        try:
+            self.export_progress_label.config(text="   ".join(lines))
+        except Exception:
+            pass
+
+    def _export_writer(self, export_format):
+        return {
+            "XLSX": self._export_xlsx,
+            "MAT": self._export_mat,
+            "PARQUET_DATASET": self._export_parquet_dataset,
+            "ARROW": self._export_arrow,
+            "PROMETHEUS": self._export_prometheus,
+        }.get(export_format, self._export_via_sink)
+
+    # ---- Format writers: run on export worker threads; must not touch Tk or mutate data.df.
+    # ---- Each reports progress via job.advance(rows), which also raises on cancel.
+
+    def _export_via_sink(self, data, filename, job):
+        sink = EXPORT_SINKS[job.format](filename, units=data.units, signal_units=data.signal_units,
+                                        options=data.options)
+        _write_through_sink(sink, data.df, time_ns=data.time_ns(), progress=job.advance)
+
+    def _export_xlsx(self, data, filename, job):
+        # Excel cannot handle certain control characters in cell values.
+        illegal_re = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
+        def _sanitize_excel_value(value):
+            if isinstance(value, str):
+                return illegal_re.sub("", value)
+            return value
+        def _sanitize_excel_df(df):
+            # Only columns that contain illegal characters are rewritten; the rest stay shared.
+            cleaned = {}
+            for col in df.columns:
+                if df[col].dtype == object:
                     try:
-                        engine = None
-                        try:
-                            import pyarrow  # noqa: F401
-                            engine = "pyarrow"
-                        except Exception:
-                            try:
-                                import fastparquet  # noqa: F401
-                                engine = "fastparquet"
-                            except Exception:
-                                engine = None
-                        if engine is None:
-                            raise ImportError("pyarrow or fastparquet not installed")
-                        export_df.to_parquet(filename, index=False, engine=engine)
-                        messagebox.showinfo("Success", f"Data exported to {filename}")
-                        self.update_status(f"Exported to {filename}")
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Parquet export requires pyarrow or fastparquet.\nInstall with: pip install pyarrow\n\nDetails: {e}")
-
-            elif export_format == "PROMETHEUS":
-                filename = filedialog.asksaveasfilename(
-                    title="Save Decoded Data as Prometheus exposition format",
-                    defaultextension=".prom",
-                    filetypes=[("Prometheus files", "*.prom;*.txt"), ("All files", "*.*")]
-                )
-                if filename:
-                    # Write a simple exposition file: one sample per row per numeric column.
-                    # NOTE: can be large; intended for smaller datasets.
-                    export_df_ts = self._ensure_timestamps_column(export_df.copy())
-                    ts_series = None
-                    if 'timestamps' in export_df_ts.columns:
-                        ts_series = pd.to_datetime(export_df_ts['timestamps'], errors='coerce')
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        for col in export_df_ts.columns:
-                            if col in ('timestamps',) or col.startswith('Data') or col.startswith('ID'):
-                                continue
-                            vals = pd.to_numeric(export_df_ts[col], errors='coerce')
-                            if vals.isna().all():
-                                continue
-                            metric = "can_signal"
-                            f.write(f"# HELP {metric} Decoded CAN signal values\n")
-                            f.write(f"# TYPE {metric} gauge\n")
-                            for i, v in enumerate(vals):
-                                if pd.isna(v):
-                                    continue
-                                # Prometheus timestamps are in milliseconds
-                                if ts_series is not None and not ts_series.isna().all():
-                                    tsv = ts_series.iloc[i]
-                                    if pd.isna(tsv):
-                                        t_ms = i
-                                    else:
-                                        t_ms = int(tsv.value // 1_000_000)
-                                else:
-                                    t_ms = i
-                                f.write(f'{metric}{{signal="{col}"}} {float(v)} {t_ms}\n')
-                    messagebox.showinfo("Success", f"Data exported to {filename}")
-                    self.update_status(f"Exported to {filename}")
-            
-            self.append_output(f"\nExport completed: {export_format} format")
-            self.append_output(f"  Rows: {len(self.decoded_df)}")
-            self.append_output(f"  Columns: {len(self.decoded_df.columns)}")
-            
-        except Exception as e:
-            import traceback
-            error_msg = f"Export failed: {str(e)}\n\nPlease ensure required packages are installed."
-            messagebox.showerror("Error", error_msg)
-            print(f"Export error: {traceback.format_exc()}")
+                        dirty = df[col].str.contains(illegal_re, na=False).any()
+                    except AttributeError:  # no strings in this column
+                        dirty = False
+                    if dirty:
+                        cleaned[col] = df[col].map(_sanitize_excel_value)
+            return df.assign(**cleaned) if cleaned else df
+
+        export_df = data.df
+        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            safe_df = _sanitize_excel_df(export_df)
+            base_df = data.raw_df if data.raw_df is not None else export_df
+            safe_base = safe_df if base_df is export_df else _sanitize_excel_df(base_df)
+            units = data.units
+            safe_units = None
+            if isinstance(units, dict):
+                safe_units = {k: _sanitize_excel_value(v) for k, v in units.items()}
+
+            def _safe_sheet_name(name, used):
+                base = re.sub(r"[\\/?*\[\]:]", "_", str(name)).strip()
+                if not base:
+                    base = "Unknown"
+                base = base[:31]
+                candidate = base
+                i = 2
+                while candidate in used:
+                    suffix = f"_{i}"
+                    candidate = base[:31 - len(suffix)] + suffix
+                    i += 1
+                used.add(candidate)
+                return candidate
+
+            # The per-ID sheets and ALL_IDS each hold every row; progress
+            # counts rows over all sheets, scaled to the table's row count.
+            work = len(safe_base) + len(safe_df)
+            written = [0, 0]  # rows written, rows reported to the job
+
+            def _write_sheet(frame, sheet_name):
+                """Write one sheet in EXPORT_CHUNK_ROWS pieces, reporting each."""
+                for start in range(0, max(len(frame), 1), EXPORT_CHUNK_ROWS):
+                    chunk = frame.iloc[start:start + EXPORT_CHUNK_ROWS]
+                    chunk.to_excel(writer, index=False, sheet_name=sheet_name,
+                                   header=start == 0, startrow=start + 1 if start else 0)
+                    written[0] += len(chunk)
+                    reported = written[0] * len(safe_df) // work if work else 0
+                    job.advance(reported - written[1])
+                    written[1] = reported
+
+            used_names = set()
+            if "CAN_ID" in safe_base.columns:
+                id_series = safe_base["CAN_ID"].fillna("").astype(str)
+                for can_id in id_series.unique():
+                    if can_id == "":
+                        can_id = "Unknown"
+                    df_id = safe_base[id_series == can_id]
+                    cols_keep = []
+                    for col in df_id.columns:
+                        if col in ("Date", "Time", "CAN_ID"):
+                            cols_keep.append(col)
+                            continue
+                        series = df_id[col]
+                        if series.replace("", pd.NA).isna().all():
+                            continue
+                        cols_keep.append(col)
+                    df_id = df_id[cols_keep]
+                    _write_sheet(df_id, _safe_sheet_name(can_id, used_names))
+            else:
+                _write_sheet(safe_base, _safe_sheet_name("data", used_names))
+
+            # Combined sheet with all IDs
+            _write_sheet(safe_df, _safe_sheet_name("ALL_IDS", used_names))
+
+            if safe_units is not None:
+                units_name = _safe_sheet_name("units", used_names)
+                pd.DataFrame([safe_units]).to_excel(writer, index=False, sheet_name=units_name)
+
+    def _export_mat(self, data, filename, job):
+        _write_mat(filename, data.df, units=data.units, can_id_signals=data.can_id_signals,
+                   time_ns=data.time_ns(), progress=job.advance)
+
+    def _export_parquet_dataset(self, data, dirname, job):
+        _write_parquet_dataset(data.df, dirname, time_ns=data.time_ns(), progress=job.advance)
+
+    def _export_arrow(self, data, filename, job):
+        _write_arrow_ipc(data.df, filename,
+                         compression=data.options.get('arrow_compression', 'uncompressed'),
+                         units=data.units, provenance=data.provenance, time_ns=data.time_ns(),
+                         progress=job.advance)
+
+    def _export_prometheus(self, data, filename, job):
+        # Write a simple exposition file: one sample per row per numeric column.
+        # NOTE: can be large; intended for smaller datasets.
+        export_df_ts = data.df
+        time_ns = data.time_ns()
+        # Prometheus timestamps are in milliseconds; rows without a time use their row number
+        t_ms = np.where(time_ns == NAT_NS, np.arange(len(time_ns)), time_ns // 1_000_000)
+        with open(filename, 'w', encoding='utf-8') as f:
+            for col in export_df_ts.columns:
+                if col in ('timestamps',) or col.startswith('Data') or col.startswith('ID'):
+                    continue
+                metric = "can_signal"
+                column = export_df_ts[col]
+                header = False
+                # Converted chunk by chunk, so a column never exists in full as floats or Python objects.
+                for start in range(0, len(column), EXPORT_CHUNK_ROWS):
+                    stop = start + EXPORT_CHUNK_ROWS
+                    vals = pd.to_numeric(column.iloc[start:stop], errors='coerce').to_numpy(dtype=float,
+                                                                                           na_value=np.nan)
+                    if np.isnan(vals).all():
+                        continue
+                    if not header:
+                        f.write(f"# HELP {metric} Decoded CAN signal values\n")
+                        f.write(f"# TYPE {metric} gauge\n")
+                        header = True
+                    for v, t in zip(vals.tolist(), t_ms[start:stop].tolist()):
+                        if v != v:
+                            continue
+                        f.write(f'{metric}{{signal="{col}"}} {v} {t}\n')
+                job.check()
+        job.advance(len(export_df_ts))
 
 
 def main():
@@ -0,0 +1,784 @@
+#!/usr/bin/env python3
+"""
+CAN Data Decoder - Benchmark Suite
+
+Generates synthetic encrypted .NXT logs (same NXTLOG header, LCG stream cipher
+and CSV layout as the logger firmware, frames encoded from a DBC so they decode
+cleanly) and times each stage of the decoder on them:
+
+  decrypt   decrypt_nxt_file                       MB/s of payload
+  parse     pandas read of the plaintext CSV       rows/s
+  decode    DBCDecoderGUI.decode_messages          frames/s (includes parse)
+  ffill     sort / forward-fill part of decode     rows/s
+  export    every selected export format           rows/s, MB/s written
+
+plus the process peak RSS after each stage, and GUI startup: seconds from
+process launch to the first painted window and to "engines ready" (needs a
+display; median of --startup-runs cold starts). Results are saved as JSON so
+runs of different decoder versions can be compared (--compare).
+
+Memory of decode -> export: the RSS the decoded dataset keeps resident, and
+the highest RSS (sampled) during each export and during all formats written
+concurrently as the GUI does, both above the pre-decode baseline.
+--max-memory-ratio 1.2 fails the run when an export peak exceeds 1.2x the
+dataset.
+
+Usage:
+  python Decoder_Benchmark.py                          # every DBC in DBC_Dump, 100k frames each
+  python Decoder_Benchmark.py --rows 500000 --dbc "../DBC_Dump/Naxatra_Labs_Test_Controller (11).dbc"
+  python Decoder_Benchmark.py --id-mix 0x1AA=10,0x2AA=1 --formats CSV,PARQUET
+  python Decoder_Benchmark.py --generate-only log.NXT --rows 1000000
+  python Decoder_Benchmark.py --startup-only --startup-runs 5
+  python Decoder_Benchmark.py --compare old_results.json
+  python Decoder_Benchmark.py --rows 2000000 --startup-runs 0 --max-memory-ratio 1.2
+"""
+
+import argparse
+import ctypes
+import gc
+import json
+import os
+import platform
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+import CAN_Data_Decoder_New as decoder  # noqa: E402
+
+decoder.load_engines()
+
+try:
+    import resource  # POSIX only
+except ImportError:
+    resource = None
+
+DEFAULT_DBC_DIR = HERE.parent / "DBC_Dump"
+DEFAULT_ROWS = 100_000
+DEFAULT_RATE_HZ = 1000.0
+# XLSX is left out by default: it is far slower than every other format and row-limited.
+DEFAULT_FORMATS = ("CSV", "TXT", "PARQUET", "PARQUET_DATASET", "ARROW", "HDF5", "NDJSON",
+                   "SQLITE", "MF4", "MAT", "PROMETHEUS")
+
+# Firmware CSV header (CAN_Data_Logger_Encoded.ino, createNewLogFile).
+LOG_HEADER = ",".join(
+    ["Timestamp", "UnixTime", "Microseconds", "ID", "Extended", "RTR", "DLC"]
+    + [f"Data{i}" for i in range(8)]
+    + ["LinearAccelX", "LinearAccelY", "LinearAccelZ", "Gravity"]
+    + ["GPS_Lat", "GPS_Lon", "GPS_Alt", "GPS_Speed", "GPS_Course", "GPS_Sats", "GPS_HDOP", "GPS_Time"]
+)
+
+LCG_A = 1664525
+LCG_C = 1013904223
+LCG_MASK = 0xFFFFFFFF
+CIPHER_BLOCK_BYTES = 1 << 20
+PAYLOADS_PER_MESSAGE = 256
+DEFAULT_STARTUP_RUNS = 3
+STARTUP_TIMEOUT_S = 120
+
+# Runs in a fresh interpreter: opens the GUI, waits for the first paint and the
+# background engine warm-up, then prints its timings (time.time() stamps) as JSON.
+STARTUP_CHILD = r"""
+import json, sys, time
+started = time.time()
+sys.path.insert(0, sys.argv[1])
+import tkinter as tk
+import CAN_Data_Decoder_New as decoder
+imported = time.time()
+root = tk.Tk()
+app = decoder.DBCDecoderGUI(root)
+root.update()
+painted = time.time()
+deadline = painted + float(sys.argv[2])
+while not app.engines_ready and time.time() < deadline:
+    root.update()
+    time.sleep(0.005)
+ready = time.time() if app.engines_ready else None
+root.destroy()
+print(json.dumps({"started": started, "imported": imported, "painted": painted, "ready": ready,
+                  "imports": app.startup_times.get("imports", {})}))
+"""
+
+
+# ---------------------------------------------------------------------------
+# Synthetic NXTLOG generator
+# ---------------------------------------------------------------------------
+
+def _lcg_tables(n):
+    """A[k], C[k] with state after k+1 steps = (A[k] * s + C[k]) mod 2**32, for k < n."""
+    a = np.empty(n, dtype=np.uint64)
+    c = np.empty(n, dtype=np.uint64)
+    a[0], c[0] = LCG_A, LCG_C
+    filled = 1
+    while filled < n:
+        m = min(filled, n - filled)
+        a[filled:filled + m] = (a[:m] * a[filled - 1]) & LCG_MASK
+        c[filled:filled + m] = (a[:m] * c[filled - 1] + c[:m]) & LCG_MASK
+        filled += m
+    return a, c
+
+
+class NXTEncryptor:
+    """
+    The logger's stream cipher (cipher_step in the decoder, encryptByte in the
+    firmware), vectorized: a block of LCG states is computed at once from jump
+    tables instead of one step per byte.
+    """
+
+    _tables = None
+
+    def __init__(self, nonce):
+        self.state = decoder.init_cipher_state(nonce)
+        if NXTEncryptor._tables is None:
+            NXTEncryptor._tables = _lcg_tables(CIPHER_BLOCK_BYTES)
+        self._key = np.array(decoder.ENCRYPTION_KEY, dtype=np.uint8)
+
+    def encrypt(self, data):
+        buf = np.frombuffer(data, dtype=np.uint8)
+        out = np.empty_like(buf)
+        a, c = NXTEncryptor._tables
+        for start in range(0, len(buf), CIPHER_BLOCK_BYTES):
+            n = min(CIPHER_BLOCK_BYTES, len(buf) - start)
+            states = (a[:n] * np.uint64(self.state) + c[:n]) & LCG_MASK
+            stream = ((states >> 24) & 0xFF).astype(np.uint8) ^ self._key[(states & 0x0F).astype(np.intp)]
+            out[start:start + n] = buf[start:start + n] ^ stream
+            self.state = int(states[-1])
+        return out.tobytes()
+
+
+def _check_cipher():
+    """The vectorized keystream must match the decoder's reference cipher byte for byte."""
+    nonce = 0x1234ABCD
+    state = decoder.init_cipher_state(nonce)
+    expected = bytearray()
+    for _ in range(4096):
+        state, stream = decoder.cipher_step(state)
+        expected.append(stream)
+    got = NXTEncryptor(nonce).encrypt(bytes(4096))
+    if got != bytes(expected):
+        raise RuntimeError("Synthetic NXT cipher does not match the decoder's cipher")
+
+
+def _signal_range(signal):
+    """Physical range a signal can encode, narrowed to the DBC min/max when given."""
+    if signal.is_float:
+        lo, hi = -1000.0, 1000.0
+    else:
+        if signal.is_signed:
+            raw_lo, raw_hi = -(1 << (signal.length - 1)), (1 << (signal.length - 1)) - 1
+        else:
+            raw_lo, raw_hi = 0, (1 << signal.length) - 1
+        ends = (raw_lo * signal.scale + signal.offset, raw_hi * signal.scale + signal.offset)
+        lo, hi = min(ends), max(ends)
+    if signal.minimum is not None:
+        lo = max(lo, signal.minimum)
+    if signal.maximum is not None:
+        hi = min(hi, signal.maximum)
+    return (lo, hi) if lo <= hi else (min(ends), max(ends))
+
+
+def _payload_pool(message, rng, size=PAYLOADS_PER_MESSAGE):
+    """Pre-encoded data bytes for one message: random in-range values for every signal."""
+    pool = []
+    for _ in range(size):
+        values = {}
+        for signal in message.signals:
+            lo, hi = _signal_range(signal)
+            if signal.choices and rng.random() < 0.5:
+                values[signal.name] = int(rng.choice(list(signal.choices.keys())))
+            elif signal.is_float or signal.scale != int(signal.scale):
+                values[signal.name] = float(rng.uniform(lo, hi))
+            else:
+                values[signal.name] = int(rng.integers(int(np.ceil(lo)), int(np.floor(hi)) + 1))
+        try:
+            data = message.encode(values, scaling=True, strict=False)
+        except Exception:
+            data = bytes(rng.integers(0, 256, message.length, dtype=np.uint8))
+        pool.append(bytes(data))
+    return pool
+
+
+def parse_id_mix(text):
+    """'0x1AA=4,0x2AA=1' -> {0x1AA: 4.0, 0x2AA: 1.0} (weight defaults to 1)."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in (text or "").split(","))):
+        ident, _, weight = part.partition("=")
+        mix[int(ident, 0)] = float(weight) if weight else 1.0
+    return mix
+
+
+def _message_weights(messages, id_mix=None):
+    if id_mix:
+        known = {m.frame_id for m in messages}
+        unknown = sorted(set(id_mix) - known)
+        if unknown:
+            raise ValueError("IDs not in DBC: " + ", ".join(f"0x{i:X}" for i in unknown))
+        weights = np.array([id_mix.get(m.frame_id, 0.0) for m in messages], dtype=float)
+    else:
+        # Real buses send each message at its cycle time; without one, an even mix.
+        weights = np.array([1.0 / m.cycle_time if m.cycle_time else 1.0 for m in messages], dtype=float)
+    if weights.sum() <= 0:
+        raise ValueError("ID mix selects no messages")
+    return weights / weights.sum()
+
+
+def generate_nxt_log(path, dbc_path, rows, id_mix=None, rate_hz=DEFAULT_RATE_HZ, seed=0,
+                     start_unix=None, gps_fix=True):
+    """
+    Write a synthetic encrypted log of `rows` frames for the messages of `dbc_path`.
+    Returns {'rows', 'bytes', 'payload_bytes', 'ids'}.
+    """
+    rng = np.random.default_rng(seed)
+    db = decoder._load_dbc_with_fallback(str(dbc_path))
+    messages = list(db.messages)
+    if not messages:
+        raise ValueError(f"No messages in {dbc_path}")
+    weights = _message_weights(messages, id_mix)
+    pools = []
+    for message in messages:
+        dlc = min(message.length, 8)
+        hex_pool = []
+        for data in _payload_pool(message, rng):
+            data = data[:dlc]
+            hex_pool.append(",".join([f"{b:02X}" for b in data] + ["00"] * (8 - len(data))))
+        pools.append((f"{message.frame_id:X}", "1" if message.is_extended_frame else "0", str(dlc), hex_pool))
+
+    start_unix = int(start_unix if start_unix is not None else time.time()) - rows // max(int(rate_hz), 1)
+    # Frame times: nominal rate with +-20% jitter, kept in order.
+    steps = rng.uniform(0.8, 1.2, rows) * (1e6 / rate_hz)
+    micros_total = np.cumsum(steps).astype(np.int64)
+    picks = rng.choice(len(messages), size=rows, p=weights)
+    payload_picks = rng.integers(0, PAYLOADS_PER_MESSAGE, rows)
+    accel = rng.normal(0.0, 0.5, (rows, 3))
+
+    nonce = int(rng.integers(1, 2 ** 32 - 1))
+    encryptor = NXTEncryptor(nonce)
+    header = bytearray(decoder.NXT_HEADER_SIZE)
+    header[:len(decoder.NXT_MAGIC)] = decoder.NXT_MAGIC
+    header[6] = decoder.NXT_VERSION
+    header[7] = decoder.NXT_HEADER_SIZE
+    header[8:12] = struct.pack("<I", nonce)
+
+    time_text = {}
+    payload_bytes = 0
+    with open(path, "wb") as fh:
+        fh.write(header)
+        text = encryptor.encrypt((LOG_HEADER + "\n").encode("ascii"))
+        fh.write(text)
+        payload_bytes += len(text)
+        lines = []
+        for i in range(rows):
+            unix = start_unix + int(micros_total[i] // 1_000_000)
+            stamp = time_text.get(unix)
+            if stamp is None:
+                stamp = time_text[unix] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(unix))
+            frame_id, extended, dlc, hex_pool = pools[picks[i]]
+            ax, ay, az = accel[i]
+            if gps_fix:
+                gps = (f"{12.971600 + i * 1e-7:.6f},{77.594600 + i * 1e-7:.6f},920.00,"
+                       f"{abs(ax) * 10:.2f},90.00,9,0.90,{stamp[11:]}")
+            else:
+                gps = "0,0,0,0,0,0,0,0"
+            lines.append(
+                f"{stamp},{unix},{int(micros_total[i] % 1_000_000)},{frame_id},{extended},0,{dlc},"
+                f"{hex_pool[payload_picks[i]]},{ax:.4f},{ay:.4f},{az:.4f},{9.81 + az * 0.01:.4f},{gps}\n"
+            )
+            if len(lines) >= 50_000:
+                text = encryptor.encrypt("".join(lines).encode("ascii"))
+                fh.write(text)
+                payload_bytes += len(text)
+                lines.clear()
+        if lines:
+            text = encryptor.encrypt("".join(lines).encode("ascii"))
+            fh.write(text)
+            payload_bytes += len(text)
+    return {
+        "rows": rows,
+        "bytes": payload_bytes + decoder.NXT_HEADER_SIZE,
+        "payload_bytes": payload_bytes,
+        "ids": [f"0x{m.frame_id:X}" for m, w in zip(messages, weights) if w > 0],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measurement helpers
+# ---------------------------------------------------------------------------
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB (None if unavailable)."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS bytes.
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    try:
+        import psutil  # type: ignore
+        info = psutil.Process().memory_info()
+        return round(getattr(info, "peak_wset", info.rss) / (1024 * 1024), 1)
+    except Exception:
+        return None
+
+
+def rss_mb():
+    """Current resident set size of this process in MB (None if unavailable)."""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError, IndexError):
+        pass
+    try:
+        import psutil  # type: ignore
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def release_free_memory():
+    """
+    Hand freed heap back to the OS (glibc malloc_trim, Arrow's memory pool) and
+    return the current RSS in MB, so it reflects live data rather than allocator slack.
+    """
+    gc.collect()
+    if sys.platform.startswith("linux"):
+        try:
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+        except (OSError, AttributeError):
+            pass
+    try:
+        import pyarrow as pa  # type: ignore
+        pa.default_memory_pool().release_unused()
+    except Exception:
+        pass
+    return rss_mb()
+
+
+class RssWatch:
+    """
+    Highest current RSS seen while the block runs, sampled on a background thread.
+
+    ru_maxrss only ever grows, so it cannot show the peak of a stage that runs
+    after a larger one; this can. `.peak_mb` stays None where RSS is unavailable.
+    """
+
+    def __init__(self, interval=0.002):
+        self.interval = interval
+        self.peak_mb = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while True:
+            self.peak_mb = max(self.peak_mb, rss_mb())
+            if self._stop.wait(self.interval):
+                break
+
+    def __enter__(self):
+        self.peak_mb = rss_mb()
+        if self.peak_mb is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self.peak_mb = max(self.peak_mb, rss_mb())
+        return False
+
+
+def _path_bytes(path):
+    path = Path(path)
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+class _Null:
+    """Stands in for the Tk widgets the decoder touches while decoding."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def headless_decoder():
+    """A DBCDecoderGUI without a window: output lines are collected in `.log`."""
+    gui = decoder.DBCDecoderGUI.__new__(decoder.DBCDecoderGUI)
+    gui.log = []
+    gui.output_text = gui.decode_button = gui.progress = _Null()
+    gui.append_output = gui.log.append
+    gui.update_status = lambda message: None
+    gui.safe_gui_update = lambda callback: None
+    gui.update_statistics_display = lambda: None
+    gui.decoding = False
+    gui.decoded_df = None
+    gui.decoded_time_ns = None
+    gui.raw_df = None
+    gui.stats_data = {}
+    gui.signal_units = {}
+    gui.decoded_units_row = None
+    gui.decode_provenance = {}
+    gui.can_id_signals = {}
+    return gui
+
+
+def _rate(count, seconds):
+    return round(count / seconds, 1) if seconds > 0 else None
+
+
+def run_case(dbc_path, rows, formats, workdir, id_mix=None, rate_hz=DEFAULT_RATE_HZ, seed=0):
+    """Generate one log and time every stage on it."""
+    case = {"dbc": Path(dbc_path).name, "rows": rows, "stages": {}, "exports": {}}
+    stages = case["stages"]
+    nxt_path = Path(workdir) / "bench.NXT"
+
+    print(f"\n== {Path(dbc_path).name}: {rows:,} frames")
+    started = time.perf_counter()
+    info = generate_nxt_log(nxt_path, dbc_path, rows, id_mix=id_mix, rate_hz=rate_hz, seed=seed)
+    case["log_bytes"] = info["bytes"]
+    case["ids"] = info["ids"]
+    stages["generate"] = {"seconds": round(time.perf_counter() - started, 3)}
+    print(f"  generate  {stages['generate']['seconds']:8.2f} s   {info['bytes'] / 1e6:.1f} MB, IDs {', '.join(info['ids'])}")
+
+    started = time.perf_counter()
+    plaintext = decoder.decrypt_nxt_file(str(nxt_path))
+    elapsed = time.perf_counter() - started
+    try:
+        stages["decrypt"] = {"seconds": round(elapsed, 3),
+                             "mb_per_s": _rate(info["payload_bytes"] / 1e6, elapsed),
+                             "peak_rss_mb": peak_rss_mb()}
+        print(f"  decrypt   {elapsed:8.2f} s   {stages['decrypt']['mb_per_s']} MB/s")
+
+        started = time.perf_counter()
+        parsed = pd.read_csv(plaintext, encoding="utf-8")
+        elapsed = time.perf_counter() - started
+        if len(parsed) != rows:
+            raise RuntimeError(f"Decrypted log has {len(parsed)} rows, expected {rows}")
+        del parsed
+        stages["parse"] = {"seconds": round(elapsed, 3), "rows_per_s": _rate(rows, elapsed),
+                           "peak_rss_mb": peak_rss_mb()}
+        print(f"  parse     {elapsed:8.2f} s   {stages['parse']['rows_per_s']:,} rows/s")
+
+        # Time the sort / forward-fill step inside decode by wrapping it.
+        finalize = decoder._finalize_decoded_rows
+        ffill = {"seconds": 0.0, "rows": 0}
+
+        def _timed_finalize(rows_in, *args, **kwargs):
+            t0 = time.perf_counter()
+            result = finalize(rows_in, *args, **kwargs)
+            ffill["seconds"] += time.perf_counter() - t0
+            ffill["rows"] += len(rows_in)
+            return result
+
+        gui = headless_decoder()
+        decoder._finalize_decoded_rows = _timed_finalize
+        baseline_mb = release_free_memory()
+        try:
+            started = time.perf_counter()
+            with RssWatch() as decode_watch:
+                gui.decode_messages(plaintext, str(dbc_path))
+            elapsed = time.perf_counter() - started
+        finally:
+            decoder._finalize_decoded_rows = finalize
+        if gui.decoded_df is None:
+            errors = [line for line in gui.log if "ERROR" in line]
+            raise RuntimeError("Decode failed: " + (errors[-1] if errors else "no output"))
+        frames = gui.stats_data.get("total_messages", rows)
+        stages["decode"] = {"seconds": round(elapsed, 3), "frames_per_s": _rate(frames, elapsed),
+                            "decoded": gui.stats_data.get("decoded_count"),
+                            "errors": gui.stats_data.get("error_count"),
+                            "output_rows": len(gui.decoded_df),
+                            "peak_rss_mb": peak_rss_mb()}
+        stages["ffill"] = {"seconds": round(ffill["seconds"], 3), "rows_per_s": _rate(ffill["rows"], ffill["seconds"])}
+        print(f"  decode    {elapsed:8.2f} s   {stages['decode']['frames_per_s']:,} frames/s "
+              f"({stages['decode']['errors']} errors)")
+        print(f"  ffill     {ffill['seconds']:8.2f} s   {stages['ffill']['rows_per_s']:,} rows/s")
+        profile = getattr(gui, "decode_profile", None)
+        if profile is not None:
+            case["decode_stages"] = profile.to_dict()["stages"]
+    finally:
+        try:
+            os.remove(plaintext)
+        except OSError:
+            pass
+
+    data = decoder.SharedExportData(
+        gui.decoded_df, raw_df=gui.raw_df, units=gui.decoded_units_row,
+        signal_units=gui.signal_units, provenance=gui.decode_provenance,
+        can_id_signals=gui.can_id_signals, time_ns=gui.decoded_time_ns,
+    )
+    out_rows = len(gui.decoded_df)
+    dataset_bytes = decoder._dataset_memory(gui.decoded_df, gui.decoded_time_ns,
+                                            getattr(gui, "_plot_cache", None))["total"]
+    resident_mb = release_free_memory()
+    for fmt in formats:
+        spec = decoder.EXPORT_FORMATS[fmt]
+        target = Path(workdir) / (f"export_{fmt.lower()}" + spec["ext"])
+        job = decoder.ExportJob(fmt, str(target), threading.Event())
+        release_free_memory()
+        started = time.perf_counter()
+        try:
+            with RssWatch() as watch:
+                gui._export_writer(fmt)(data, str(target), job)
+        except ImportError as e:
+            case["exports"][fmt] = {"skipped": str(e)}
+            print(f"  {fmt:<16}skipped ({e})")
+            continue
+        except Exception as e:
+            case["exports"][fmt] = {"error": str(e)}
+            print(f"  {fmt:<16}FAILED: {e}")
+            continue
+        elapsed = time.perf_counter() - started
+        size = _path_bytes(target)
+        case["exports"][fmt] = {"seconds": round(elapsed, 3), "rows_per_s": _rate(out_rows, elapsed),
+                                "mb_per_s": _rate(size / 1e6, elapsed), "bytes": size,
+                                "peak_rss_mb": peak_rss_mb(), "stage_peak_rss_mb": _round(watch.peak_mb)}
+        print(f"  {fmt:<16}{elapsed:6.2f} s   {case['exports'][fmt]['rows_per_s']:,} rows/s, "
+              f"{size / 1e6:.1f} MB")
+        _remove_export(target)
+
+    # The GUI writes the selected formats concurrently, so memory is checked on that path too.
+    written = [fmt for fmt in formats if "seconds" in case["exports"][fmt]]
+    export_peak = max([case["exports"][fmt]["stage_peak_rss_mb"] or 0 for fmt in written], default=None)
+    if len(written) > 1:
+        targets = {fmt: Path(workdir) / (f"concurrent_{fmt.lower()}" + decoder.EXPORT_FORMATS[fmt]["ext"])
+                   for fmt in written}
+        jobs = [(fmt, decoder.ExportJob(fmt, str(path), threading.Event())) for fmt, path in targets.items()]
+        workers = min(len(jobs), decoder.EXPORT_MAX_WORKERS)
+        release_free_memory()
+        started = time.perf_counter()
+        with RssWatch() as watch, ThreadPoolExecutor(workers) as pool:
+            for future in [pool.submit(gui._export_writer(fmt), data, job.target, job) for fmt, job in jobs]:
+                future.result()
+        elapsed = time.perf_counter() - started
+        export_peak = max(export_peak, watch.peak_mb or 0)
+        case["exports_concurrent"] = {"seconds": round(elapsed, 3), "formats": written, "workers": workers,
+                                      "stage_peak_rss_mb": _round(watch.peak_mb)}
+        print(f"  {'concurrent':<16}{elapsed:6.2f} s   {len(written)} formats on {workers} workers")
+        for path in targets.values():
+            _remove_export(path)
+
+    # Decode -> export memory: RSS above the pre-decode baseline at the highest
+    # point of any export, against what the decoded dataset itself keeps resident
+    # (object cells cost more in RSS than the accounted footprint suggests).
+    if None not in (baseline_mb, resident_mb):
+        memory = {"dataset_mb": round(dataset_bytes / (1024 * 1024), 1),
+                  "resident_mb": round(resident_mb - baseline_mb, 1),
+                  "decode_peak_mb": _round(decode_watch.peak_mb - baseline_mb)}
+        if export_peak:
+            memory["export_peak_mb"] = round(export_peak - baseline_mb, 1)
+            memory["export_ratio"] = round(memory["export_peak_mb"] / memory["resident_mb"], 2) \
+                if memory["resident_mb"] > 0 else None
+        case["memory"] = memory
+        print(f"  memory    dataset {memory['dataset_mb']:,.1f} MB accounted, {memory['resident_mb']:,.1f} MB "
+              f"resident; decode peak {memory['decode_peak_mb']:,.1f} MB")
+        if memory.get("export_ratio") is not None:
+            print(f"            export peak {memory['export_peak_mb']:,.1f} MB = "
+                  f"{memory['export_ratio']:.2f}x the resident dataset")
+    case["peak_rss_mb"] = peak_rss_mb()
+    return case
+
+
+def _round(value, digits=1):
+    return None if value is None else round(value, digits)
+
+
+def _remove_export(target):
+    if target.is_dir():
+        shutil.rmtree(target, ignore_errors=True)
+    else:
+        try:
+            target.unlink()
+        except OSError:
+            pass
+
+
+def measure_startup(runs=DEFAULT_STARTUP_RUNS):
+    """Cold-start the GUI `runs` times; median seconds from process launch to each milestone."""
+    import statistics
+    import subprocess
+
+    samples = []
+    for _ in range(runs):
+        launched = time.time()
+        proc = subprocess.run([sys.executable, "-c", STARTUP_CHILD, str(HERE), str(STARTUP_TIMEOUT_S)],
+                              capture_output=True, text=True, timeout=STARTUP_TIMEOUT_S + 30)
+        if proc.returncode != 0:
+            reason = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            print(f"  startup   skipped ({reason})")
+            return {"skipped": reason}
+        child = json.loads(proc.stdout.strip().splitlines()[-1])
+        samples.append({
+            "interpreter": child["started"] - launched,
+            "module_import": child["imported"] - launched,
+            "first_paint": child["painted"] - launched,
+            "engines_ready": (child["ready"] - launched) if child["ready"] else None,
+            "imports": child["imports"],
+        })
+    result = {"runs": runs}
+    for key in ("interpreter", "module_import", "first_paint", "engines_ready"):
+        values = [sample[key] for sample in samples if sample[key] is not None]
+        result[key] = {"seconds": round(statistics.median(values), 3)} if values else {"seconds": None}
+    result["imports"] = {name: round(statistics.median(s["imports"][name] for s in samples), 3)
+                         for name, seconds in samples[-1]["imports"].items() if seconds is not None}
+    print(f"  startup   first paint {result['first_paint']['seconds']} s, "
+          f"engines ready {result['engines_ready']['seconds']} s (median of {runs})")
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+def _environment():
+    versions = {"python": platform.python_version(), "pandas": pd.__version__, "numpy": np.__version__}
+    for name in ("cantools", "pyarrow", "tables", "asammdf", "scipy", "h5py"):
+        try:
+            versions[name] = __import__(name).__version__
+        except Exception:
+            pass
+    return {
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": versions,
+        "decoder_sha256": decoder._file_sha256(decoder.__file__),
+    }
+
+
+def _metrics(results):
+    """Flatten results to {'dbc/stage.metric': value} for comparisons."""
+    flat = {}
+    for case in results.get("cases", []):
+        for stage, values in case.get("stages", {}).items():
+            if stage == "generate":
+                continue
+            for key in ("mb_per_s", "rows_per_s", "frames_per_s", "seconds"):
+                if values.get(key) is not None:
+                    flat[f"{case['dbc']}/{stage}.{key}"] = values[key]
+                    break
+        for fmt, values in case.get("exports", {}).items():
+            if values.get("rows_per_s") is not None:
+                flat[f"{case['dbc']}/export.{fmt}.rows_per_s"] = values["rows_per_s"]
+        if case.get("peak_rss_mb") is not None:
+            flat[f"{case['dbc']}/peak_rss_mb"] = case["peak_rss_mb"]
+        if (case.get("memory") or {}).get("export_ratio") is not None:
+            flat[f"{case['dbc']}/memory.export_ratio"] = case["memory"]["export_ratio"]
+    for milestone in ("first_paint", "engines_ready"):
+        seconds = (results.get("startup") or {}).get(milestone, {}).get("seconds")
+        if seconds is not None:
+            flat[f"startup/{milestone}.seconds"] = seconds
+    return flat
+
+
+def compare(base, current):
+    """Print each metric of `current` against `base` (higher is better except seconds / RSS)."""
+    old, new = _metrics(base), _metrics(current)
+    print(f"\n{'metric':<60}{'base':>14}{'current':>14}{'change':>10}")
+    for key in sorted(set(old) & set(new)):
+        a, b = old[key], new[key]
+        change = (b - a) / a * 100 if a else float("nan")
+        lower_is_better = key.endswith((".seconds", "peak_rss_mb", "export_ratio"))
+        flag = ""
+        if abs(change) >= 10:
+            flag = " worse" if (change > 0) == lower_is_better else " better"
+        print(f"{key:<60}{a:>14,.1f}{b:>14,.1f}{change:>9.1f}%{flag}")
+    unmatched = len(set(old) ^ set(new))
+    if unmatched:
+        print(f"({unmatched} metrics present in only one of the runs)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the CAN data decoder on synthetic NXTLOG files.")
+    parser.add_argument("--dbc", action="append",
+                        help="DBC file (repeatable). Default: every .dbc in DBC_Dump")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="frames per generated log")
+    parser.add_argument("--id-mix", default="",
+                        help="weights per CAN ID, e.g. 0x1AA=10,0x2AA=1 (default: DBC cycle times, else even)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE_HZ, help="bus frame rate in frames/s")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS),
+                        help="comma-separated export formats, or 'none'")
+    parser.add_argument("--output", help="results JSON (default: decoder_benchmark_<time>.json)")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    parser.add_argument("--workdir", help="directory for generated files (default: temporary)")
+    parser.add_argument("--generate-only", metavar="NXT_PATH",
+                        help="only write a synthetic log to NXT_PATH (first --dbc) and exit")
+    parser.add_argument("--startup-runs", type=int, default=DEFAULT_STARTUP_RUNS,
+                        help="GUI cold starts to time (0 = skip; needs a display)")
+    parser.add_argument("--startup-only", action="store_true", help="only time GUI startup")
+    parser.add_argument("--max-memory-ratio", type=float, metavar="RATIO",
+                        help="fail if export peak memory exceeds RATIO x the resident decoded dataset "
+                             "(the target is 1.2; use logs of 1M+ frames, chunk buffers dominate small ones)")
+    args = parser.parse_args(argv)
+
+    dbc_paths = [Path(p) for p in args.dbc] if args.dbc else sorted(DEFAULT_DBC_DIR.glob("*.dbc"))
+    if not dbc_paths:
+        parser.error("no DBC files found")
+    id_mix = parse_id_mix(args.id_mix)
+    _check_cipher()
+
+    if args.generate_only:
+        info = generate_nxt_log(args.generate_only, dbc_paths[0], args.rows, id_mix=id_mix,
+                                rate_hz=args.rate, seed=args.seed)
+        print(f"Wrote {args.generate_only}: {info['rows']:,} frames, {info['bytes'] / 1e6:.1f} MB")
+        return 0
+
+    formats = [] if args.formats.strip().lower() == "none" else [
+        f.strip().upper() for f in args.formats.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in decoder.EXPORT_FORMATS]
+    if unknown:
+        parser.error("unknown export formats: " + ", ".join(unknown))
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="decoder_bench_"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "settings": {"rows": args.rows, "rate_hz": args.rate, "seed": args.seed,
+                     "id_mix": {f"0x{k:X}": v for k, v in id_mix.items()}, "formats": formats},
+        "environment": _environment(),
+        "cases": [],
+    }
+    try:
+        if args.startup_runs > 0:
+            print(f"\n== GUI startup: {args.startup_runs} cold starts")
+            results["startup"] = measure_startup(args.startup_runs)
+        for dbc_path in ([] if args.startup_only else dbc_paths):
+            results["cases"].append(run_case(dbc_path, args.rows, formats, workdir, id_mix=id_mix,
+                                             rate_hz=args.rate, seed=args.seed))
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    output = Path(args.output or f"decoder_benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    print(f"\nPeak RSS: {results['peak_rss_mb']} MB")
+    print(f"Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            compare(json.load(fh), results)
+    if args.max_memory_ratio is not None:
+        over = [(case["dbc"], case["memory"]["export_ratio"]) for case in results["cases"]
+                if (case.get("memory") or {}).get("export_ratio", 0) > args.max_memory_ratio]
+        for dbc, ratio in over:
+            print(f"MEMORY CHECK FAILED: {dbc}: export peak {ratio:.2f}x the dataset "
+                  f"(limit {args.max_memory_ratio:.2f}x)")
+        if over:
+            return 1
+        print(f"Memory check passed: export peak <= {args.max_memory_ratio:.2f}x the dataset")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
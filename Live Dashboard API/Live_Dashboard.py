@@ -1,82 +1,97 @@
-#!/usr/bin/env python3
-"""
-Plotly Dash implementation of the real-time CAN dashboard.
-
-The app connects to the ESP32 logger over WiFi, pulls JSON frames from the /live
-endpoint, decodes them with a user-supplied DBC file, and displays the most
-recent signal values in a fixed layout organized by CAN message.
-"""
-
+#!/usr/bin/env python3
+"""
+Plotly Dash implementation of the real-time CAN dashboard.
+
+The app connects to the ESP32 logger over WiFi, pulls JSON frames from the /live
+endpoint, decodes them with a user-supplied DBC file, and displays the most
+recent signal values in a fixed layout organized by CAN message.
+"""
+
+import asyncio
 import base64
+import hashlib
+import json
 import os
+import queue
 import re
-import uuid
-from typing import Dict, List
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 
 import cantools
-import pandas as pd
+import numpy as np
 import requests
-from dash import (
-    Dash,
-    Input,
-    Output,
-    State,
-    dash_table,
-    dcc,
-    html,
-    ctx,
-    no_update,
-)
-from dash.dependencies import MATCH, ALL
-import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
-from flask import Response
-
-# Optional Prometheus support
-try:
-    from prometheus_client import (
-        CollectorRegistry,
-        Gauge,
-        CONTENT_TYPE_LATEST,
-        generate_latest,
-    )
-    PROMETHEUS_AVAILABLE = True
-except ImportError:
-    PROMETHEUS_AVAILABLE = False
-    # Create dummy classes if prometheus_client is not available
-    class CollectorRegistry:
-        pass
-    class Gauge:
-        def __init__(self, *args, **kwargs):
-            pass
-        def set(self, *args, **kwargs):
-            pass
-    CONTENT_TYPE_LATEST = "text/plain"
-    def generate_latest(*args, **kwargs):
-        return b"# Prometheus client not installed\n"
-
-
-# Match ESP32 AP configuration in CAN_Data_Logger_Only.ino
+from dash import (
+    ClientsideFunction,
+    Dash,
+    Input,
+    Output,
+    State,
+    dash_table,
+    dcc,
+    html,
+    ctx,
+    no_update,
+)
+from dash.dependencies import MATCH, ALL
+import dash_bootstrap_components as dbc
+import plotly.graph_objects as go
+from flask import Response, request
+
+# Optional Prometheus support
+try:
+    from prometheus_client import (
+        CollectorRegistry,
+        Gauge,
+        CONTENT_TYPE_LATEST,
+        generate_latest,
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    # Create dummy classes if prometheus_client is not available
+    class CollectorRegistry:
+        pass
+    class Gauge:
+        def __init__(self, *args, **kwargs):
+            pass
+        def set(self, *args, **kwargs):
+            pass
+    CONTENT_TYPE_LATEST = "text/plain"
+    def generate_latest(*args, **kwargs):
+        return b"# Prometheus client not installed\n"
+
+# Optional async HTTP client for fleet mode
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+
+# Match ESP32 AP configuration in CAN_Data_Logger_Only.ino
 def _load_default_base_url():
-    default_url = "http://192.168.10.1"
-    try:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        ino_path = os.path.join(
-            base_dir, "CAN_Data_Logger_Only", "CAN_Data_Logger_Only.ino"
-        )
-        if not os.path.exists(ino_path):
-            return default_url
-        with open(ino_path, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-        match = re.search(
-            r"WIFI_AP_IP\\s+IPAddress\\((\\d+)\\s*,\\s*(\\d+)\\s*,\\s*(\\d+)\\s*,\\s*(\\d+)\\)",
-            text,
-        )
-        if match:
-            ip = ".".join(match.groups())
-            return f"http://{ip}"
-    except Exception:
-        pass
+    default_url = "http://192.168.10.1"
+    try:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        ino_path = os.path.join(
+            base_dir, "CAN_Data_Logger_Only", "CAN_Data_Logger_Only.ino"
+        )
+        if not os.path.exists(ino_path):
+            return default_url
+        with open(ino_path, "r", encoding="utf-8", errors="ignore") as f:
+            text = f.read()
+        match = re.search(
+            r"WIFI_AP_IP\\s+IPAddress\\((\\d+)\\s*,\\s*(\\d+)\\s*,\\s*(\\d+)\\s*,\\s*(\\d+)\\)",
+            text,
+        )
+        if match:
+            ip = ".".join(match.groups())
+            return f"http://{ip}"
+    except Exception:
+        pass
     return default_url
 
 
@@ -103,59 +118,136 @@ def _normalize_base_url(base_url: str) -> str:
 
 
 DEFAULT_BASE_URL = _load_default_base_url()
-LIVE_FETCH_LIMIT = _get_env_int("LIVE_FETCH_LIMIT", 50)
-MAX_HISTORY_ROWS = _get_env_int("LIVE_MAX_HISTORY_ROWS", 2000)
-if MAX_HISTORY_ROWS <= 0:
-    MAX_HISTORY_ROWS = None
+# Firmware live ring (LIVE_BUFFER_SIZE in CAN_Data_Logger_Encoded.ino); also the largest `limit` /live accepts.
+LIVE_BUFFER_SIZE = max(1, _get_env_int("LIVE_BUFFER_SIZE", 200))
+# Smallest (and starting) `limit`; raised with the observed frame rate up to LIVE_BUFFER_SIZE.
+LIVE_FETCH_LIMIT = max(1, min(_get_env_int("LIVE_FETCH_LIMIT", 50), LIVE_BUFFER_SIZE))
+# Points kept per signal in the server-side history rings.
+SIGNAL_HISTORY_POINTS = max(1000, _get_env_int("LIVE_SIGNAL_HISTORY", 100_000))
+RECENT_TABLE_ROWS = 100
 BUS_CURRENT_TRIGGER = _get_env_float("BUS_CURRENT_TRIGGER", 80.0)
 BUS_CURRENT_MIN = _get_env_float("BUS_CURRENT_MIN", -100.0)
 BUS_CURRENT_MAX = _get_env_float("BUS_CURRENT_MAX", 120.0)
 LIVE_POLL_TIMEOUT = _get_env_float("LIVE_POLL_TIMEOUT", 3.0)
+# Background ingest cadence (seconds); independent of the browser refresh.
+LIVE_POLL_INTERVAL = max(0.02, _get_env_float("LIVE_POLL_INTERVAL", 0.05))
+# Floor for the interval when a busy bus makes the pacer poll faster.
+LIVE_MIN_POLL_INTERVAL = 0.01
+# Window (seconds) of the "frames lost / s" figure.
+LOSS_WINDOW = 10.0
+LIVE_RETRY_INTERVAL = max(0.1, _get_env_float("LIVE_RETRY_INTERVAL", 1.0))
+# An ingest no page or /stream client has read for this long is stopped.
+LIVE_INGEST_IDLE = max(10.0, _get_env_float("LIVE_INGEST_IDLE", 300.0))
+UI_REFRESH_MS = max(100, _get_env_int("UI_REFRESH_MS", 500))
+# Server-sent events push of decoded values (/stream)
+STREAM_HEARTBEAT = max(1.0, _get_env_float("LIVE_STREAM_HEARTBEAT", 15.0))
+STREAM_QUEUE_DEPTH = 256
 GRAPH_MAX_POINTS = _get_env_int("GRAPH_MAX_POINTS", 600)
+# Fleet mode: connections shared by all device pollers, and how long a device
+# may go without new frames before it shows as idle.
+FLEET_MAX_CONNECTIONS = max(1, _get_env_int("LIVE_FLEET_CONNECTIONS", 32))
+FLEET_STALE_SECONDS = max(1.0, _get_env_float("LIVE_FLEET_STALE", 5.0))
+FLEET_RECONCILE_INTERVAL = 0.25
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DBC_DIR = os.path.join(BASE_DIR, "DBC_Dump")
+# The repository's shared DBC_Dump (also used by Live_Stand_In.py).
+REPO_DBC_DIR = os.path.join(os.path.dirname(BASE_DIR), "DBC_Dump")
 
 ENABLE_PROM_METRICS = os.getenv("ENABLE_PROM_METRICS", "true").lower() == "true" and PROMETHEUS_AVAILABLE
-
-# Prometheus registry and gauges (initialized lazily)
+
+# Prometheus registry and gauges (initialized lazily)
 metrics_registry = None
 signal_value_gauge = None
 poll_status_gauge = None
 last_seq_gauge = None
-
-
-def init_metrics():
-    """
-    Create Prometheus gauges once to avoid duplicate registration on reloads.
-    """
-    global metrics_registry, signal_value_gauge, poll_status_gauge, last_seq_gauge
-    if not ENABLE_PROM_METRICS or metrics_registry is not None:
-        return
-    
-    if not PROMETHEUS_AVAILABLE:
-        print("Warning: prometheus_client not available. Prometheus metrics disabled.")
-        return
-
-    metrics_registry = CollectorRegistry()
-    signal_value_gauge = Gauge(
-        "can_signal_value",
-        "Latest decoded CAN signal value",
-        ["signal", "message", "can_id", "unit"],
-        registry=metrics_registry,
-    )
-    poll_status_gauge = Gauge(
-        "can_poll_status",
-        "Poll status (1=ok, 0=error)",
-        registry=metrics_registry,
-    )
-    last_seq_gauge = Gauge(
-        "can_last_sequence",
-        "Latest sequence counter from ESP logger",
-        registry=metrics_registry,
-    )
-
-dbc_cache: Dict[str, cantools.database.can.Database] = {}
-last_bus_current_by_dbc: Dict[str, float] = {}
+frame_rate_gauge = None
+frames_lost_gauge = None
+frames_lost_rate_gauge = None
+fleet_up_gauge = None
+fleet_frame_rate_gauge = None
+fleet_lost_rate_gauge = None
+fleet_last_seq_gauge = None
+INGEST_LABELS = ["url", "dbc"]
+
+
+def init_metrics():
+    """
+    Create Prometheus gauges once to avoid duplicate registration on reloads.
+    """
+    global metrics_registry, signal_value_gauge, poll_status_gauge, last_seq_gauge
+    global frame_rate_gauge, frames_lost_gauge, frames_lost_rate_gauge
+    global fleet_up_gauge, fleet_frame_rate_gauge, fleet_lost_rate_gauge, fleet_last_seq_gauge
+    if not ENABLE_PROM_METRICS or metrics_registry is not None:
+        return
+    
+    if not PROMETHEUS_AVAILABLE:
+        print("Warning: prometheus_client not available. Prometheus metrics disabled.")
+        return
+
+    metrics_registry = CollectorRegistry()
+    # Live view gauges are per LiveIngest: labelled by logger URL and DBC id.
+    signal_value_gauge = Gauge(
+        "can_signal_value",
+        "Latest decoded CAN signal value",
+        INGEST_LABELS + ["signal", "message", "can_id", "unit"],
+        registry=metrics_registry,
+    )
+    poll_status_gauge = Gauge(
+        "can_poll_status",
+        "Poll status (1=ok, 0=error)",
+        INGEST_LABELS,
+        registry=metrics_registry,
+    )
+    last_seq_gauge = Gauge(
+        "can_last_sequence",
+        "Latest sequence counter from ESP logger",
+        INGEST_LABELS,
+        registry=metrics_registry,
+    )
+    frame_rate_gauge = Gauge(
+        "can_frame_rate",
+        "Observed logger frame rate (frames/s)",
+        INGEST_LABELS,
+        registry=metrics_registry,
+    )
+    frames_lost_gauge = Gauge(
+        "can_frames_lost_total",
+        "Frames missed by the live view (sequence gaps) since the ingest was configured",
+        INGEST_LABELS,
+        registry=metrics_registry,
+    )
+    frames_lost_rate_gauge = Gauge(
+        "can_frames_lost_per_second",
+        "Frames missed by the live view per second over the last LOSS_WINDOW seconds",
+        INGEST_LABELS,
+        registry=metrics_registry,
+    )
+    fleet_up_gauge = Gauge(
+        "can_fleet_device_up",
+        "Fleet device poll status (1=ok, 0=error)",
+        ["device"],
+        registry=metrics_registry,
+    )
+    fleet_frame_rate_gauge = Gauge(
+        "can_fleet_frame_rate",
+        "Observed frame rate per fleet device (frames/s)",
+        ["device"],
+        registry=metrics_registry,
+    )
+    fleet_lost_rate_gauge = Gauge(
+        "can_fleet_frames_lost_per_second",
+        "Frames missed per second per fleet device",
+        ["device"],
+        registry=metrics_registry,
+    )
+    fleet_last_seq_gauge = Gauge(
+        "can_fleet_last_sequence",
+        "Latest sequence counter per fleet device",
+        ["device"],
+        registry=metrics_registry,
+    )
+
+dbc_cache: Dict[str, "LiveDecoder"] = {}
 http_session = requests.Session()
 http_session.headers.update({"Connection": "keep-alive"})
 
@@ -203,28 +295,38 @@ def list_dbc_files() -> List[Dict[str, str]]:
 DBC_FILE_OPTIONS = list_dbc_files()
 
 
+def _register_decoder(raw: bytes, db) -> str:
+    """
+    dbc_cache id of a DBC: a hash of the file contents, so every page and
+    poller that loads the same DBC shares one decoder (and one LiveIngest).
+    """
+    dbc_id = hashlib.sha1(raw).hexdigest()[:16]
+    if dbc_id not in dbc_cache:
+        dbc_cache[dbc_id] = LiveDecoder(db)
+    return dbc_id
+
+
 def parse_dbc_upload(contents: str, filename: str) -> Dict:
-    """
-    Decode an uploaded DBC file, load it with cantools, and capture the layout.
-    """
-    _, encoded = contents.split(",", 1)
-    decoded_bytes = base64.b64decode(encoded)
-    db = cantools.database.load_string(decoded_bytes.decode("latin-1"))
-
-    layout = []
-    for message in db.messages:
-        layout.append(
-            {
-                "message": message.name,
-                "signals": [
-                    {"name": signal.name, "unit": signal.unit or ""}
-                    for signal in message.signals
-                ],
-            }
-        )
-
-    dbc_id = str(uuid.uuid4())
-    dbc_cache[dbc_id] = db
+    """
+    Decode an uploaded DBC file, load it with cantools, and capture the layout.
+    """
+    _, encoded = contents.split(",", 1)
+    decoded_bytes = base64.b64decode(encoded)
+    db = cantools.database.load_string(decoded_bytes.decode("latin-1"))
+
+    layout = []
+    for message in db.messages:
+        layout.append(
+            {
+                "message": message.name,
+                "signals": [
+                    {"name": signal.name, "unit": signal.unit or ""}
+                    for signal in message.signals
+                ],
+            }
+        )
+
+    dbc_id = _register_decoder(decoded_bytes, db)
     return {"id": dbc_id, "name": filename, "layout": layout}
 
 
@@ -232,6 +334,8 @@ def parse_dbc_file(path: str) -> Dict:
     """
     Decode a DBC file from disk (from DBC_Dump) and capture the layout.
     """
+    with open(path, "rb") as f:
+        raw = f.read()
     db = cantools.database.load_file(path)
 
     layout = []
@@ -246,8 +350,7 @@ def parse_dbc_file(path: str) -> Dict:
             }
         )
 
-    dbc_id = str(uuid.uuid4())
-    dbc_cache[dbc_id] = db
+    dbc_id = _register_decoder(raw, db)
     return {"id": dbc_id, "name": os.path.basename(path), "layout": layout}
 
 
@@ -283,94 +386,135 @@ def _filter_new_frames(frames: List[Dict], last_seq: int) -> List[Dict]:
     return filtered
 
 
-def _apply_bus_current_correction(
-    dbc_id: str,
-    message: cantools.database.can.Message,
-    data_bytes: bytes,
-    decoded: Dict,
-) -> Dict:
-    bus_key = None
-    for key in decoded.keys():
-        if _normalize_signal_name(key) == "buscurrent":
-            bus_key = key
-            break
-    if not bus_key:
-        return decoded
+class BusCurrentSpec:
+    """Bus_current signal parameters for the sanity correction, resolved once per message."""
 
-    try:
-        bus_float = float(decoded.get(bus_key))
-    except Exception:
-        return decoded
+    __slots__ = ("name", "scale", "offset", "length", "start", "is_signed")
 
-    if abs(bus_float) <= BUS_CURRENT_TRIGGER:
-        last_bus_current_by_dbc[dbc_id] = bus_float
-        return decoded
+    def __init__(self, signal):
+        self.name = signal.name
+        try:
+            self.scale = float(getattr(signal, "scale", 1.0))
+        except Exception:
+            self.scale = 1.0
+        try:
+            self.offset = float(getattr(signal, "offset", 0.0))
+        except Exception:
+            self.offset = 0.0
+        try:
+            self.length = int(getattr(signal, "length", 16))
+        except Exception:
+            self.length = 16
+        try:
+            self.start = int(getattr(signal, "start", 0))
+        except Exception:
+            self.start = 0
+        try:
+            self.is_signed = bool(getattr(signal, "is_signed", False))
+        except Exception:
+            self.is_signed = False
 
-    try:
-        raw_map = message.decode(data_bytes, decode_choices=False, scaling=False)
-    except Exception:
-        raw_map = {}
+    def raw_value(self, value: float) -> int:
+        """Unscaled value of a decoded (scaled) sample: the inverse of raw * scale + offset."""
+        return int(round((value - self.offset) / self.scale)) if self.scale else int(value)
 
-    raw_bus = None
-    bus_sig = None
-    try:
-        for s in message.signals:
-            if _normalize_signal_name(s.name) == "buscurrent":
-                bus_sig = s
-                break
-        for k, v in raw_map.items():
-            if _normalize_signal_name(k) == "buscurrent":
-                raw_bus = v
+
+class SignalMeta:
+    """Display metadata of one DBC signal, interned once per DBC (LiveDecoder.signals)."""
+
+    __slots__ = ("name", "unit", "message", "can_hex")
+
+    def __init__(self, name: str, unit: str, message: str, can_hex: str):
+        self.name = name
+        self.unit = unit
+        self.message = message
+        self.can_hex = can_hex
+
+
+class CompiledMessage:
+    """
+    One DBC message prepared for the live decode path: name, CAN ID text,
+    the DBC-wide index of each signal and the Bus_current spec are looked up
+    once, at DBC load.
+    """
+
+    __slots__ = ("message", "name", "can_hex", "names", "indices", "index_of", "bus")
+
+    def __init__(self, message: cantools.database.can.Message, first_index: int = 0):
+        self.message = message
+        self.name = message.name
+        self.can_hex = f"0x{message.frame_id:03X}"
+        self.names = tuple(signal.name for signal in message.signals)
+        self.indices = tuple(range(first_index, first_index + len(self.names)))
+        self.index_of = dict(zip(self.names, self.indices))
+        self.bus = None
+        for signal in message.signals:
+            if _normalize_signal_name(signal.name) == "buscurrent":
+                self.bus = BusCurrentSpec(signal)
                 break
-    except Exception:
-        raw_bus = None
-        bus_sig = None
 
-    if raw_bus is None or bus_sig is None:
-        return decoded
 
-    try:
-        scale = float(getattr(bus_sig, "scale", 1.0))
-    except Exception:
-        scale = 1.0
-    try:
-        offset = float(getattr(bus_sig, "offset", 0.0))
-    except Exception:
-        offset = 0.0
-    try:
-        length = int(getattr(bus_sig, "length", 16))
-    except Exception:
-        length = 16
-    try:
-        start_bit = int(getattr(bus_sig, "start", 0))
-    except Exception:
-        start_bit = 0
-    try:
-        is_signed = bool(getattr(bus_sig, "is_signed", False))
-    except Exception:
-        is_signed = False
+class LiveDecoder:
+    """
+    Per-DBC dispatch table for live decoding: frame ID -> CompiledMessage.
+    Built when the DBC is loaded, so decode_frames() does no per-frame
+    metadata lookups. `signals` is the DBC's signal table; LiveFrame records
+    refer to it by index.
+    """
+
+    def __init__(self, db: cantools.database.can.Database):
+        self.db = db
+        self.by_id: Dict[int, CompiledMessage] = {}
+        self.signals: List[SignalMeta] = []
+        for message in db.messages:
+            compiled = CompiledMessage(message, first_index=len(self.signals))
+            self.by_id[message.frame_id] = compiled
+            for signal in message.signals:
+                self.signals.append(
+                    SignalMeta(signal.name, signal.unit or "", compiled.name, compiled.can_hex)
+                )
+
+    def get(self, frame_id: int) -> Optional[CompiledMessage]:
+        return self.by_id.get(frame_id)
+
+
+class LiveFrame:
+    """
+    One decoded CAN frame: frame fields plus parallel `indices` (into
+    LiveDecoder.signals) and `values`. Message, CAN ID, signal name and unit
+    are not repeated per value; expand_rows() builds the per-signal view for
+    display.
+    """
+
+    __slots__ = ("seq", "time", "unix", "timestamp", "indices", "values")
+
+    def __init__(self, seq, time_text, unix, timestamp, indices, values):
+        self.seq = seq
+        self.time = time_text
+        self.unix = unix
+        self.timestamp = timestamp
+        self.indices = indices
+        self.values = values
 
+
+def _bus_current_candidates(bus: BusCurrentSpec, raw_bus: int, data_bytes: bytes) -> List[float]:
+    """Alternate readings of an implausible Bus_current: offset removed, byte-swapped, re-extracted."""
+    scale, offset, length, start_bit = bus.scale, bus.offset, bus.length, bus.start
     candidates = []
 
     def _add_candidates(raw_val: int) -> None:
         candidates.append(raw_val * scale + offset)
         candidates.append(raw_val * scale)
 
-    try:
-        _add_candidates(int(raw_bus))
-    except Exception:
-        pass
+    _add_candidates(raw_bus)
 
     if length == 16:
-        try:
-            swapped = ((int(raw_bus) & 0xFF) << 8) | ((int(raw_bus) >> 8) & 0xFF)
-            _add_candidates(swapped)
-        except Exception:
-            pass
+        swapped = ((raw_bus & 0xFF) << 8) | ((raw_bus >> 8) & 0xFF)
+        _add_candidates(swapped)
 
     raw_le = _extract_raw_signal(data_bytes, start_bit, length, "little_endian")
     raw_be = _extract_raw_signal(data_bytes, start_bit, length, "big_endian")
-    if is_signed:
+    if bus.is_signed:
         sign_mask = 1 << (length - 1)
         if raw_le & sign_mask:
             raw_le -= (1 << length)
@@ -379,215 +523,1213 @@ def _apply_bus_current_correction(
     _add_candidates(raw_le)
     _add_candidates(raw_be)
 
+    byte_index = start_bit // 8
+    if 0 <= byte_index and byte_index + 1 < len(data_bytes):
+        word_be = (data_bytes[byte_index] << 8) | data_bytes[byte_index + 1]
+        word_le = data_bytes[byte_index] | (data_bytes[byte_index + 1] << 8)
+        _add_candidates(word_be)
+        _add_candidates(word_le)
+    return candidates
+
+
+def _apply_bus_current_correction(
+    correction: Dict,
+    compiled: CompiledMessage,
+    data_bytes: bytes,
+    decoded: Dict,
+) -> Dict:
+    """
+    Replace an implausible Bus_current with the candidate closest to the
+    previous reading. `correction` holds that reading; it belongs to one
+    logger, so devices never see each other's values.
+    """
+    bus = compiled.bus
+    if bus is None or bus.name not in decoded:
+        return decoded
+
     try:
-        byte_index = start_bit // 8
-        if byte_index + 1 < len(data_bytes):
-            word_be = (data_bytes[byte_index] << 8) | data_bytes[byte_index + 1]
-            word_le = data_bytes[byte_index] | (data_bytes[byte_index + 1] << 8)
-            _add_candidates(word_be)
-            _add_candidates(word_le)
+        bus_float = float(decoded[bus.name])
     except Exception:
-        pass
+        return decoded
+
+    if abs(bus_float) <= BUS_CURRENT_TRIGGER:
+        correction["bus_current"] = bus_float
+        return decoded
+
+    try:
+        candidates = _bus_current_candidates(bus, bus.raw_value(bus_float), data_bytes)
+    except Exception:
+        return decoded
 
     valid = [v for v in candidates if BUS_CURRENT_MIN <= v <= BUS_CURRENT_MAX]
     if valid:
-        last_val = last_bus_current_by_dbc.get(dbc_id)
+        last_val = correction.get("bus_current")
         if last_val is not None:
             best = min(valid, key=lambda v: abs(v - last_val))
         else:
             best = min(valid, key=lambda v: abs(v))
-        decoded[bus_key] = best
-        last_bus_current_by_dbc[dbc_id] = best
+        decoded[bus.name] = best
+        correction["bus_current"] = best
     else:
-        last_bus_current_by_dbc[dbc_id] = bus_float
+        correction["bus_current"] = bus_float
 
     return decoded
 
 
-def decode_frames(dbc_id: str, frames: List[Dict]) -> List[Dict]:
-    """
-    Return a list of decoded signal rows from the raw frame payload.
-    """
-    db = dbc_cache.get(dbc_id)
-    if not db:
+def _frame_bytes(data) -> bytes:
+    try:
+        # Each item is one byte; pad unpadded ones ("A") so pairs stay aligned.
+        return bytes.fromhex("".join(byte.zfill(2) for byte in data))
+    except (AttributeError, ValueError):
+        # Anything fromhex rejects (e.g. "0x1A", surrounding spaces)
+        return bytes(int(byte, 16) for byte in data)
+
+
+def decode_frames(dbc_id: str, frames: List[Dict], correction: Dict) -> List[LiveFrame]:
+    """
+    Decode the raw frame payload into one LiveFrame per decodable frame.
+    `correction` is the Bus_current correction state of the logger that sent them.
+    """
+    decoder = dbc_cache.get(dbc_id)
+    if not decoder:
         raise RuntimeError("Loaded DBC not found. Please select again.")
-
-    rows = []
-    for frame in frames:
-        try:
-            frame_id = int(frame.get("id", "0"), 16)
-            data_bytes = bytes(int(byte, 16) for byte in frame.get("data", []))
-        except (ValueError, TypeError):
-            continue
-
+
+    records = []
+    for frame in frames:
         try:
-            message = db.get_message_by_frame_id(frame_id)
-            decoded = message.decode(data_bytes)
-            decoded = _apply_bus_current_correction(
-                dbc_id,
-                message,
-                data_bytes,
-                decoded,
-            )
+            frame_id = int(frame.get("id", "0"), 16)
+            data_bytes = _frame_bytes(frame.get("data", []))
+        except (ValueError, TypeError):
+            continue
+
+        compiled = decoder.get(frame_id)
+        if compiled is None:
+            continue
+        try:
+            decoded = compiled.message.decode(data_bytes)
+            if compiled.bus is not None:
+                decoded = _apply_bus_current_correction(correction, compiled, data_bytes, decoded)
         except Exception:
             continue
-
-        timestamp = frame.get("time", "")
-        unix_time = frame.get("unix", 0)
-        seq = frame.get("seq", 0)
-        can_hex = f"0x{frame_id:03X}"
-        for signal_name, value in decoded.items():
-            signal = message.get_signal_by_name(signal_name)
-            rows.append(
-                {
-                    "Seq": seq,
-                    "Time": timestamp,
-                    "Unix": unix_time,
-                    "CAN_ID": can_hex,
-                    "Message": message.name,
-                    "Signal": signal_name,
-                    "Value": value,
-                    "Unit": signal.unit or "",
-                }
-            )
-    return rows
-
-
-def limit_history(history: List[Dict], new_rows: List[Dict]) -> List[Dict]:
-    """
-    Append new rows to the end of history in chronological order
-    and (optionally) enforce a maximum length.
-    """
-
-    if not new_rows:
-        return history
-
-    history = history or []
-
-    # --- NEW: make sure the batch itself is in time order ---
-    # Prefer Unix (numeric) if present, otherwise fall back to Seq
-    if isinstance(new_rows, list) and new_rows:
-        if "Unix" in new_rows[0]:
-            new_rows = sorted(new_rows, key=lambda r: r.get("Unix", 0))
-        elif "Seq" in new_rows[0]:
-            new_rows = sorted(new_rows, key=lambda r: r.get("Seq", 0))
-    # ---------------------------------------------------------
-
-    updated = history + new_rows
-
-    if MAX_HISTORY_ROWS is not None and len(updated) > MAX_HISTORY_ROWS:
-        updated = updated[-MAX_HISTORY_ROWS:]
-
-    return updated
-
-
-
-def build_message_cards(
-    layout: List[Dict], latest: Dict[str, Dict], theme: str = "light"
-) -> List[dbc.Row]:
-    """
-    Assemble the colored cards grouped by message.
-    """
-
+
+        names = tuple(decoded)
+        if names == compiled.names:
+            indices = compiled.indices
+        else:
+            # Multiplexed messages decode a subset of their signals
+            index_of = compiled.index_of
+            indices = tuple(index_of[name] for name in names)
+        records.append(
+            LiveFrame(
+                frame.get("seq", 0),
+                frame.get("time", ""),
+                frame.get("unix", 0),
+                _frame_time(frame),
+                indices,
+                list(decoded.values()),
+            )
+        )
+    return records
+
+
+def expand_rows(decoder: LiveDecoder, records) -> List[Dict]:
+    """Per-signal rows (Seq, Time, Unix, Timestamp, CAN_ID, Message, Signal, Value, Unit) for display."""
+    signals = decoder.signals
+    rows = []
+    for record in records:
+        for index, value in zip(record.indices, record.values):
+            meta = signals[index]
+            rows.append(
+                {
+                    "Seq": record.seq,
+                    "Time": record.time,
+                    "Unix": record.unix,
+                    "Timestamp": record.timestamp,
+                    "CAN_ID": meta.can_hex,
+                    "Message": meta.message,
+                    "Signal": meta.name,
+                    "Value": value,
+                    "Unit": meta.unit,
+                }
+            )
+    return rows
+
+
+def _time_ordered(records: List[LiveFrame]) -> List[LiveFrame]:
+    """
+    Put one decoded batch in time order before it is appended to history.
+    Sorted on Unix; the sort is stable, so frames of one second keep their seq order.
+    """
+    return sorted(records, key=lambda r: r.unix or 0)
+
+
+def _frame_time(frame: Dict) -> Optional[float]:
+    """Frame time in epoch seconds: `unix` plus the sub-second `micros` when valid."""
+    unix_time = frame.get("unix", 0)
+    try:
+        seconds = float(unix_time)
+    except (TypeError, ValueError):
+        return None
+    micros = _safe_int(frame.get("micros", 0), 0)
+    if 0 < micros < 1_000_000:
+        seconds += micros / 1e6
+    return seconds
+
+
+def _format_value(value) -> str:
+    """Display text of a decoded value (message cards and pushed deltas)."""
+    return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+
+def _numeric_value(value) -> float:
+    """Plot value of a decoded signal; choice values use their raw number, text is NaN."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    raw = getattr(value, "value", None)
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    return float("nan")
+
+
+class SignalRing:
+    """
+    Fixed-capacity history of one signal in NumPy arrays: time (epoch s),
+    value and seq. The arrays grow by doubling up to `capacity` and are then
+    reused as a ring, overwriting the oldest points. `total` counts every
+    point ever appended, so it works as a cursor for "points since".
+    """
+
+    INITIAL_POINTS = 1024
+
+    def __init__(self, capacity: int = SIGNAL_HISTORY_POINTS):
+        self.capacity = capacity
+        size = min(self.INITIAL_POINTS, capacity)
+        self.t = np.empty(size, dtype=np.float64)
+        self.v = np.empty(size, dtype=np.float64)
+        self.seq = np.empty(size, dtype=np.int64)
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def _grow(self, needed: int) -> None:
+        size = len(self.t)
+        if needed <= size or size >= self.capacity:
+            return
+        new_size = min(self.capacity, max(needed, size * 2))
+        for name in ("t", "v", "seq"):
+            old = getattr(self, name)
+            arr = np.empty(new_size, dtype=old.dtype)
+            arr[:size] = old
+            setattr(self, name, arr)
+
+    def extend(self, t, v, seq) -> None:
+        t = np.asarray(t, dtype=np.float64)
+        n = len(t)
+        if not n:
+            return
+        v = np.asarray(v, dtype=np.float64)
+        seq = np.asarray(seq, dtype=np.int64)
+        if n > self.capacity:
+            t, v, seq = t[-self.capacity:], v[-self.capacity:], seq[-self.capacity:]
+            self.total += n - self.capacity
+            n = self.capacity
+        self._grow(self.total + n)
+        size = len(self.t)
+        start = self.total % size
+        first = min(n, size - start)
+        for arr, src in ((self.t, t), (self.v, v), (self.seq, seq)):
+            arr[start:start + first] = src[:first]
+            arr[:n - first] = src[first:]
+        self.total += n
+
+    def since(self, cursor: int, max_points: Optional[int] = None):
+        """(t, v, seq) copies of the points appended after `cursor`, oldest first."""
+        count = len(self)
+        n = min(count, max(0, self.total - cursor))
+        if max_points is not None:
+            n = min(n, max_points)
+        if not n:
+            empty = np.empty(0)
+            return empty, empty, np.empty(0, dtype=np.int64)
+        size = len(self.t)
+        idx = np.arange(self.total - n, self.total) % size
+        return self.t[idx], self.v[idx], self.seq[idx]
+
+    def tail(self, max_points: Optional[int] = None):
+        """(t, v, seq) copies of the newest `max_points` points, oldest first."""
+        return self.since(0, max_points)
+
+
+class SignalHistory:
+    """
+    Server-side live history: one SignalRing per signal, plus the last few
+    decoded frames for the table. Only a cursor (the ingest data_version) goes
+    to the browser; callbacks read windows from here. `epoch` changes on
+    every clear(), so ring cursors held by a graph can be recognised as stale.
+    """
+
+    def __init__(self, capacity: int = SIGNAL_HISTORY_POINTS, recent_rows: int = RECENT_TABLE_ROWS):
+        self.capacity = capacity
+        self.rings: Dict[str, SignalRing] = {}
+        # Every frame has at least one value, so this many frames cover the table.
+        self.recent_limit = recent_rows
+        self.recent = deque(maxlen=recent_rows)
+        self.decoder: Optional[LiveDecoder] = None
+        self.epoch = 0
+
+    def clear(self) -> None:
+        self.rings.clear()
+        self.recent.clear()
+        self.decoder = None
+        self.epoch += 1
+
+    def append_frames(self, decoder: LiveDecoder, records: List[LiveFrame]) -> None:
+        signals = decoder.signals
+        columns: Dict[str, tuple] = {}
+        for record in records:
+            t, seq = record.timestamp, _safe_int(record.seq, 0)
+            for index, value in zip(record.indices, record.values):
+                name = signals[index].name
+                cols = columns.get(name)
+                if cols is None:
+                    cols = columns[name] = ([], [], [])
+                cols[0].append(t)
+                cols[1].append(_numeric_value(value))
+                cols[2].append(seq)
+        for name, (t, v, seq) in columns.items():
+            ring = self.rings.get(name)
+            if ring is None:
+                ring = self.rings[name] = SignalRing(self.capacity)
+            ring.extend(t, v, seq)
+        self.decoder = decoder
+        self.recent.extend(records)
+
+    def recent_rows(self) -> List[Dict]:
+        """The newest `recent_limit` per-signal rows, oldest first."""
+        if self.decoder is None:
+            return []
+        picked, count = [], 0
+        for record in reversed(self.recent):
+            picked.append(record)
+            count += len(record.values)
+            if count >= self.recent_limit:
+                break
+        rows = expand_rows(self.decoder, reversed(picked))
+        return rows[-self.recent_limit:]
+
+
+def _seq_gaps(seqs: List[int], last_seq: int) -> int:
+    """Frames missing between `last_seq` and the sorted `seqs` of a batch, and inside it."""
+    lost = 0
+    prev = last_seq if last_seq > 0 else None
+    for seq in seqs:
+        if prev is not None and seq > prev + 1:
+            lost += seq - prev - 1
+        prev = seq
+    return lost
+
+
+class LiveBatch:
+    """
+    One /live response checked against a client's cursor (last seq, boot id):
+    the new frames, whether the logger rebooted, where the next poll resumes
+    and how many frames were lost to sequence gaps.
+    """
+
+    __slots__ = ("frames", "raw_count", "latest", "boot", "reset", "next_seq", "newest_seq", "lost")
+
+    def __init__(self, payload: Dict, last_seq: int, boot_state=None):
+        last_seq = last_seq or 0
+        self.latest = _safe_int(payload.get("latest", last_seq), last_seq)
+        self.boot = payload.get("boot", None)
+        raw_frames = payload.get("frames", [])
+        self.raw_count = len(raw_frames)
+        self.reset = (
+            (boot_state is not None and self.boot is not None and self.boot != boot_state)
+            or self.latest < last_seq
+        )
+        if self.reset:
+            last_seq = 0
+
+        self.frames = _filter_new_frames(raw_frames, last_seq)
+        self.newest_seq = max((_safe_int(f.get("seq", -1), -1) for f in self.frames), default=-1)
+        # Resume after the newest frame received, not at `latest`: when the
+        # batch was cut by `limit` the rest is fetched by the next poll.
+        if self.frames:
+            self.next_seq = max(last_seq, self.newest_seq)
+        else:
+            self.next_seq = max(last_seq, self.latest)
+        # Seqs skipped before or inside the batch aged out of the logger's
+        # ring (or were overwritten while it answered). Not counted on the
+        # first poll or after a reboot, where there is nothing to resume.
+        if last_seq and self.frames:
+            self.lost = _seq_gaps(sorted(_safe_int(f.get("seq", 0), 0) for f in self.frames), last_seq)
+        elif last_seq:
+            self.lost = self.next_seq - last_seq
+        else:
+            self.lost = 0
+
+    @property
+    def backlog(self) -> bool:
+        """
+        True when the logger reported newer frames than this batch carried.
+        The logger may skip seqs (overwritten slots), so this compares against
+        the newest seq delivered rather than a frame count.
+        """
+        return bool(self.frames) and self.latest > self.newest_seq
+
+
+class PollPacer:
+    """
+    Picks the /live `limit` and the poll interval from the logger's frame rate.
+
+    The rate is a moving average of how fast `latest` advances between polls,
+    and the round trip a moving average of the fetch time. The interval is
+    shortened when needed so that one poll gap (interval + round trip) covers
+    at most half the logger's ring, and `limit` covers one gap with headroom.
+    So `since` does not age out of the ring, which is what drops frames.
+    """
+
+    HEADROOM = 1.5
+    SMOOTHING = 0.3
+
+    def __init__(self, min_limit: int = LIVE_FETCH_LIMIT, max_limit: int = LIVE_BUFFER_SIZE):
+        self.max_limit = max_limit
+        self.min_limit = max(1, min(min_limit, max_limit))
+        self.reset()
+
+    def reset(self) -> None:
+        self.rate = 0.0
+        self.rtt = 0.0
+        self.limit = self.min_limit
+        self._mark = None
+
+    def _smooth(self, current: float, sample: float) -> float:
+        return sample if not current else current + self.SMOOTHING * (sample - current)
+
+    def observe(self, latest: int, now: float, rtt: float, base_interval: float) -> None:
+        self.rtt = self._smooth(self.rtt, rtt)
+        if self._mark is not None:
+            then, then_latest = self._mark
+            if latest < then_latest:
+                self.rate = 0.0
+            elif now > then:
+                self.rate = self._smooth(self.rate, (latest - then_latest) / (now - then))
+        self._mark = (now, latest)
+        gap = self.interval(base_interval) + self.rtt
+        wanted = int(self.rate * gap * self.HEADROOM) + 1
+        self.limit = max(self.min_limit, min(self.max_limit, wanted))
+
+    def interval(self, base_interval: float) -> float:
+        if self.rate <= 0:
+            return base_interval
+        ceiling = 0.5 * self.max_limit / self.rate - self.rtt
+        return max(LIVE_MIN_POLL_INTERVAL, min(base_interval, ceiling))
+
+
+class FrameLossMeter:
+    """Frames lost to sequence gaps: running total and the rate over the last `window` seconds."""
+
+    def __init__(self, window: float = LOSS_WINDOW):
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        self.total = 0
+        self.received = 0
+        self._events = deque()
+        self._started = None
+
+    def record(self, lost: int, received: int, now: float) -> None:
+        if self._started is None:
+            self._started = now
+        self.total += lost
+        self.received += received
+        if lost:
+            self._events.append((now, lost))
+        while self._events and self._events[0][0] < now - self.window:
+            self._events.popleft()
+
+    def per_second(self, now: float) -> float:
+        if self._started is None:
+            return 0.0
+        while self._events and self._events[0][0] < now - self.window:
+            self._events.popleft()
+        span = max(1.0, min(self.window, now - self._started))
+        return sum(lost for _, lost in self._events) / span
+
+
+class LiveIngest:
+    """
+    Background /live poller feeding an in-process ring buffer.
+
+    A daemon thread polls the logger with since=<last seq> every
+    LIVE_POLL_INTERVAL seconds (and again right away while the logger still
+    has newer frames), decodes them with the selected DBC and appends the
+    values to per-signal rings (SignalHistory). Dash callbacks only read snapshots, so the poll rate no
+    longer depends on browser timers or callback latency, and a throttled tab
+    does not make the dashboard miss frames.
+
+    There is one ingest per logger URL and DBC (live_ingest_for); pages read
+    the one named by their ingest-key store and never reconfigure it.
+    """
+
+    def __init__(self, history_points: int = SIGNAL_HISTORY_POINTS,
+                 interval: float = LIVE_POLL_INTERVAL, limit: int = LIVE_FETCH_LIMIT):
+        # Base interval and smallest limit; the pacer adapts both to the frame rate.
+        self.interval = interval
+        self.pacer = PollPacer(limit)
+        self.loss = FrameLossMeter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.base_url = DEFAULT_BASE_URL
+        self.dbc_id = None
+        self.history = SignalHistory(history_points)
+        # Bus_current correction state of this logger (see _apply_bus_current_correction).
+        self.correction: Dict = {}
+        self._reset_state()
+        self.status_text = "Click Start Live Data to begin."
+        self.poll_info = {"ok": False, "last_seq": 0, "frames": 0, "decoded": 0}
+        # Bumped on every state change; data_version only when rows change.
+        self.version = 0
+        self.data_version = 0
+        # Bumped by configure(); a poll started under an older config is dropped.
+        self._generation = 0
+        # One queue per /stream client; deltas are pushed as they are decoded.
+        self._subscribers: List[queue.Queue] = []
+        # Signal-value label sets exported to Prometheus (removed with the ingest).
+        self._metric_series = set()
+        # Last page read (snapshot/rows/points); idle ingests are stopped.
+        self.last_read = time.monotonic()
+
+    def _reset_state(self) -> None:
+        self.history.clear()
+        self.latest = {}
+        self.last_seq = 0
+        self.boot = None
+        # The logger's seq restarts, so its rate is measured afresh.
+        self.pacer.reset()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def configure(self, base_url: str, dbc_id: Optional[str]) -> None:
+        """Point the worker at a logger and DBC; history is cleared when either changes."""
+        base_url = _normalize_base_url(base_url or DEFAULT_BASE_URL)
+        with self._lock:
+            if base_url == self.base_url and dbc_id == self.dbc_id:
+                return
+            self._remove_metrics()
+            self.base_url = base_url
+            self.dbc_id = dbc_id
+            self._generation += 1
+            self._reset_state()
+            self.loss.reset()
+            self.correction = {}
+            self.poll_info = {"ok": False, "last_seq": 0, "frames": 0, "decoded": 0}
+            self.version += 1
+            self.data_version += 1
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="live-ingest", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def snapshot(self) -> Dict:
+        """Consistent copy of the current state for the Dash callbacks."""
+        with self._lock:
+            self.last_read = time.monotonic()
+            return {
+                "version": self.version,
+                "data_version": self.data_version,
+                "latest": dict(self.latest),
+                "seq": self.last_seq,
+                "boot": self.boot,
+                "status": self.status_text,
+                "poll": dict(self.poll_info, version=self.version),
+            }
+
+    def subscribe(self) -> queue.Queue:
+        """Queue receiving every decoded delta (JSON text) until unsubscribe()."""
+        q = queue.Queue(maxsize=STREAM_QUEUE_DEPTH)
+        with self._lock:
+            self._subscribers.append(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue) -> None:
+        with self._lock:
+            if q in self._subscribers:
+                self._subscribers.remove(q)
+
+    @staticmethod
+    def _delta(changed: Dict[str, Dict], seq: int) -> str:
+        """
+        Compact push message: the newest value per signal of one batch,
+        pre-formatted like the cards: {"q": seq, "ts": sent, "s": {name: [value, time]}}.
+        """
+        values = {name: [_format_value(entry["Value"]), entry["Time"]] for name, entry in changed.items()}
+        return json.dumps({"q": seq, "ts": time.time(), "s": values}, separators=(",", ":"))
+
+    def _push(self, subscribers: List[queue.Queue], message: str) -> None:
+        for q in subscribers:
+            try:
+                q.put_nowait(message)
+            except queue.Full:
+                # A stalled client only loses its oldest deltas.
+                try:
+                    q.get_nowait()
+                    q.put_nowait(message)
+                except (queue.Empty, queue.Full):
+                    pass
+
+    def signal_points(self, signals: List[str], cursors: Optional[List[int]] = None,
+                      max_points: Optional[int] = None):
+        """
+        New points of several signals in one consistent read.
+
+        Returns (epoch, [(t, v, total), ...]): for each signal the points
+        appended after its cursor (all retained points when `cursors` is None),
+        at most `max_points`, and the ring's total as the next cursor.
+        """
+        out = []
+        with self._lock:
+            self.last_read = time.monotonic()
+            for i, signal in enumerate(signals):
+                ring = self.history.rings.get(signal)
+                if ring is None:
+                    out.append((np.empty(0), np.empty(0), 0))
+                    continue
+                cursor = cursors[i] if cursors is not None else 0
+                t, v, _ = ring.since(cursor, max_points)
+                out.append((t, v, ring.total))
+            return self.history.epoch, out
+
+    def recent_rows(self) -> List[Dict]:
+        with self._lock:
+            self.last_read = time.monotonic()
+            return self.history.recent_rows()
+
+    def touch(self) -> None:
+        """Mark the ingest as read (a page resolved it), even without a snapshot."""
+        with self._lock:
+            self.last_read = time.monotonic()
+
+    def idle(self, now: float) -> bool:
+        """No /stream client and no page resolved or read it for LIVE_INGEST_IDLE seconds."""
+        with self._lock:
+            return not self._subscribers and now - self.last_read > LIVE_INGEST_IDLE
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                backlog = self.poll_once()
+                delay = 0.0 if backlog else self.pacer.interval(self.interval)
+            except Exception:
+                delay = LIVE_RETRY_INTERVAL
+            if delay:
+                self._stop.wait(delay)
+
+    def poll_once(self) -> bool:
+        """
+        Fetch and decode one batch. Returns True when the logger reported newer
+        frames than this batch carried, i.e. the next poll should not wait.
+        """
+        with self._lock:
+            generation = self._generation
+            base_url, dbc_id, last_seq, boot_state = self.base_url, self.dbc_id, self.last_seq, self.boot
+            limit, correction = self.pacer.limit, self.correction
+        if not dbc_id:
+            self._publish(generation, status="Select a DBC file to decode data.")
+            return False
+
+        try:
+            started = time.monotonic()
+            payload = fetch_live_frames(base_url, last_seq, limit)
+            rtt = time.monotonic() - started
+            batch = LiveBatch(payload, last_seq, boot_state)
+            decoder = dbc_cache.get(dbc_id)
+            records = decode_frames(dbc_id, batch.frames, correction)
+        except Exception as exc:
+            self._publish(generation, status=f"Connection error: {exc}",
+                          poll_info={"ok": False, "error": str(exc)})
+            raise
+
+        decoded_count = sum(len(record.values) for record in records)
+
+        status_prefix = "ESP reboot detected; resyncing. " if batch.reset else ""
+        if decoded_count:
+            status_text = status_prefix
+        elif batch.raw_count:
+            status_text = status_prefix + "Live frames received, but no signals decoded. Check DBC."
+        else:
+            status_text = status_prefix + "Connected, waiting for CAN frames..."
+
+        poll_info = {
+            "ok": True,
+            "last_seq": batch.next_seq,
+            "frames": batch.raw_count,
+            "decoded": decoded_count,
+        }
+        if batch.reset:
+            poll_info["reset"] = True
+
+        self._publish(
+            generation,
+            status=status_text,
+            poll_info=poll_info,
+            decoder=decoder,
+            records=_time_ordered(records),
+            seq=batch.next_seq,
+            boot=batch.boot,
+            reset=batch.reset,
+            pacing=(batch.latest, rtt, batch.lost, len(batch.frames)),
+        )
+        return batch.backlog
+
+    def _record_pacing(self, poll_info: Dict, latest: int, rtt: float, lost: int, received: int) -> None:
+        """Feed one poll to the pacer and loss meter; adds their figures to `poll_info`."""
+        now = time.monotonic()
+        self.pacer.observe(latest, now, rtt, self.interval)
+        self.loss.record(lost, received, now)
+        lost_per_s = self.loss.per_second(now)
+        poll_info.update(
+            rate=round(self.pacer.rate, 1),
+            limit=self.pacer.limit,
+            interval=round(self.pacer.interval(self.interval), 3),
+            lost=lost,
+            lost_total=self.loss.total,
+            lost_per_s=round(lost_per_s, 2),
+        )
+        if ENABLE_PROM_METRICS and frames_lost_gauge:
+            frame_rate_gauge.labels(self.base_url, self.dbc_id or "").set(self.pacer.rate)
+            frames_lost_gauge.labels(self.base_url, self.dbc_id or "").set(self.loss.total)
+            frames_lost_rate_gauge.labels(self.base_url, self.dbc_id or "").set(lost_per_s)
+
+    def _export_metrics(self, poll_info: Dict, decoder: Optional[LiveDecoder],
+                        records: Optional[List[LiveFrame]]) -> None:
+        """Poll status, seq and signal values of one poll, labelled with this ingest's URL and DBC."""
+        labels = (self.base_url, self.dbc_id or "")
+        poll_status_gauge.labels(*labels).set(1 if poll_info.get("ok") else 0)
+        if not poll_info.get("ok"):
+            return
+        last_seq_gauge.labels(*labels).set(poll_info["last_seq"])
+        signals = decoder.signals if decoder else []
+        for record in records or []:
+            for index, val in zip(record.indices, record.values):
+                if isinstance(val, (int, float)):
+                    meta = signals[index]
+                    series = labels + (meta.name, meta.message, meta.can_hex, meta.unit)
+                    signal_value_gauge.labels(*series).set(float(val))
+                    self._metric_series.add(series)
+
+    def _remove_metrics(self) -> None:
+        """Drop every series this ingest exported (called with the lock held)."""
+        if not (ENABLE_PROM_METRICS and poll_status_gauge):
+            return
+        labels = (self.base_url, self.dbc_id or "")
+        series = [(gauge, labels) for gauge in (poll_status_gauge, last_seq_gauge, frame_rate_gauge,
+                                                frames_lost_gauge, frames_lost_rate_gauge)]
+        series += [(signal_value_gauge, values) for values in self._metric_series]
+        for gauge, values in series:
+            try:
+                gauge.remove(*values)
+            except KeyError:
+                pass
+        self._metric_series = set()
+
+    def retire(self) -> None:
+        """Stop for good: a poll still in flight publishes nothing, and the metric series are dropped."""
+        self.stop(0)
+        with self._lock:
+            self._generation += 1
+            self._remove_metrics()
+
+    def _publish(self, generation: int, status: str, poll_info: Optional[Dict] = None,
+                 decoder: Optional[LiveDecoder] = None, records: Optional[List[LiveFrame]] = None,
+                 seq: Optional[int] = None, boot=None, reset: bool = False,
+                 pacing: Optional[tuple] = None) -> None:
+        subscribers = []
+        with self._lock:
+            if generation != self._generation:
+                return
+            if records and self._subscribers:
+                subscribers = list(self._subscribers)
+            if reset:
+                self._reset_state()
+            if pacing is not None:
+                self._record_pacing(poll_info, *pacing)
+            if poll_info is not None and ENABLE_PROM_METRICS and poll_status_gauge:
+                self._export_metrics(poll_info, decoder, records)
+            changed = status != self.status_text or (poll_info is not None and poll_info != self.poll_info)
+            self.status_text = status
+            if poll_info is not None:
+                self.poll_info = poll_info
+            if boot is not None:
+                self.boot = boot
+            if seq is not None and seq != self.last_seq:
+                self.last_seq = seq
+                changed = True
+            batch_latest = {}
+            if records:
+                self.history.append_frames(decoder, records)
+                signals = decoder.signals
+                for record in records:
+                    for index, value in zip(record.indices, record.values):
+                        batch_latest[signals[index].name] = {"Value": value, "Time": record.time}
+                self.latest.update(batch_latest)
+            if records or reset:
+                self.data_version += 1
+                changed = True
+            if changed:
+                self.version += 1
+            message = self._delta(batch_latest, self.last_seq) if subscribers and batch_latest else None
+        if message:
+            self._push(subscribers, message)
+
+
+# One ingest per (logger URL, DBC id), so tabs on different loggers or DBCs
+# do not clear each other's history; tabs on the same pair share one poller.
+live_ingests: Dict[Tuple[str, str], LiveIngest] = {}
+live_ingests_lock = threading.Lock()
+
+
+def live_ingest_key(base_url: Optional[str], dbc_id: Optional[str]) -> Dict:
+    """Value of a page's ingest-key store (also the /stream query)."""
+    return {"url": _normalize_base_url(base_url or DEFAULT_BASE_URL).rstrip("/"), "dbc": dbc_id or ""}
+
+
+def live_ingest_for(key: Dict, start: bool = False) -> LiveIngest:
+    """
+    The ingest of a page's ingest-key, created on first use (or again after it
+    was stopped as idle). Resolving an ingest counts as reading it, so a page
+    that is open keeps its ingest even while nothing changes. Ingests nobody
+    resolved or read for LIVE_INGEST_IDLE are stopped.
+    """
+    with live_ingests_lock:
+        ingest = live_ingests.get((key["url"], key["dbc"]))
+        if ingest is None:
+            ingest = LiveIngest()
+            ingest.configure(key["url"], key["dbc"] or None)
+            live_ingests[(key["url"], key["dbc"])] = ingest
+        ingest.touch()
+        now = time.monotonic()
+        for stale_key, stale in list(live_ingests.items()):
+            if stale.idle(now):
+                stale.retire()
+                del live_ingests[stale_key]
+    if start:
+        ingest.start()
+    return ingest
+
+
+def _fleet_entries(text: str, default_dbc: Optional[str] = None) -> List[Dict]:
+    """
+    Parse the fleet device list: one logger per line, `name = address[, DBC file]`.
+    The name is optional (defaults to the address), a DBC file name is looked up
+    in DBC_DIR and then the repository's DBC_Dump (REPO_DBC_DIR), and lines
+    starting with # are ignored.
+    """
+    entries, seen = [], set()
+    for number, line in enumerate((text or "").splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, sep, rest = line.partition("=")
+        if not sep:
+            name, rest = "", line
+        address, _, dbc_name = rest.partition(",")
+        address, dbc_name = address.strip(), dbc_name.strip()
+        if not address:
+            raise ValueError(f"Line {number}: missing logger address.")
+        url = _normalize_base_url(address)
+        name = name.strip() or re.sub(r"^https?://", "", url, flags=re.IGNORECASE)
+        if name in seen:
+            raise ValueError(f"Line {number}: device name '{name}' is used twice.")
+        seen.add(name)
+        if dbc_name:
+            if os.path.isabs(dbc_name):
+                candidates = [dbc_name]
+            else:
+                candidates = [os.path.join(folder, dbc_name) for folder in (DBC_DIR, REPO_DBC_DIR)]
+            dbc_path = next((path for path in candidates if os.path.isfile(path)), None)
+            if dbc_path is None:
+                raise ValueError(f"Line {number}: DBC file not found: {dbc_name}")
+        elif default_dbc:
+            dbc_path = default_dbc
+        else:
+            raise ValueError(f"Line {number}: no DBC file given and none selected.")
+        entries.append({"name": name, "url": url, "dbc": dbc_path})
+    return entries
+
+
+def _load_fleet_text() -> str:
+    path = os.getenv("LIVE_FLEET_FILE", "")
+    if not path:
+        return ""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+class FleetDevice:
+    """
+    One logger in fleet mode. Each device has its own cursor (seq, boot id),
+    DBC, PollPacer, FrameLossMeter and Bus_current correction state; only the
+    HTTP connection pool is shared.
+    """
+
+    def __init__(self, name: str, base_url: str, dbc_id: str, dbc_name: str = ""):
+        self.name = name
+        self.base_url = base_url
+        self.dbc_id = dbc_id
+        self.dbc_name = dbc_name
+        self.last_seq = 0
+        self.boot = None
+        self.pacer = PollPacer()
+        self.loss = FrameLossMeter()
+        self.correction: Dict = {}
+        self.latest: Dict = {}
+        self.frames = 0
+        self.decoded = 0
+        self.polls = 0
+        self.failures = 0
+        self.resets = 0
+        self.ok: Optional[bool] = None
+        self.error = ""
+        self.last_ok: Optional[float] = None
+        self.last_frame: Optional[float] = None
+
+    def apply(self, batch: LiveBatch, records: List[LiveFrame], rtt: float, now: float,
+              base_interval: float) -> None:
+        if batch.reset:
+            self.resets += 1
+            self.pacer.reset()
+            self.latest = {}
+        self.pacer.observe(batch.latest, now, rtt, base_interval)
+        self.loss.record(batch.lost, len(batch.frames), now)
+        self.last_seq = batch.next_seq
+        if batch.boot is not None:
+            self.boot = batch.boot
+        self.frames += len(batch.frames)
+        if batch.frames:
+            self.last_frame = now
+        decoder = dbc_cache.get(self.dbc_id)
+        for record in records:
+            self.decoded += len(record.values)
+            for index, value in zip(record.indices, record.values):
+                self.latest[decoder.signals[index].name] = value
+        self.polls += 1
+        self.ok = True
+        self.error = ""
+        self.last_ok = now
+
+    def fail(self, exc: Exception) -> None:
+        self.polls += 1
+        self.failures += 1
+        self.ok = False
+        self.error = str(exc) or type(exc).__name__
+
+    def health(self, now: float) -> str:
+        if self.ok is None:
+            return "Connecting"
+        if not self.ok:
+            return "Error"
+        if self.loss.per_second(now) > 0:
+            return "Lagging"
+        if self.last_frame is None or now - self.last_frame > FLEET_STALE_SECONDS:
+            return "Idle"
+        return "Live"
+
+    def overview_row(self, now: float) -> Dict:
+        return {
+            "device": self.name,
+            "url": self.base_url,
+            "dbc": self.dbc_name,
+            "health": self.health(now),
+            "seq": self.last_seq,
+            "rate": round(self.pacer.rate, 1),
+            "lost_per_s": round(self.loss.per_second(now), 2),
+            "lost_total": self.loss.total,
+            "signals": len(self.latest),
+            "last_frame": "" if self.last_frame is None else f"{now - self.last_frame:.1f}",
+            "boot": "" if self.boot is None else str(self.boot),
+            "resets": self.resets,
+            "error": self.error,
+        }
+
+
+class FleetMonitor:
+    """
+    Polls a registry of loggers concurrently. One background thread runs an
+    asyncio loop with a single pooled aiohttp session; every FleetDevice gets
+    its own polling task with the same cadence rules as LiveIngest (adaptive
+    limit and interval, immediate re-poll while the logger has a backlog).
+    Devices added, changed or removed with set_devices() are picked up while
+    it runs.
+    """
+
+    def __init__(self, interval: float = LIVE_POLL_INTERVAL, max_connections: int = FLEET_MAX_CONNECTIONS):
+        self.interval = interval
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.devices: Dict[str, FleetDevice] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_devices(self, entries: List[Dict]) -> None:
+        """
+        Replace the registry with `entries` ({"name", "url", "dbc_id", "dbc_name"}).
+        A device keeps its state when its address and DBC are unchanged.
+        """
+        with self._lock:
+            devices = {}
+            for entry in entries:
+                device = self.devices.get(entry["name"])
+                if device is None or device.base_url != entry["url"] or device.dbc_id != entry["dbc_id"]:
+                    device = FleetDevice(entry["name"], entry["url"], entry["dbc_id"], entry.get("dbc_name", ""))
+                devices[entry["name"]] = device
+            removed = set(self.devices) - set(devices)
+            self.devices = devices
+        if ENABLE_PROM_METRICS and fleet_up_gauge:
+            for name in removed:
+                for gauge in (fleet_up_gauge, fleet_frame_rate_gauge, fleet_lost_rate_gauge, fleet_last_seq_gauge):
+                    try:
+                        gauge.remove(name)
+                    except KeyError:
+                        pass
+
+    def start(self) -> None:
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("Fleet mode needs aiohttp (pip install aiohttp).")
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._main()), name="fleet-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def overview(self) -> List[Dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [device.overview_row(now) for device in self.devices.values()]
+
+    async def _main(self) -> None:
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=2)
+        timeout = aiohttp.ClientTimeout(total=LIVE_POLL_TIMEOUT)
+        tasks: Dict[str, tuple] = {}
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers={"Connection": "keep-alive"}
+        ) as session:
+            try:
+                while not self._stop.is_set():
+                    with self._lock:
+                        devices = dict(self.devices)
+                    for name, (device, task) in list(tasks.items()):
+                        if devices.get(name) is not device or task.done():
+                            task.cancel()
+                            del tasks[name]
+                    for name, device in devices.items():
+                        if name not in tasks:
+                            tasks[name] = (device, asyncio.create_task(self._poll_device(session, device)))
+                    await asyncio.sleep(FLEET_RECONCILE_INTERVAL)
+            finally:
+                for _, task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*(task for _, task in tasks.values()), return_exceptions=True)
+
+    async def _poll_device(self, session, device: FleetDevice) -> None:
+        while True:
+            try:
+                backlog = await self._poll_once(session, device)
+                delay = 0.0 if backlog else device.pacer.interval(self.interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                with self._lock:
+                    device.fail(exc)
+                self._export_metrics(device)
+                delay = LIVE_RETRY_INTERVAL
+            # sleep(0) still lets the other devices' tasks run between backlog polls
+            await asyncio.sleep(delay)
+
+    async def _poll_once(self, session, device: FleetDevice) -> bool:
+        """
+        One poll of one device. The decode runs in the loop's default thread
+        pool so a large batch does not hold up the other devices' requests.
+        Decoding is pure Python, so it still shares the GIL with the loop;
+        this keeps the loop responsive, it does not decode devices in
+        parallel. A device's polls are sequential, so its correction state is
+        never used by two decodes at once.
+        """
+        url = device.base_url.rstrip("/") + "/live"
+        started = time.monotonic()
+        async with session.get(url, params={"since": device.last_seq, "limit": device.pacer.limit}) as resp:
+            resp.raise_for_status()
+            payload = await resp.json(content_type=None)
+        now = time.monotonic()
+        batch = LiveBatch(payload, device.last_seq, device.boot)
+        records = await asyncio.get_running_loop().run_in_executor(
+            None, decode_frames, device.dbc_id, batch.frames, device.correction
+        )
+        with self._lock:
+            device.apply(batch, records, now - started, now, self.interval)
+        self._export_metrics(device)
+        return batch.backlog
+
+    def _export_metrics(self, device: FleetDevice) -> None:
+        if not (ENABLE_PROM_METRICS and fleet_up_gauge):
+            return
+        fleet_up_gauge.labels(device=device.name).set(1 if device.ok else 0)
+        fleet_frame_rate_gauge.labels(device=device.name).set(device.pacer.rate)
+        fleet_lost_rate_gauge.labels(device=device.name).set(device.loss.per_second(time.monotonic()))
+        fleet_last_seq_gauge.labels(device=device.name).set(device.last_seq)
+
+
+fleet_monitor = FleetMonitor()
+fleet_dbc_ids: Dict[str, str] = {}
+
+
+def resolve_fleet_entries(entries: List[Dict]) -> List[Dict]:
+    """Load each device's DBC once per path and attach its dbc_cache id."""
+    resolved = []
+    for entry in entries:
+        dbc_id = fleet_dbc_ids.get(entry["dbc"])
+        if dbc_id is None or dbc_id not in dbc_cache:
+            dbc_id = fleet_dbc_ids[entry["dbc"]] = parse_dbc_file(entry["dbc"])["id"]
+        resolved.append(dict(entry, dbc_id=dbc_id, dbc_name=os.path.basename(entry["dbc"])))
+    return resolved
+
+
+def build_message_cards(
+    layout: List[Dict], latest: Dict[str, Dict], theme: str = "light"
+) -> List[dbc.Row]:
+    """
+    Assemble the colored cards grouped by message.
+    """
+
     if not layout:
         return dbc.Alert(
             "Select a DBC file to see live metrics.",
             color="info",
             className="mt-3",
         )
-
-    accent_colors = ["#F97316", "#0EA5E9", "#10B981", "#F43F5E", "#A855F7", "#EAB308"]
-
-    if theme == "dark":
-        card_bg = "#0B1220"
-        label_color = "#94A3B8"
-        title_color = "#E2E8F0"
-        value_color = "#F8FAFC"
-        timestamp_color = "#64748B"
-        row_bg = "rgba(148,163,184,0.08)"
-    else:
-        card_bg = "#FFFFFF"
-        label_color = "#64748B"
-        title_color = "#0F172A"
-        value_color = "#0F172A"
-        timestamp_color = "#94A3B8"
-        row_bg = "rgba(14,116,144,0.08)"
-
+
+    accent_colors = ["#F97316", "#0EA5E9", "#10B981", "#F43F5E", "#A855F7", "#EAB308"]
+
+    if theme == "dark":
+        card_bg = "#0B1220"
+        label_color = "#94A3B8"
+        title_color = "#E2E8F0"
+        value_color = "#F8FAFC"
+        timestamp_color = "#64748B"
+        row_bg = "rgba(148,163,184,0.08)"
+    else:
+        card_bg = "#FFFFFF"
+        label_color = "#64748B"
+        title_color = "#0F172A"
+        value_color = "#0F172A"
+        timestamp_color = "#94A3B8"
+        row_bg = "rgba(14,116,144,0.08)"
+
     cards = []
     for idx, entry in enumerate(sorted(layout, key=lambda e: e.get("message", ""))):
         message_name = entry.get("message", "")
         signals = sorted(entry.get("signals", []), key=lambda s: s.get("name", ""))
         border_color = accent_colors[idx % len(accent_colors)]
-
-        signal_rows = []
-        for signal in signals:
-            latest_data = latest.get(signal["name"])
-            if latest_data:
-                value = latest_data["Value"]
-                value_str = f"{value:.3f}" if isinstance(value, float) else str(value)
-                timestamp = latest_data.get("Time", "")
-            else:
-                value_str = "--"
-                timestamp = ""
-
-            unit = signal["unit"]
-            label_text = f"{signal['name']}{f' ({unit})' if unit else ''}"
-
-            signal_rows.append(
-                html.Div(
-                    [
-                        html.Div(
-                            [
-                                html.Span(
-                                    label_text,
-                                    style={
-                                        "textTransform": "uppercase",
-                                        "fontSize": "14px",
-                                        "fontWeight": "600",
-                                        "color": label_color,
-                                    },
-                                ),
-                                html.Span(
-                                    value_str,
-                                    style={
-                                        "marginLeft": "auto",
-                                        "fontSize": "20px",
-                                        "fontWeight": "700",
-                                        "color": value_color,
-                                    },
-                                ),
-                            ],
-                            className="d-flex justify-content-between align-items-center",
-                        ),
-                        html.Div(
-                            timestamp,
-                            style={
-                                "fontSize": "11px",
-                                "color": timestamp_color,
-                                "marginTop": "1px",
-                            },
-                        ),
-                    ],
-                    className="px-2 py-2 mb-2 rounded-3",
-                    style={"backgroundColor": row_bg},
-                )
-            )
-
-        cards.append(
+
+        signal_rows = []
+        for signal in signals:
+            latest_data = latest.get(signal["name"])
+            if latest_data:
+                value_str = _format_value(latest_data["Value"])
+                timestamp = latest_data.get("Time", "")
+            else:
+                value_str = "--"
+                timestamp = ""
+
+            unit = signal["unit"]
+            label_text = f"{signal['name']}{f' ({unit})' if unit else ''}"
+
+            signal_rows.append(
+                html.Div(
+                    [
+                        html.Div(
+                            [
+                                html.Span(
+                                    label_text,
+                                    style={
+                                        "textTransform": "uppercase",
+                                        "fontSize": "14px",
+                                        "fontWeight": "600",
+                                        "color": label_color,
+                                    },
+                                ),
+                                html.Span(
+                                    value_str,
+                                    # Target of pushed deltas (assets/live_stream.js)
+                                    **{"data-signal-value": signal["name"]},
+                                    style={
+                                        "marginLeft": "auto",
+                                        "fontSize": "20px",
+                                        "fontWeight": "700",
+                                        "color": value_color,
+                                    },
+                                ),
+                            ],
+                            className="d-flex justify-content-between align-items-center",
+                        ),
+                        html.Div(
+                            timestamp,
+                            **{"data-signal-time": signal["name"]},
+                            style={
+                                "fontSize": "11px",
+                                "color": timestamp_color,
+                                "marginTop": "1px",
+                            },
+                        ),
+                    ],
+                    className="px-2 py-2 mb-2 rounded-3",
+                    style={"backgroundColor": row_bg},
+                )
+            )
+
+        cards.append(
             dbc.Card(
                 [
                     html.Div(
                         message_name,
-                        style={
-                            "fontWeight": "700",
-                            "textTransform": "uppercase",
-                            "marginBottom": "6px",
-                            "fontSize": "24px",
-                            "color": title_color,
-                        },
-                    ),
-                    html.Div(signal_rows),
-                ],
+                        style={
+                            "fontWeight": "700",
+                            "textTransform": "uppercase",
+                            "marginBottom": "6px",
+                            "fontSize": "24px",
+                            "color": title_color,
+                        },
+                    ),
+                    html.Div(signal_rows),
+                ],
                 className="shadow-sm message-card",
                 style={
                     "borderLeft": f"6px solid {border_color}",
@@ -599,174 +1741,307 @@ def build_message_cards(
         )
 
     return html.Div(cards, className="message-grid")
-
-
-def build_status_cards(
-    connected: bool,
-    seq: int,
-    signal_count: int,
-    theme: str = "light",
-) -> dbc.Row:
-    if theme == "dark":
-        card_bg = "#0F172A"
-        title_color = "#94A3B8"
-        value_color = "#F8FAFC"
-        border_color = "rgba(148,163,184,0.18)"
-    else:
-        card_bg = "#FFFFFF"
-        title_color = "#475569"
-        value_color = "#0F172A"
-        border_color = "rgba(15,23,42,0.08)"
-
-    def status_card(label: str, value: str) -> dbc.Col:
-        return dbc.Col(
-            dbc.Card(
-                [
-                    html.Div(
-                        label,
-                        style={
-                            "textTransform": "uppercase",
-                            "fontSize": "11px",
-                            "color": title_color,
-                        },
-                    ),
-                    html.Div(
-                        value,
-                        style={"fontSize": "24px", "fontWeight": "700", "color": value_color},
-                    ),
-                ],
-                className="p-3 shadow-sm",
-                style={
-                    "backgroundColor": card_bg,
-                    "borderRadius": "16px",
-                    "border": f"1px solid {border_color}",
-                },
-            ),
-            md=4,
-        )
-
-    cards = [
-        status_card("Connection", "Live" if connected else "Waiting"),
-        status_card("Latest Sequence", str(seq)),
-        status_card("Signals Tracked", str(signal_count)),
-    ]
-    return dbc.Row(cards, className="g-3")
-
-
-
-def make_status_row():
-    return html.Div(
-        [
-            dbc.Card(
-                [
-                    html.Div("System Status", className="panel-title"),
-                    html.Div(id="status-cards"),
-                ],
-                className="panel-card",
-            ),
-        ]
-    )
-
+
+
+def build_status_cards(
+    connected: bool,
+    seq: int,
+    signal_count: int,
+    theme: str = "light",
+    poll: Optional[Dict] = None,
+) -> dbc.Row:
+    if theme == "dark":
+        card_bg = "#0F172A"
+        title_color = "#94A3B8"
+        value_color = "#F8FAFC"
+        border_color = "rgba(148,163,184,0.18)"
+    else:
+        card_bg = "#FFFFFF"
+        title_color = "#475569"
+        value_color = "#0F172A"
+        border_color = "rgba(15,23,42,0.08)"
+
+    def status_card(label: str, value: str, detail: str = "") -> dbc.Col:
+        return dbc.Col(
+            dbc.Card(
+                [
+                    html.Div(
+                        label,
+                        style={
+                            "textTransform": "uppercase",
+                            "fontSize": "11px",
+                            "color": title_color,
+                        },
+                    ),
+                    html.Div(
+                        value,
+                        style={"fontSize": "24px", "fontWeight": "700", "color": value_color},
+                    ),
+                    html.Div(
+                        detail,
+                        style={"fontSize": "11px", "color": title_color},
+                    ),
+                ],
+                className="p-3 shadow-sm",
+                style={
+                    "backgroundColor": card_bg,
+                    "borderRadius": "16px",
+                    "border": f"1px solid {border_color}",
+                },
+            ),
+            md=3,
+        )
+
+    poll = poll or {}
+    if "lost_per_s" in poll:
+        lost_value = f"{poll['lost_per_s']:.1f}"
+        lost_detail = f"{poll.get('lost_total', 0)} total of {poll.get('rate', 0):.0f} frames/s"
+    else:
+        lost_value, lost_detail = "--", ""
+
+    cards = [
+        status_card("Connection", "Live" if connected else "Waiting"),
+        status_card("Latest Sequence", str(seq), f"limit {poll['limit']}" if "limit" in poll else ""),
+        status_card("Signals Tracked", str(signal_count)),
+        status_card("Frames Lost / s", lost_value, lost_detail),
+    ]
+    return dbc.Row(cards, className="g-3")
+
+
+
+FLEET_HEALTH_COLORS = {
+    "Live": "#10B981",
+    "Lagging": "#F59E0B",
+    "Idle": "#94A3B8",
+    "Connecting": "#94A3B8",
+    "Error": "#EF4444",
+}
+
+
+def make_fleet_panel():
+    return html.Div(
+        [
+            dbc.Row(
+                [
+                    dbc.Col(
+                        html.Div("Fleet Overview", id="fleet-title", className="panel-title"),
+                        md=6,
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            "Start Fleet",
+                            id="fleet-start-btn",
+                            color="primary",
+                            disabled=not AIOHTTP_AVAILABLE,
+                        ),
+                        md=6,
+                        className="text-md-end",
+                    ),
+                ],
+                align="center",
+                className="mb-2",
+            ),
+            dcc.Textarea(
+                id="fleet-devices",
+                value=_load_fleet_text(),
+                placeholder="Kart 1 = 192.168.10.11, Naxtra_5Kw_controller_DBC_Limbo.dbc\nKart 2 = 192.168.10.12",
+                className="form-control",
+                style={"minHeight": "96px"},
+            ),
+            html.Div(
+                "One logger per line: name = address[, DBC file from DBC_Dump]. "
+                "Without a DBC the one selected in the Connection Dock is used.",
+                id="fleet-hint",
+                className="small mt-1",
+            ),
+            html.Div(
+                id="fleet-status",
+                className="mt-2",
+                children="" if AIOHTTP_AVAILABLE else "Fleet mode needs aiohttp (pip install aiohttp).",
+            ),
+            dash_table.DataTable(
+                id="fleet-table",
+                columns=[
+                    {"name": "Device", "id": "device"},
+                    {"name": "Address", "id": "url"},
+                    {"name": "DBC", "id": "dbc"},
+                    {"name": "Health", "id": "health"},
+                    {"name": "Seq", "id": "seq"},
+                    {"name": "Frames/s", "id": "rate"},
+                    {"name": "Lost/s", "id": "lost_per_s"},
+                    {"name": "Lost", "id": "lost_total"},
+                    {"name": "Signals", "id": "signals"},
+                    {"name": "Last Frame (s ago)", "id": "last_frame"},
+                    {"name": "Boot", "id": "boot"},
+                    {"name": "Reboots", "id": "resets"},
+                    {"name": "Error", "id": "error"},
+                ],
+                data=[],
+                fill_width=True,
+                sort_action="native",
+                style_data_conditional=[
+                    {
+                        "if": {"filter_query": f'{{health}} = "{health}"', "column_id": "health"},
+                        "color": color,
+                        "fontWeight": "700",
+                    }
+                    for health, color in FLEET_HEALTH_COLORS.items()
+                ],
+            ),
+            dcc.Interval(id="fleet-poller", interval=UI_REFRESH_MS, disabled=True),
+        ],
+        className="panel-card mt-4",
+    )
+
+
+def make_status_row():
+    return html.Div(
+        [
+            dbc.Card(
+                [
+                    html.Div("System Status", className="panel-title"),
+                    html.Div(id="status-cards"),
+                ],
+                className="panel-card",
+            ),
+        ]
+    )
+
 
 external_stylesheets = [dbc.themes.BOOTSTRAP]
 app = Dash(
-    __name__,
-    external_stylesheets=external_stylesheets,
-    suppress_callback_exceptions=True,
-    title="CAN Live Dashboard",
-)
-server = app.server
-
-# Initialize Prometheus metrics (safe to call even if disabled)
-init_metrics()
-
-if ENABLE_PROM_METRICS:
-
-    @server.route("/metrics")
-    def metrics():
-        # Return Prometheus exposition format
-        return Response(
-            generate_latest(metrics_registry),
-            mimetype=CONTENT_TYPE_LATEST,
-        )
-
-
-app.layout = html.Div(
-    id="page-wrapper",
-    children=dbc.Container(
-        [
-            dcc.Store(id="dbc-store"),
+    __name__,
+    external_stylesheets=external_stylesheets,
+    suppress_callback_exceptions=True,
+    title="CAN Live Dashboard",
+)
+server = app.server
+
+# Initialize Prometheus metrics (safe to call even if disabled)
+init_metrics()
+
+if ENABLE_PROM_METRICS:
+
+    @server.route("/metrics")
+    def metrics():
+        # Return Prometheus exposition format
+        return Response(
+            generate_latest(metrics_registry),
+            mimetype=CONTENT_TYPE_LATEST,
+        )
+
+
+@server.route("/stream")
+def live_stream():
+    """
+    Server-sent events: one compact delta per decoded batch, pushed the moment
+    the ingest of ?url=&dbc= (the page's ingest-key) decodes it.
+    assets/live_stream.js applies them to the cards.
+    """
+    ingest = live_ingest_for(live_ingest_key(request.args.get("url"), request.args.get("dbc")))
+
+    def events():
+        q = ingest.subscribe()
+        try:
+            yield "retry: 2000\n\n"
+            while True:
+                try:
+                    message = q.get(timeout=STREAM_HEARTBEAT)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {message}\n\n"
+        finally:
+            ingest.unsubscribe(q)
+
+    return Response(
+        events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+app.layout = html.Div(
+    id="page-wrapper",
+    children=dbc.Container(
+        [
+            dcc.Store(id="dbc-store"),
             dcc.Store(id="latest-store", data={}),
-            dcc.Store(id="history-store", data=[]),
+            # {"url", "dbc"} of the LiveIngest this page reads (live_ingest_for).
+            dcc.Store(id="ingest-key", data=None),
+            dcc.Store(id="stream-key", data=None),
+            # Cursor into the server-side history (the ingest's data_version).
+            dcc.Store(id="history-cursor", data=0),
             dcc.Store(id="seq-store", data=0),
             dcc.Store(id="poll-store", data={"ok": False, "last_seq": 0, "frames": 0, "decoded": 0}),
             dcc.Store(id="boot-store", data=None),
             dcc.Store(id="graph-list-store", data=[]),
             dcc.Store(id="theme-store", data="dark"),
             dcc.Store(id="live-enabled", data=False),
-
-            html.Div(
-                [
-                    html.Div(
-                        [
-                            html.Img(
-                                src="/assets/naxatra_labs_logo.png",
-                                className="hero-logo",
-                            ),
-                            html.Div(
-                                [
-                                    html.Div("Naxatra Labs CAN Live Console", id="main-title"),
-                                    html.Div(
-                                        "Continuous decoding and signal monitoring.",
-                                        id="main-subtitle",
-                                    ),
-                                ],
-                                className="hero-text",
-                            ),
-                        ],
-                        className="hero-left",
-                    ),
-                    html.Div(
-                        [
-                            dbc.Switch(
-                                id="theme-toggle",
-                                label="Night mode",
-                                value=True,
-                                className="mb-2",
-                                label_style={"color": "#E2E8F0"},
-                            ),
+            dcc.Store(id="fleet-enabled", data=False),
+
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.Img(
+                                src="/assets/naxatra_labs_logo.png",
+                                className="hero-logo",
+                            ),
+                            html.Div(
+                                [
+                                    html.Div("Naxatra Labs CAN Live Console", id="main-title"),
+                                    html.Div(
+                                        "Continuous decoding and signal monitoring.",
+                                        id="main-subtitle",
+                                    ),
+                                ],
+                                className="hero-text",
+                            ),
+                        ],
+                        className="hero-left",
+                    ),
+                    html.Div(
+                        [
+                            dbc.Switch(
+                                id="theme-toggle",
+                                label="Night mode",
+                                value=True,
+                                className="mb-2",
+                                label_style={"color": "#E2E8F0"},
+                            ),
                             html.Div(
                                 "Live stream paused",
                                 id="session-status",
                                 className="session-pill session-pill--paused",
                             ),
-                        ],
-                        className="hero-actions",
-                    ),
-                ],
-                className="hero-wrap",
-            ),
-
-            dbc.Row(
-                [
-                    dbc.Col(
-                        dbc.Card(
-                            [
-                                html.Div("Connection Dock", className="panel-title"),
-                                dbc.Label("Logger Address", id="logger-label"),
-                                dcc.Input(
-                                    id="base-url",
-                                    type="text",
-                                    value=DEFAULT_BASE_URL,
-                                    debounce=True,
-                                    className="form-control",
-                                ),
+                        ],
+                        className="hero-actions",
+                    ),
+                ],
+                className="hero-wrap",
+            ),
+
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div("Connection Dock", className="panel-title"),
+                                dbc.Label("Logger Address", id="logger-label"),
+                                dcc.Input(
+                                    id="base-url",
+                                    type="text",
+                                    value=DEFAULT_BASE_URL,
+                                    debounce=True,
+                                    className="form-control",
+                                ),
                                 html.Div(
                                     f"Default ESP32 AP URL is {DEFAULT_BASE_URL}",
                                     className="small mt-1",
                                     id="logger-hint",
                                 ),
-                                html.Hr(),
+                                html.Hr(),
                                 dbc.Label("DBC File", id="upload-label"),
                                 dcc.Dropdown(
                                     id="dbc-dropdown",
@@ -797,7 +2072,7 @@ app.layout = html.Div(
                                     disabled=not bool(DBC_FILE_OPTIONS),
                                 ),
                                 html.Div(
-                                    "Live mode: polling every 0.5s",
+                                    f"Live mode: logger polled every {LIVE_POLL_INTERVAL:g}s in the background",
                                     className="small",
                                     style={"color": "#64748B"},
                                 ),
@@ -807,30 +2082,30 @@ app.layout = html.Div(
                                     style={"color": "#EF4444"},
                                     children="Click Start Live Data to begin.",
                                 ),
-                            ],
-                            className="panel-card control-card",
-                        ),
+                            ],
+                            className="panel-card control-card",
+                        ),
                         md=5,
                     ),
                     dbc.Col(
                         dbc.Card(
                             [
-                                html.Div("Recent Signals", id="table-title", className="panel-title"),
-                                dash_table.DataTable(
-                                    id="history-table",
-                                    columns=[
-                                        {"name": "Time", "id": "Time"},
-                                        {"name": "Message", "id": "Message"},
-                                        {"name": "Signal", "id": "Signal"},
-                                        {"name": "Value", "id": "Value"},
-                                        {"name": "Unit", "id": "Unit"},
-                                    ],
-                                    data=[],
-                                    page_size=10,
-                                    fill_width=True,
-                                    sort_action="native",
-                                ),
-                            ],
+                                html.Div("Recent Signals", id="table-title", className="panel-title"),
+                                dash_table.DataTable(
+                                    id="history-table",
+                                    columns=[
+                                        {"name": "Time", "id": "Time"},
+                                        {"name": "Message", "id": "Message"},
+                                        {"name": "Signal", "id": "Signal"},
+                                        {"name": "Value", "id": "Value"},
+                                        {"name": "Unit", "id": "Unit"},
+                                    ],
+                                    data=[],
+                                    page_size=10,
+                                    fill_width=True,
+                                    sort_action="native",
+                                ),
+                            ],
                             className="panel-card table-card",
                         ),
                         md=7,
@@ -839,184 +2114,192 @@ app.layout = html.Div(
                 ],
                 className="g-3",
             ),
-
-            html.Div(
-                [
-                    html.Div("Message Matrix", className="panel-title"),
-                    html.Div(id="message-grid"),
-                ],
-                className="panel-card mt-4",
-            ),
-
-            html.Div(
-                [
-                    dbc.Row(
-                        [
-                            dbc.Col(
-                                html.Div("Signal Lab", className="panel-title"),
-                                md=6,
-                            ),
-                            dbc.Col(
-                                dbc.Button(
-                                    "Add Graph",
-                                    id="add-graph-btn",
-                                    color="primary",
-                                ),
-                                md=6,
-                                className="text-md-end",
-                            ),
-                        ],
-                        align="center",
-                        className="mb-2",
-                    ),
-                    html.Div(id="graph-container"),
-                ],
-                className="panel-card mt-4",
-            ),
-            dcc.Interval(id="poller", interval=500, disabled=True),
-        ],
-        fluid=True,
-        className="pb-5 pt-3 page-font",
-    ),
-    style={
-        "minHeight": "100vh",
-        "backgroundColor": "#0B0F14",
-        "--panel-bg": "#0F172A",
-        "--panel-border": "rgba(148,163,184,0.18)",
-        "--panel-shadow": "0 20px 44px rgba(2,6,23,0.7)",
-        "--accent": "#06B6D4",
-        "--accent-2": "#F97316",
-        "--text-strong": "#F8FAFC",
-        "--text-muted": "#94A3B8",
-        "--header-bg": "linear-gradient(120deg, #0B0F14 0%, #111827 55%, #0F766E 100%)",
-    },
-)
-
-
+
+            make_fleet_panel(),
+
+            html.Div(
+                [
+                    html.Div("Message Matrix", className="panel-title"),
+                    html.Div(id="message-grid"),
+                ],
+                className="panel-card mt-4",
+            ),
+
+            html.Div(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                html.Div("Signal Lab", className="panel-title"),
+                                md=6,
+                            ),
+                            dbc.Col(
+                                dbc.Button(
+                                    "Add Graph",
+                                    id="add-graph-btn",
+                                    color="primary",
+                                ),
+                                md=6,
+                                className="text-md-end",
+                            ),
+                        ],
+                        align="center",
+                        className="mb-2",
+                    ),
+                    html.Div(id="graph-container"),
+                ],
+                className="panel-card mt-4",
+            ),
+            dcc.Interval(id="poller", interval=UI_REFRESH_MS, disabled=True),
+        ],
+        fluid=True,
+        className="pb-5 pt-3 page-font",
+    ),
+    style={
+        "minHeight": "100vh",
+        "backgroundColor": "#0B0F14",
+        "--panel-bg": "#0F172A",
+        "--panel-border": "rgba(148,163,184,0.18)",
+        "--panel-shadow": "0 20px 44px rgba(2,6,23,0.7)",
+        "--accent": "#06B6D4",
+        "--accent-2": "#F97316",
+        "--text-strong": "#F8FAFC",
+        "--text-muted": "#94A3B8",
+        "--header-bg": "linear-gradient(120deg, #0B0F14 0%, #111827 55%, #0F766E 100%)",
+    },
+)
+
+
 # ---------- THEME CALLBACKS ----------
 
 
 @app.callback(
-    Output("theme-store", "data"),
-    Input("theme-toggle", "value"),
-)
-def set_theme(value):
-    return "dark" if value else "light"
-
-
-@app.callback(
-    Output("page-wrapper", "style"),
-    Output("main-title", "style"),
-    Output("main-subtitle", "style"),
-    Output("logger-label", "style"),
-    Output("upload-label", "style"),
-    Output("logger-hint", "style"),
-    Output("table-title", "style"),
-    Output("history-table", "style_table"),
+    Output("theme-store", "data"),
+    Input("theme-toggle", "value"),
+)
+def set_theme(value):
+    return "dark" if value else "light"
+
+
+@app.callback(
+    Output("page-wrapper", "style"),
+    Output("main-title", "style"),
+    Output("main-subtitle", "style"),
+    Output("logger-label", "style"),
+    Output("upload-label", "style"),
+    Output("logger-hint", "style"),
+    Output("table-title", "style"),
+    Output("history-table", "style_table"),
     Output("history-table", "style_header"),
     Output("history-table", "style_data"),
     Output("base-url", "style"),
     Output("dbc-dropdown", "style"),
+    Output("fleet-title", "style"),
+    Output("fleet-hint", "style"),
+    Output("fleet-devices", "style"),
+    Output("fleet-table", "style_table"),
+    Output("fleet-table", "style_header"),
+    Output("fleet-table", "style_data"),
     Input("theme-store", "data"),
 )
-def update_theme_styles(theme):
-    if theme == "dark":
-        page_style = {
-            "minHeight": "100vh",
-            "backgroundColor": "#0B0F14",
-            "backgroundImage": (
-                "radial-gradient(circle at 12% 18%, rgba(6,182,212,0.22), transparent 45%), "
-                "radial-gradient(circle at 82% 10%, rgba(249,115,22,0.22), transparent 45%), "
-                "linear-gradient(135deg, #0B0F14 0%, #111827 55%, #0F172A 100%)"
-            ),
-            "--panel-bg": "#0F172A",
-            "--panel-border": "rgba(148,163,184,0.18)",
-            "--panel-shadow": "0 20px 44px rgba(2,6,23,0.7)",
-            "--accent": "#06B6D4",
-            "--accent-2": "#F97316",
-            "--text-strong": "#F8FAFC",
-            "--text-muted": "#94A3B8",
-            "--header-bg": "linear-gradient(120deg, #0B0F14 0%, #111827 55%, #0F766E 100%)",
-        }
-        main_title = {"color": "#F8FAFC", "fontSize": "28px", "fontWeight": "800"}
-        subtitle = {"color": "#E2E8F0", "fontSize": "14px"}
-        label_style = {"color": "#E2E8F0", "fontWeight": "600"}
-        hint_style = {"color": "#94A3B8", "fontSize": "12px"}
-        table_title = {"color": "#E2E8F0"}
-
-        table_style_table = {"overflowX": "auto", "backgroundColor": "transparent"}
-        table_style_header = {
-            "backgroundColor": "#0F172A",
-            "color": "#E2E8F0",
-            "fontWeight": "600",
-            "border": "1px solid #1F2937",
-        }
-        table_style_data = {
-            "backgroundColor": "#0F172A",
-            "color": "#E2E8F0",
-            "border": "1px solid #1F2937",
-        }
-
-        input_style = {
-            "backgroundColor": "#0F172A",
-            "color": "#F8FAFC",
-            "border": "1px solid #1F2937",
-        }
-        upload_style = {
-            "backgroundColor": "#0F172A",
-            "border": "1px dashed #1F2937",
-            "color": "#E2E8F0",
-            "borderRadius": "14px",
-        }
-    else:
-        page_style = {
-            "minHeight": "100vh",
-            "backgroundColor": "#F8FAFC",
-            "backgroundImage": (
-                "radial-gradient(circle at 12% 18%, rgba(6,182,212,0.16), transparent 45%), "
-                "radial-gradient(circle at 82% 10%, rgba(249,115,22,0.16), transparent 45%), "
-                "linear-gradient(135deg, #F8FAFC 0%, #E0F2FE 45%, #FFF7ED 100%)"
-            ),
-            "--panel-bg": "#FFFFFF",
-            "--panel-border": "rgba(15,23,42,0.08)",
-            "--panel-shadow": "0 16px 40px rgba(15,23,42,0.08)",
-            "--accent": "#06B6D4",
-            "--accent-2": "#F97316",
-            "--text-strong": "#0F172A",
-            "--text-muted": "#475569",
-            "--header-bg": "linear-gradient(120deg, #0F172A 0%, #1F2937 55%, #0F766E 100%)",
-        }
-        main_title = {"color": "#F8FAFC", "fontSize": "28px", "fontWeight": "800"}
-        subtitle = {"color": "#E2E8F0", "fontSize": "14px"}
-        label_style = {"color": "#0F172A", "fontWeight": "600"}
-        hint_style = {"color": "#64748B", "fontSize": "12px"}
-        table_title = {"color": "#0F172A"}
-
-        table_style_table = {"overflowX": "auto"}
-        table_style_header = {
-            "backgroundColor": "#FFFFFF",
-            "color": "#0F172A",
-            "fontWeight": "600",
-            "border": "1px solid #E2E8F0",
-        }
-        table_style_data = {
-            "backgroundColor": "#FFFFFF",
-            "color": "#0F172A",
-            "border": "1px solid #E2E8F0",
-        }
-
-        input_style = {
-            "backgroundColor": "#FFFFFF",
-            "color": "#0F172A",
-            "border": "1px solid #CBD5E1",
-        }
-        upload_style = {
-            "backgroundColor": "#FFFFFF",
-            "border": "1px dashed #CBD5E1",
-            "color": "#0F172A",
-            "borderRadius": "14px",
-        }
-
+def update_theme_styles(theme):
+    if theme == "dark":
+        page_style = {
+            "minHeight": "100vh",
+            "backgroundColor": "#0B0F14",
+            "backgroundImage": (
+                "radial-gradient(circle at 12% 18%, rgba(6,182,212,0.22), transparent 45%), "
+                "radial-gradient(circle at 82% 10%, rgba(249,115,22,0.22), transparent 45%), "
+                "linear-gradient(135deg, #0B0F14 0%, #111827 55%, #0F172A 100%)"
+            ),
+            "--panel-bg": "#0F172A",
+            "--panel-border": "rgba(148,163,184,0.18)",
+            "--panel-shadow": "0 20px 44px rgba(2,6,23,0.7)",
+            "--accent": "#06B6D4",
+            "--accent-2": "#F97316",
+            "--text-strong": "#F8FAFC",
+            "--text-muted": "#94A3B8",
+            "--header-bg": "linear-gradient(120deg, #0B0F14 0%, #111827 55%, #0F766E 100%)",
+        }
+        main_title = {"color": "#F8FAFC", "fontSize": "28px", "fontWeight": "800"}
+        subtitle = {"color": "#E2E8F0", "fontSize": "14px"}
+        label_style = {"color": "#E2E8F0", "fontWeight": "600"}
+        hint_style = {"color": "#94A3B8", "fontSize": "12px"}
+        table_title = {"color": "#E2E8F0"}
+
+        table_style_table = {"overflowX": "auto", "backgroundColor": "transparent"}
+        table_style_header = {
+            "backgroundColor": "#0F172A",
+            "color": "#E2E8F0",
+            "fontWeight": "600",
+            "border": "1px solid #1F2937",
+        }
+        table_style_data = {
+            "backgroundColor": "#0F172A",
+            "color": "#E2E8F0",
+            "border": "1px solid #1F2937",
+        }
+
+        input_style = {
+            "backgroundColor": "#0F172A",
+            "color": "#F8FAFC",
+            "border": "1px solid #1F2937",
+        }
+        upload_style = {
+            "backgroundColor": "#0F172A",
+            "border": "1px dashed #1F2937",
+            "color": "#E2E8F0",
+            "borderRadius": "14px",
+        }
+    else:
+        page_style = {
+            "minHeight": "100vh",
+            "backgroundColor": "#F8FAFC",
+            "backgroundImage": (
+                "radial-gradient(circle at 12% 18%, rgba(6,182,212,0.16), transparent 45%), "
+                "radial-gradient(circle at 82% 10%, rgba(249,115,22,0.16), transparent 45%), "
+                "linear-gradient(135deg, #F8FAFC 0%, #E0F2FE 45%, #FFF7ED 100%)"
+            ),
+            "--panel-bg": "#FFFFFF",
+            "--panel-border": "rgba(15,23,42,0.08)",
+            "--panel-shadow": "0 16px 40px rgba(15,23,42,0.08)",
+            "--accent": "#06B6D4",
+            "--accent-2": "#F97316",
+            "--text-strong": "#0F172A",
+            "--text-muted": "#475569",
+            "--header-bg": "linear-gradient(120deg, #0F172A 0%, #1F2937 55%, #0F766E 100%)",
+        }
+        main_title = {"color": "#F8FAFC", "fontSize": "28px", "fontWeight": "800"}
+        subtitle = {"color": "#E2E8F0", "fontSize": "14px"}
+        label_style = {"color": "#0F172A", "fontWeight": "600"}
+        hint_style = {"color": "#64748B", "fontSize": "12px"}
+        table_title = {"color": "#0F172A"}
+
+        table_style_table = {"overflowX": "auto"}
+        table_style_header = {
+            "backgroundColor": "#FFFFFF",
+            "color": "#0F172A",
+            "fontWeight": "600",
+            "border": "1px solid #E2E8F0",
+        }
+        table_style_data = {
+            "backgroundColor": "#FFFFFF",
+            "color": "#0F172A",
+            "border": "1px solid #E2E8F0",
+        }
+
+        input_style = {
+            "backgroundColor": "#FFFFFF",
+            "color": "#0F172A",
+            "border": "1px solid #CBD5E1",
+        }
+        upload_style = {
+            "backgroundColor": "#FFFFFF",
+            "border": "1px dashed #CBD5E1",
+            "color": "#0F172A",
+            "borderRadius": "14px",
+        }
+
     return (
         page_style,
         main_title,
@@ -1030,6 +2313,12 @@ def update_theme_styles(theme):
         table_style_data,
         input_style,
         upload_style,
+        table_title,
+        hint_style,
+        dict(input_style, minHeight="96px", fontFamily="monospace", fontSize="13px"),
+        table_style_table,
+        table_style_header,
+        table_style_data,
     )
 
 
@@ -1037,31 +2326,47 @@ def update_theme_styles(theme):
 @app.callback(
     Output("dbc-store", "data"),
     Output("upload-status", "children"),
-    Output("history-store", "data"),
-    Output("latest-store", "data"),
-    Output("seq-store", "data"),
     Input("dbc-dropdown", "value"),
 )
 def handle_dbc_selection(dbc_path):
     if not dbc_path:
-        return no_update, no_update, no_update, no_update, no_update
+        return no_update, no_update
     try:
         dbc_info = parse_dbc_file(dbc_path)
-        return (
-            dbc_info,
-            f"Loaded DBC: {dbc_info['name']}",
-            [],
-            {},
-            0,
-        )
+        return dbc_info, f"Loaded DBC: {dbc_info['name']}"
     except Exception as exc:
-        return (
-            no_update,
-            f"Failed to load DBC: {exc}",
-            no_update,
-            no_update,
-            no_update,
-        )
+        return no_update, f"Failed to load DBC: {exc}"
+
+
+@app.callback(
+    Output("ingest-key", "data"),
+    Output("history-cursor", "data"),
+    Output("latest-store", "data"),
+    Output("seq-store", "data"),
+    Output("poll-store", "data", allow_duplicate=True),
+    Input("dbc-store", "data"),
+    Input("base-url", "value"),
+    Input("live-enabled", "data"),
+    prevent_initial_call=True,
+)
+def select_live_ingest(dbc_data, base_url, enabled):
+    """
+    Point this page at the ingest of its logger URL and DBC. Other pages keep
+    their own ingest; a page joining a running one shows its current state.
+    """
+    if not dbc_data:
+        return no_update, no_update, no_update, no_update, no_update
+    key = live_ingest_key(base_url, dbc_data["id"])
+    snap = live_ingest_for(key, start=bool(enabled)).snapshot()
+    return key, snap["data_version"], snap["latest"], snap["seq"], {}
+
+
+# (Re)open the /stream push of this page's ingest (assets/live_stream.js).
+app.clientside_callback(
+    ClientsideFunction(namespace="live", function_name="connect"),
+    Output("stream-key", "data"),
+    Input("ingest-key", "data"),
+)
 
 
 @app.callback(
@@ -1074,21 +2379,10 @@ def handle_dbc_selection(dbc_path):
     Output("session-status", "className"),
     Output("fetch-status", "children"),
     Input("live-start-btn", "n_clicks"),
-    State("live-enabled", "data"),
     prevent_initial_call=True,
 )
-def start_live_data(_, enabled):
-    if enabled:
-        return (
-            False,
-            True,
-            "Live Running",
-            "success",
-            True,
-            "Live stream active",
-            "session-pill session-pill--active",
-            "",
-        )
+def start_live_data(_):
+    # select_live_ingest starts this page's ingest once live-enabled is set.
     return (
         False,
         True,
@@ -1103,126 +2397,44 @@ def start_live_data(_, enabled):
 
 @app.callback(
     Output("latest-store", "data", allow_duplicate=True),
-    Output("history-store", "data", allow_duplicate=True),
+    Output("history-cursor", "data", allow_duplicate=True),
     Output("seq-store", "data", allow_duplicate=True),
     Output("fetch-status", "children", allow_duplicate=True),
     Output("poll-store", "data", allow_duplicate=True),
     Output("boot-store", "data", allow_duplicate=True),
     Input("poller", "n_intervals"),
-    State("dbc-store", "data"),
-    State("base-url", "value"),
-    State("seq-store", "data"),
-    State("history-store", "data"),
-    State("latest-store", "data"),
-    State("boot-store", "data"),
+    State("ingest-key", "data"),
     State("poll-store", "data"),
     prevent_initial_call=True,
 )
-def poll_live_data(
-    _,
-    dbc_data,
-    base_url,
-    last_seq,
-    history_data,
-    latest_data,
-    boot_state,
-    poll_state,
-):
-    if not dbc_data:
-        return (
-            latest_data,
-            history_data,
-            last_seq,
-            "Select a DBC file to decode data.",
-            poll_state,
-            boot_state,
-        )
-
-    try:
-        payload = fetch_live_frames(
-            base_url or DEFAULT_BASE_URL, last_seq, LIVE_FETCH_LIMIT
-        )
-        payload_latest = _safe_int(payload.get("latest", last_seq), last_seq)
-        payload_boot = payload.get("boot", None)
-        raw_frames = payload.get("frames", [])
-        reset_needed = False
-        if boot_state is not None and payload_boot is not None and payload_boot != boot_state:
-            reset_needed = True
-        if payload_latest < (last_seq or 0):
-            reset_needed = True
-        if reset_needed:
-            last_seq = 0
-            history_data = []
-            latest_data = {}
-
-        frames = _filter_new_frames(raw_frames, last_seq or 0)
-        next_seq = max(
-            last_seq or 0,
-            payload_latest,
-            max((_safe_int(f.get("seq", -1), -1) for f in frames), default=-1),
-        )
-        rows = decode_frames(dbc_data["id"], frames)
-    except Exception as exc:
-        if ENABLE_PROM_METRICS and poll_status_gauge:
-            poll_status_gauge.set(0)
-        return (
-            latest_data,
-            history_data,
-            last_seq,
-            f"Connection error: {exc}",
-            {"ok": False, "error": str(exc)},
-            boot_state,
-        )
-
-    if ENABLE_PROM_METRICS and signal_value_gauge:
-        for row in rows:
-            val = row.get("Value")
-            if isinstance(val, (int, float)):
-                signal_value_gauge.labels(
-                    signal=row.get("Signal", ""),
-                    message=row.get("Message", ""),
-                    can_id=row.get("CAN_ID", ""),
-                    unit=row.get("Unit", ""),
-                ).set(float(val))
-        poll_status_gauge.set(1)
-        last_seq_gauge.set(next_seq)
-
-    updated_history = limit_history(history_data or [], rows)
-    latest_map = dict(latest_data or {})
-    for row in rows:
-        latest_map[row["Signal"]] = row
-
-    status_prefix = "ESP reboot detected; resyncing. " if reset_needed else ""
-    if rows:
-        status_text = status_prefix
-    elif raw_frames:
-        status_text = status_prefix + "Live frames received, but no signals decoded. Check DBC."
+def poll_live_data(_, ingest_key, poll_state):
+    """
+    Publish the state of this page's ingest to the page. The logger itself is
+    polled by the ingest's thread; this only reads a snapshot when something
+    changed, and never reconfigures the ingest (other pages may share it).
+    """
+    if not ingest_key:
+        return no_update, no_update, no_update, "Select a DBC file to decode data.", no_update, no_update
+    ingest = live_ingest_for(ingest_key, start=True)
+    poll_state = poll_state or {}
+    if ingest.version == poll_state.get("version"):
+        return (no_update,) * 6
+
+    snap = ingest.snapshot()
+    if snap["data_version"] == poll_state.get("data_version"):
+        latest_out = cursor_out = seq_out = no_update
     else:
-        status_text = status_prefix + "Connected, waiting for CAN frames..."
-
-    poll_info = {
-        "ok": True,
-        "last_seq": next_seq,
-        "frames": len(raw_frames),
-        "decoded": len(rows),
-    }
-    if reset_needed:
-        poll_info["reset"] = True
-
-    boot_out = payload_boot if payload_boot is not None else boot_state
-
-    if not rows and not reset_needed:
-        return no_update, no_update, no_update, status_text, poll_info, boot_out
-
-    return latest_map, updated_history, next_seq, status_text, poll_info, boot_out
-
-
-@app.callback(
-    Output("message-grid", "children"),
-    Input("dbc-store", "data"),
-    Input("latest-store", "data"),
-    Input("theme-store", "data"),
-)
+        latest_out, cursor_out, seq_out = snap["latest"], snap["data_version"], snap["seq"]
+    poll_info = dict(snap["poll"], data_version=snap["data_version"])
+    return latest_out, cursor_out, seq_out, snap["status"], poll_info, snap["boot"]
+
+
+@app.callback(
+    Output("message-grid", "children"),
+    Input("dbc-store", "data"),
+    Input("latest-store", "data"),
+    Input("theme-store", "data"),
+)
 def update_cards(dbc_data, latest_store, theme):
     layout = dbc_data["layout"] if dbc_data else []
     return build_message_cards(layout, latest_store or {}, theme or "light")
@@ -1230,15 +2442,15 @@ def update_cards(dbc_data, latest_store, theme):
 
 @app.callback(
     Output("history-table", "data"),
-    Input("history-store", "data"),
+    Input("history-cursor", "data"),
+    State("ingest-key", "data"),
 )
-def update_history_table(history_data):
-    if not history_data:
+def update_history_table(_cursor, ingest_key):
+    if not ingest_key:
         return []
-    df = pd.DataFrame(history_data[-100:])
-    return df.to_dict("records")
-
-
+    return live_ingest_for(ingest_key).recent_rows()
+
+
 @app.callback(
     Output("status-cards", "children"),
     Input("seq-store", "data"),
@@ -1249,234 +2461,293 @@ def update_history_table(history_data):
 def update_status_cards(seq_value, latest_store, poll_store, theme):
     connected = bool(poll_store and poll_store.get("ok")) or bool(latest_store)
     signal_count = len(latest_store or {})
-    return build_status_cards(
-        connected,
-        seq_value or 0,
-        signal_count,
-        theme or "light",
-    )
-
-
-# ---------- GRAPH MANAGEMENT CALLBACKS ----------
-
-@app.callback(
-    Output("graph-list-store", "data"),
-    Input("add-graph-btn", "n_clicks"),
-    Input({"type": "remove-graph", "index": ALL}, "n_clicks"),
-    Input({"type": "move-graph-up", "index": ALL}, "n_clicks"),
-    Input({"type": "move-graph-down", "index": ALL}, "n_clicks"),
-    State("graph-list-store", "data"),
-    prevent_initial_call=True,
-)
-def modify_graph_list(add_clicks, remove_clicks, move_up, move_down, graph_list):
-    graph_list = graph_list or []
-    triggered = ctx.triggered_id
-
-    if triggered == "add-graph-btn":
-        graph_id = f"graph-{len(graph_list) + 1}"
-        graph_list.append(graph_id)
-        return graph_list
-
-    if isinstance(triggered, dict):
-        g_type = triggered.get("type")
-        g_id = triggered.get("index")
-
-        if g_type == "remove-graph":
-            graph_list = [g for g in graph_list if g != g_id]
-
-        elif g_type == "move-graph-up":
-            if g_id in graph_list:
-                i = graph_list.index(g_id)
-                if i > 0:
-                    graph_list[i - 1], graph_list[i] = graph_list[i], graph_list[i - 1]
-
-        elif g_type == "move-graph-down":
-            if g_id in graph_list:
-                i = graph_list.index(g_id)
-                if i < len(graph_list) - 1:
-                    graph_list[i + 1], graph_list[i] = graph_list[i], graph_list[i + 1]
-
-    return graph_list
-
-
-@app.callback(
-    Output("graph-container", "children"),
-    Input("graph-list-store", "data"),
-    State("dbc-store", "data"),
-    State("theme-store", "data"),
-)
-def render_graph_blocks(graph_list, dbc_data, theme):
-    if not graph_list:
-        return []
-
-    signals = []
-    if dbc_data:
-        for msg in dbc_data["layout"]:
-            for sig in msg["signals"]:
-                if sig["name"] not in signals:
-                    signals.append(sig["name"])
-
-    dark = theme == "dark"
-
-    blocks = []
-    for graph_id in graph_list:
-        card_bg = "#0B1220" if dark else "#FFFFFF"
-        text_color = "#E2E8F0" if dark else "#0F172A"
-        dropdown_style = {
-            "backgroundColor": "#0B1220",
-            "color": "#E2E8F0",
-            "border": "1px solid #1F2937",
-        } if dark else {
-            "backgroundColor": "#FFFFFF",
-            "color": "#0F172A",
-            "border": "1px solid #CBD5E1",
-        }
-        blocks.append(
-            html.Div(
-                [
-                    html.Div(
-                        [
-                            html.H5(
-                                f"Graph: {graph_id}",
-                                className="mt-1 mb-2",
-                                style={"color": text_color},
-                            ),
-                            dbc.ButtonGroup(
-                                [
-                                    dbc.Button(
-                                        "▲",
-                                        id={"type": "move-graph-up", "index": graph_id},
-                                        size="sm",
-                                        outline=True,
-                                        color="secondary",
-                                    ),
-                                    dbc.Button(
-                                        "▼",
-                                        id={
-                                            "type": "move-graph-down",
-                                            "index": graph_id,
-                                        },
-                                        size="sm",
-                                        outline=True,
-                                        color="secondary",
-                                    ),
-                                    dbc.Button(
-                                        "Remove",
-                                        id={
-                                            "type": "remove-graph",
-                                            "index": graph_id,
-                                        },
-                                        size="sm",
-                                        color="danger",
-                                        outline=True,
-                                        className="ms-1",
-                                    ),
-                                ],
-                                className="ms-auto",
-                            ),
-                        ],
-                        className="d-flex justify-content-between align-items-center",
-                    ),
-                    dcc.Dropdown(
-                        id={"type": "signal-dropdown", "index": graph_id},
-                        options=[{"label": s, "value": s} for s in signals],
-                        multi=True,
-                        placeholder="Select signals to plot...",
-                        className="mb-2",
-                        style=dropdown_style,
-                    ),
-                    dcc.Graph(
-                        id={"type": "plot", "index": graph_id},
-                        style={"height": "260px"},
-                    ),
-                ],
-                className="mb-4 p-3 rounded-3 shadow-sm",
-                style={
-                    "backgroundColor": card_bg,
-                    "border": "1px solid rgba(148,163,184,0.2)" if dark else "1px solid rgba(15,23,42,0.08)",
-                },
-            )
-        )
-    return blocks
-
-
-@app.callback(
-    Output({"type": "plot", "index": MATCH}, "figure"),
-    Input("history-store", "data"),
-    Input({"type": "signal-dropdown", "index": MATCH}, "value"),
-    Input("theme-store", "data"),
-)
-def update_graph(history, selected_signals, theme):
-    dark = theme == "dark"
-    template = "plotly_dark" if dark else "plotly_white"
-    paper_bg = "#020617" if dark else "#FFFFFF"
-    plot_bg = "#020617" if dark else "#FFFFFF"
-
-    fig = go.Figure()
-
-    if history and selected_signals:
-        # normalise single value -> list
-        if isinstance(selected_signals, str):
-            selected_signals = [selected_signals]
-
-        df = pd.DataFrame(history)
-
-        # build a proper datetime column from Unix seconds
-        # (this is filled in decode_frames as "Unix")
-        if "Unix" in df.columns:
-            df["Timestamp"] = pd.to_datetime(df["Unix"], unit="s", errors="coerce")
-        else:
-            # fallback: try to parse the human-readable 'Time' string
-            df["Timestamp"] = pd.to_datetime(df["Time"], errors="coerce")
-
-        for sig in selected_signals:
-            sig_df = df[df["Signal"] == sig].copy()
-            if sig_df.empty:
-                continue
-
-            # --- NEW: sort by Timestamp and then by Seq (if available) ---
-            sort_cols = []
-            if "Timestamp" in sig_df.columns:
-                sort_cols.append("Timestamp")
-            if "Seq" in sig_df.columns:
-                sort_cols.append("Seq")
-            if sort_cols:
-                sig_df = sig_df.sort_values(sort_cols)
-            # -------------------------------------------------------------
-            if GRAPH_MAX_POINTS and len(sig_df) > GRAPH_MAX_POINTS:
-                sig_df = sig_df.iloc[-GRAPH_MAX_POINTS:]
-
-            fig.add_trace(
-                go.Scatter(
-                    x=sig_df["Timestamp"],
-                    y=sig_df["Value"],
-                    mode="lines",
-                    name=sig,
-                )
-            )
-
-
-    fig.update_layout(
-        margin=dict(l=10, r=10, t=30, b=30),
-        height=260,
-        template=template,
-        xaxis=dict(
-            title="Time",
-            type="date",       # time axis
-            autorange=True,    # always show entire min..max of history
-        ),
-        yaxis=dict(
-            title="Value",
-            autorange=True,
-        ),
-        legend_title="Signal",
-        paper_bgcolor=paper_bg,
-        plot_bgcolor=plot_bg,
-    )
-
-    return fig
-
-
-
+    return build_status_cards(
+        connected,
+        seq_value or 0,
+        signal_count,
+        theme or "light",
+        poll_store,
+    )
+
+
+# ---------- FLEET CALLBACKS ----------
+
+
+@app.callback(
+    Output("fleet-enabled", "data"),
+    Output("fleet-poller", "disabled"),
+    Output("fleet-start-btn", "children"),
+    Output("fleet-start-btn", "color"),
+    Output("fleet-status", "children"),
+    Input("fleet-start-btn", "n_clicks"),
+    State("fleet-enabled", "data"),
+    State("fleet-devices", "value"),
+    State("dbc-dropdown", "value"),
+    prevent_initial_call=True,
+)
+def toggle_fleet(_, enabled, devices_text, dbc_path):
+    if enabled:
+        fleet_monitor.stop(timeout=2)
+        return False, True, "Start Fleet", "primary", "Fleet stopped."
+    try:
+        entries = resolve_fleet_entries(_fleet_entries(devices_text, dbc_path))
+        if not entries:
+            return no_update, no_update, no_update, no_update, "Add at least one logger to the device list."
+        fleet_monitor.set_devices(entries)
+        fleet_monitor.start()
+    except Exception as exc:
+        return no_update, no_update, no_update, no_update, f"Fleet not started: {exc}"
+    return True, False, "Stop Fleet", "danger", f"Polling {len(entries)} loggers concurrently."
+
+
+@app.callback(
+    Output("fleet-table", "data"),
+    Input("fleet-poller", "n_intervals"),
+    Input("fleet-enabled", "data"),
+)
+def update_fleet_table(_, enabled):
+    if not enabled and not fleet_monitor.devices:
+        return no_update
+    return fleet_monitor.overview()
+
+
+# ---------- GRAPH MANAGEMENT CALLBACKS ----------
+
+@app.callback(
+    Output("graph-list-store", "data"),
+    Input("add-graph-btn", "n_clicks"),
+    Input({"type": "remove-graph", "index": ALL}, "n_clicks"),
+    Input({"type": "move-graph-up", "index": ALL}, "n_clicks"),
+    Input({"type": "move-graph-down", "index": ALL}, "n_clicks"),
+    State("graph-list-store", "data"),
+    prevent_initial_call=True,
+)
+def modify_graph_list(add_clicks, remove_clicks, move_up, move_down, graph_list):
+    graph_list = graph_list or []
+    triggered = ctx.triggered_id
+
+    if triggered == "add-graph-btn":
+        graph_id = f"graph-{len(graph_list) + 1}"
+        graph_list.append(graph_id)
+        return graph_list
+
+    if isinstance(triggered, dict):
+        g_type = triggered.get("type")
+        g_id = triggered.get("index")
+
+        if g_type == "remove-graph":
+            graph_list = [g for g in graph_list if g != g_id]
+
+        elif g_type == "move-graph-up":
+            if g_id in graph_list:
+                i = graph_list.index(g_id)
+                if i > 0:
+                    graph_list[i - 1], graph_list[i] = graph_list[i], graph_list[i - 1]
+
+        elif g_type == "move-graph-down":
+            if g_id in graph_list:
+                i = graph_list.index(g_id)
+                if i < len(graph_list) - 1:
+                    graph_list[i + 1], graph_list[i] = graph_list[i], graph_list[i + 1]
+
+    return graph_list
+
+
+@app.callback(
+    Output("graph-container", "children"),
+    Input("graph-list-store", "data"),
+    State("dbc-store", "data"),
+    State("theme-store", "data"),
+)
+def render_graph_blocks(graph_list, dbc_data, theme):
+    if not graph_list:
+        return []
+
+    signals = []
+    if dbc_data:
+        for msg in dbc_data["layout"]:
+            for sig in msg["signals"]:
+                if sig["name"] not in signals:
+                    signals.append(sig["name"])
+
+    dark = theme == "dark"
+
+    blocks = []
+    for graph_id in graph_list:
+        card_bg = "#0B1220" if dark else "#FFFFFF"
+        text_color = "#E2E8F0" if dark else "#0F172A"
+        dropdown_style = {
+            "backgroundColor": "#0B1220",
+            "color": "#E2E8F0",
+            "border": "1px solid #1F2937",
+        } if dark else {
+            "backgroundColor": "#FFFFFF",
+            "color": "#0F172A",
+            "border": "1px solid #CBD5E1",
+        }
+        blocks.append(
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.H5(
+                                f"Graph: {graph_id}",
+                                className="mt-1 mb-2",
+                                style={"color": text_color},
+                            ),
+                            dbc.ButtonGroup(
+                                [
+                                    dbc.Button(
+                                        "▲",
+                                        id={"type": "move-graph-up", "index": graph_id},
+                                        size="sm",
+                                        outline=True,
+                                        color="secondary",
+                                    ),
+                                    dbc.Button(
+                                        "▼",
+                                        id={
+                                            "type": "move-graph-down",
+                                            "index": graph_id,
+                                        },
+                                        size="sm",
+                                        outline=True,
+                                        color="secondary",
+                                    ),
+                                    dbc.Button(
+                                        "Remove",
+                                        id={
+                                            "type": "remove-graph",
+                                            "index": graph_id,
+                                        },
+                                        size="sm",
+                                        color="danger",
+                                        outline=True,
+                                        className="ms-1",
+                                    ),
+                                ],
+                                className="ms-auto",
+                            ),
+                        ],
+                        className="d-flex justify-content-between align-items-center",
+                    ),
+                    dcc.Dropdown(
+                        id={"type": "signal-dropdown", "index": graph_id},
+                        options=[{"label": s, "value": s} for s in signals],
+                        multi=True,
+                        placeholder="Select signals to plot...",
+                        className="mb-2",
+                        style=dropdown_style,
+                    ),
+                    dcc.Graph(
+                        id={"type": "plot", "index": graph_id},
+                        style={"height": "260px"},
+                    ),
+                    dcc.Store(id={"type": "plot-cursor", "index": graph_id}),
+                ],
+                className="mb-4 p-3 rounded-3 shadow-sm",
+                style={
+                    "backgroundColor": card_bg,
+                    "border": "1px solid rgba(148,163,184,0.2)" if dark else "1px solid rgba(15,23,42,0.08)",
+                },
+            )
+        )
+    return blocks
+
+
+def _plot_xy(t: np.ndarray, v: np.ndarray):
+    """Plot arrays for one trace: x in epoch ms (Plotly date axis), non-numeric values dropped."""
+    keep = np.isfinite(t) & np.isfinite(v)
+    return (t[keep] * 1000.0).tolist(), v[keep].tolist()
+
+
+def _graph_figure(signals: List[str], points, theme: str) -> go.Figure:
+    dark = theme == "dark"
+    template = "plotly_dark" if dark else "plotly_white"
+    paper_bg = "#020617" if dark else "#FFFFFF"
+    plot_bg = "#020617" if dark else "#FFFFFF"
+
+    fig = go.Figure()
+    for sig, (t, v, _) in zip(signals, points):
+        x, y = _plot_xy(t, v)
+        # WebGL traces: extending them stays cheap with many graphs/points.
+        fig.add_trace(go.Scattergl(x=x, y=y, mode="lines", name=sig))
+
+    fig.update_layout(
+        margin=dict(l=10, r=10, t=30, b=30),
+        height=260,
+        template=template,
+        xaxis=dict(
+            title="Time",
+            type="date",       # time axis (epoch ms)
+            autorange=True,    # always show entire min..max of the window
+        ),
+        yaxis=dict(
+            title="Value",
+            autorange=True,
+        ),
+        legend_title="Signal",
+        paper_bgcolor=paper_bg,
+        plot_bgcolor=plot_bg,
+        # Keep the user's zoom while points are appended.
+        uirevision="|".join(signals),
+    )
+    return fig
+
+
+@app.callback(
+    Output({"type": "plot", "index": MATCH}, "figure"),
+    Output({"type": "plot", "index": MATCH}, "extendData"),
+    Output({"type": "plot-cursor", "index": MATCH}, "data"),
+    Input("history-cursor", "data"),
+    Input({"type": "signal-dropdown", "index": MATCH}, "value"),
+    Input("theme-store", "data"),
+    State({"type": "plot-cursor", "index": MATCH}, "data"),
+    State("ingest-key", "data"),
+)
+def update_graph(_cursor, selected_signals, theme, plot_cursor, ingest_key):
+    """
+    Build the figure when the selection or theme changes (or the history was
+    reset); otherwise only append the points that arrived since the graph's
+    cursor via extendData, keeping at most GRAPH_MAX_POINTS per trace.
+    """
+    # normalise single value -> list
+    if isinstance(selected_signals, str):
+        selected_signals = [selected_signals]
+    signals = list(selected_signals or [])
+    max_points = GRAPH_MAX_POINTS or None
+    if not ingest_key:
+        empty = [(np.empty(0), np.empty(0), 0)] * len(signals)
+        return _graph_figure(signals, empty, theme or "light"), no_update, {}
+    ingest = live_ingest_for(ingest_key)
+
+    plot_cursor = plot_cursor or {}
+    rebuild = (
+        ctx.triggered_id != "history-cursor"
+        or plot_cursor.get("signals") != signals
+    )
+    if not rebuild:
+        epoch, points = ingest.signal_points(signals, plot_cursor.get("totals"), max_points)
+        totals = plot_cursor.get("totals") or []
+        rebuild = epoch != plot_cursor.get("epoch") or any(
+            total < old for (_, _, total), old in zip(points, totals)
+        )
+
+    if rebuild:
+        epoch, points = ingest.signal_points(signals, None, max_points)
+        cursor_out = {"epoch": epoch, "signals": signals, "totals": [p[2] for p in points]}
+        return _graph_figure(signals, points, theme or "light"), no_update, cursor_out
+
+    if not signals or all(len(t) == 0 for t, _, _ in points):
+        return no_update, no_update, no_update
+
+    xs, ys = zip(*(_plot_xy(t, v) for t, v, _ in points))
+    extend = [{"x": list(xs), "y": list(ys)}, list(range(len(signals)))]
+    if max_points:
+        extend.append(max_points)
+    cursor_out = {"epoch": epoch, "signals": signals, "totals": [p[2] for p in points]}
+    return no_update, extend, cursor_out
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8600, debug=False)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Fleet mode check for the Live Dashboard.
+
+Starts several stand-in loggers (Live_Stand_In.py) on local ports, each with
+its own DBC from DBC_Dump (round robin) and boot id, and polls them all with
+the dashboard's FleetMonitor. The device list is given as fleet text with bare
+DBC file names, like the dashboard's fleet panel. Halfway through, one logger is rebooted (seq
+back to 0, new boot id). At the end it prints the fleet overview and checks
+every device: no poll errors, every frame received (no sequence gaps), caught
+up with its logger, its own cursor and Bus_current correction state, and a
+resync on the rebooted logger only. Exits non-zero when a check fails.
+
+Usage:
+  python Live_Fleet_Check.py
+  python Live_Fleet_Check.py --count 10 --rate 200 --seconds 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+import Live_Dashboard as dashboard  # noqa: E402
+from Live_Stand_In import DEFAULT_DBC_DIR, StandInLogger  # noqa: E402
+
+
+def _dbc_paths():
+    if not os.path.isdir(DEFAULT_DBC_DIR):
+        return []
+    names = sorted(f for f in os.listdir(DEFAULT_DBC_DIR) if f.lower().endswith(".dbc"))
+    return [os.path.join(DEFAULT_DBC_DIR, name) for name in names]
+
+
+def run(count, rate, seconds, poll_interval, reboot=True):
+    dbcs = _dbc_paths()
+    if not dbcs:
+        raise SystemExit("no DBC files in DBC_Dump")
+
+    loggers, lines = [], []
+    for i in range(count):
+        dbc_path = dbcs[i % len(dbcs)]
+        logger = StandInLogger(dbc_path, rate=rate, boot=f"boot-{i + 1}", seed=i)
+        url = logger.start()
+        loggers.append(logger)
+        lines.append(f"logger-{i + 1} = {url}, {os.path.basename(dbc_path)}")
+    entries = dashboard._fleet_entries("\n".join(lines))
+
+    monitor = dashboard.FleetMonitor(interval=poll_interval)
+    monitor.set_devices(dashboard.resolve_fleet_entries(entries))
+    monitor.start()
+    try:
+        time.sleep(seconds / 2)
+        if reboot:
+            loggers[0].reboot(boot="boot-1b")
+        time.sleep(seconds / 2)
+        # Let every device catch up with the frames generated so far.
+        targets = [logger.seq for logger in loggers]
+        deadline = time.time() + 5
+        while time.time() < deadline and any(
+            monitor.devices[e["name"]].last_seq < target for e, target in zip(entries, targets)
+        ):
+            time.sleep(0.05)
+    finally:
+        monitor.stop(5)
+        for logger in loggers:
+            logger.stop()
+    devices = [monitor.devices[e["name"]] for e in entries]
+    return entries, targets, monitor.overview(), devices
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Poll several stand-in loggers with the Live Dashboard fleet monitor.")
+    parser.add_argument("--count", type=int, default=6, help="number of stand-in loggers")
+    parser.add_argument("--rate", type=float, default=100.0, help="frames/s per logger")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--poll-interval", type=float, default=dashboard.LIVE_POLL_INTERVAL,
+                        help="base poll interval in seconds (default LIVE_POLL_INTERVAL)")
+    parser.add_argument("--no-reboot", action="store_true", help="do not reboot the first logger midway")
+    args = parser.parse_args(argv)
+    if not dashboard.AIOHTTP_AVAILABLE:
+        print("Fleet mode needs aiohttp (pip install aiohttp).")
+        return 1
+
+    entries, targets, rows, devices = run(args.count, args.rate, args.seconds, args.poll_interval,
+                                          reboot=not args.no_reboot)
+
+    print(f"{'device':<12} {'health':<10} {'seq':>7} {'frames':>8} {'rate':>7} {'lost':>5} {'reboots':>7}  dbc")
+    for row, device in zip(rows, devices):
+        print(f"{row['device']:<12} {row['health']:<10} {row['seq']:>7} {device.frames:>8} "
+              f"{row['rate']:>7} {row['lost_total']:>5} {row['resets']:>7}  {row['dbc']}")
+
+    failures = []
+    for i, (entry, target, device) in enumerate(zip(entries, targets, devices)):
+        name = entry["name"]
+        if device.failures:
+            failures.append(f"{name}: {device.failures} failed polls ({device.error})")
+        if not device.frames:
+            failures.append(f"{name}: no frames received")
+        if device.loss.total:
+            failures.append(f"{name}: {device.loss.total} frames lost")
+        if device.last_seq < target:
+            failures.append(f"{name}: stopped at seq {device.last_seq}, logger at {target}")
+        expected_resets = 1 if i == 0 and not args.no_reboot else 0
+        if device.resets != expected_resets:
+            failures.append(f"{name}: {device.resets} reboots detected, expected {expected_resets}")
+    if len({id(device.correction) for device in devices}) != len(devices):
+        failures.append("devices share Bus_current correction state")
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
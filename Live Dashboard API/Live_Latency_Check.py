@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+End-to-end latency check for the Live Dashboard push path.
+
+Starts a stand-in logger (Live_Stand_In.py) and the dashboard server on local
+ports, starts the dashboard's background ingest for the stand-in and listens
+to its /stream like the page does. A delta shows every frame up to its seq, so
+for each frame covered by a delta it measures the time from the frame's
+creation on the stand-in (the CAN frame reaching the logger) to the delta
+arriving at the client. Prints min / median / p95 / max over those frames and
+exits non-zero when the median is above --max-median-ms.
+
+Usage:
+  python Live_Latency_Check.py
+  python Live_Latency_Check.py --rate 500 --seconds 20 --poll-interval 0.05
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+import requests
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+import Live_Dashboard as dashboard  # noqa: E402
+from Live_Stand_In import StandInLogger, default_dbc  # noqa: E402
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def measure(dbc_path, rate, seconds, poll_interval):
+    logger = StandInLogger(dbc_path, rate=rate)
+    logger_url = logger.start()
+
+    web = make_server("127.0.0.1", 0, dashboard.server, threaded=True,
+                      request_handler=_QuietHandler)
+    threading.Thread(target=web.serve_forever, daemon=True).start()
+    stream_url = f"http://127.0.0.1:{web.server_port}/stream"
+
+    dbc_info = dashboard.parse_dbc_file(dbc_path)
+    key = dashboard.live_ingest_key(logger_url, dbc_info["id"])
+    ingest = dashboard.live_ingest_for(key)
+    ingest.interval = poll_interval
+    ingest.start()
+
+    latencies = []
+    deltas = 0
+    shown = None
+    try:
+        with requests.get(stream_url, params=key, stream=True,
+                          timeout=(3, dashboard.STREAM_HEARTBEAT + 5)) as resp:
+            resp.raise_for_status()
+            deadline = time.time() + seconds
+            for line in resp.iter_lines(decode_unicode=True):
+                if time.time() > deadline:
+                    break
+                if not line or not line.startswith("data:"):
+                    continue
+                received = time.time()
+                seq = json.loads(line[5:])["q"]
+                deltas += 1
+                if shown is not None:
+                    for frame_seq in range(shown + 1, seq + 1):
+                        created = logger.created.get(frame_seq)
+                        if created is not None:
+                            latencies.append((received - created) * 1000.0)
+                # The first delta also carries the backlog from before we listened.
+                shown = seq if shown is None else max(shown, seq)
+    finally:
+        ingest.stop(2)
+        web.shutdown()
+        logger.stop()
+    return latencies, deltas, logger.seq
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure CAN frame -> pushed value latency of the Live Dashboard.")
+    parser.add_argument("--dbc", default=default_dbc(), help="DBC used by the stand-in and the dashboard")
+    parser.add_argument("--rate", type=float, default=200.0, help="stand-in frames/s")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--poll-interval", type=float, default=dashboard.LIVE_POLL_INTERVAL,
+                        help="background poll interval in seconds (default LIVE_POLL_INTERVAL)")
+    parser.add_argument("--max-median-ms", type=float, default=100.0)
+    args = parser.parse_args(argv)
+    if not args.dbc:
+        parser.error("no DBC found; pass --dbc")
+
+    latencies, deltas, frames = measure(args.dbc, args.rate, args.seconds, args.poll_interval)
+    if not latencies:
+        print(f"No deltas received ({frames} frames generated).")
+        return 1
+    median = statistics.median(latencies)
+    print(f"{deltas} deltas, {len(latencies)} of {frames} frames timed, poll interval {args.poll_interval:g}s")
+    print(f"latency ms: min {min(latencies):.1f}  median {median:.1f}  "
+          f"p95 {_percentile(latencies, 0.95):.1f}  max {max(latencies):.1f}")
+    if median > args.max_median_ms:
+        print(f"FAIL: median above {args.max_median_ms:g} ms")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
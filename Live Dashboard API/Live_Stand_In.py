@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the ESP32 logger's /live endpoint.
+
+Serves the same JSON as handleLiveData() in the firmware: a ring of the last
+LIVE_BUFFER_SIZE frames, `since` / `limit` (1..200, default 50) and a running
+`latest` sequence. Frames are generated at a fixed rate from a DBC, with
+in-range signal values, so the dashboard decodes them like real traffic.
+Useful for trying the Live Dashboard without hardware, and for the latency
+and fleet checks (Live_Latency_Check.py, Live_Fleet_Check.py).
+
+Usage:
+  python Live_Stand_In.py                                   # first DBC in DBC_Dump, port 8701
+  python Live_Stand_In.py --dbc "../DBC_Dump/Naxatra_Labs_Test_Controller (11).dbc" --rate 500
+  python Live_Stand_In.py --count 8                         # a fleet: ports 8701..8708
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import cantools
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DBC_DIR = os.path.join(os.path.dirname(BASE_DIR), "DBC_Dump")
+
+# Firmware constants (CAN_Data_Logger_Encoded.ino)
+LIVE_BUFFER_SIZE = 200
+LIVE_DEFAULT_LIMIT = 50
+PAYLOADS_PER_MESSAGE = 32
+
+
+def _payload_pool(message, rng, size=PAYLOADS_PER_MESSAGE):
+    """Pre-encoded data bytes for one message: random in-range values for every signal."""
+    pool = []
+    for _ in range(size):
+        values = {}
+        for signal in message.signals:
+            lo = signal.minimum if signal.minimum is not None else 0.0
+            hi = signal.maximum if signal.maximum is not None else lo + 100.0
+            if hi < lo:
+                lo, hi = hi, lo
+            values[signal.name] = rng.uniform(lo, hi)
+        try:
+            data = message.encode(values, scaling=True, strict=False)
+        except Exception:
+            data = bytes(rng.getrandbits(8) for _ in range(message.length))
+        pool.append(bytes(data))
+    return pool
+
+
+class StandInLogger:
+    """
+    One simulated logger: a generator thread fills the live ring at `rate`
+    frames/s and an HTTP server answers /live from it. `created` maps each
+    seq to the time.time() it was generated (kept for the last `keep_times`
+    frames), so a client can measure end-to-end latency.
+    """
+
+    def __init__(self, dbc_path, rate=200.0, boot=None, buffer_size=LIVE_BUFFER_SIZE,
+                 seed=0, keep_times=100_000):
+        self.db = cantools.database.load_file(dbc_path)
+        self.messages = list(self.db.messages)
+        if not self.messages:
+            raise ValueError(f"No messages in {dbc_path}")
+        rng = random.Random(seed)
+        self._pools = [_payload_pool(m, rng) for m in self.messages]
+        self._rng = rng
+        self.rate = float(rate)
+        self.boot = boot
+        self.buffer_size = buffer_size
+        self.seq = 0
+        self.created = {}
+        self._keep_times = keep_times
+        self._ring = [None] * buffer_size
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self.httpd = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _emit(self, count):
+        now = time.time()
+        with self._lock:
+            for _ in range(count):
+                self.seq += 1
+                index = self._rng.randrange(len(self.messages))
+                message = self.messages[index]
+                data = self._rng.choice(self._pools[index])
+                self._ring[(self.seq - 1) % self.buffer_size] = {
+                    "seq": self.seq,
+                    "time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+                    "unix": int(now),
+                    "micros": int((now % 1) * 1_000_000),
+                    "id": f"{message.frame_id:X}",
+                    "extended": bool(message.is_extended_frame),
+                    "rtr": False,
+                    "dlc": len(data),
+                    "data": [f"{b:02X}" for b in data],
+                }
+                self.created[self.seq] = now
+                self.created.pop(self.seq - self._keep_times, None)
+
+    def _generate(self):
+        start = time.perf_counter()
+        emitted = 0
+        while not self._stop.is_set():
+            due = int((time.perf_counter() - start) * self.rate)
+            if due > emitted:
+                self._emit(due - emitted)
+                emitted = due
+            self._stop.wait(0.001)
+
+    def reboot(self, boot=None):
+        """Simulate a logger restart: seq starts again from 0 with an empty ring."""
+        with self._lock:
+            self.seq = 0
+            self._ring = [None] * self.buffer_size
+            self.created.clear()
+            self.boot = boot
+
+    def live(self, since=0, limit=LIVE_DEFAULT_LIMIT):
+        """The /live response, following handleLiveData() in the firmware."""
+        limit = max(1, min(int(limit), self.buffer_size))
+        with self._lock:
+            latest = self.seq
+            frames = []
+            if latest > 0:
+                earliest = latest - self.buffer_size + 1 if latest >= self.buffer_size else 1
+                start = since + 1 if since > 0 else earliest
+                start = min(max(start, earliest), latest)
+                for seq in range(start, latest + 1):
+                    if len(frames) >= limit:
+                        break
+                    frame = self._ring[(seq - 1) % self.buffer_size]
+                    if frame is not None and frame["seq"] == seq:
+                        frames.append(frame)
+            payload = {"status": "ok", "latest": latest, "frames": frames}
+        if self.boot is not None:
+            payload["boot"] = self.boot
+        return payload
+
+    def start(self, host="127.0.0.1", port=0):
+        logger = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/live":
+                    self.send_error(404)
+                    return
+                query = parse_qs(url.query)
+                try:
+                    since = int(query.get("since", ["0"])[0])
+                    limit = int(query.get("limit", [str(LIVE_DEFAULT_LIMIT)])[0])
+                except ValueError:
+                    since, limit = 0, LIVE_DEFAULT_LIMIT
+                body = json.dumps(logger.live(since, limit), separators=(",", ":")).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        for target in (self.httpd.serve_forever, self._generate):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self.url
+
+    def stop(self):
+        self._stop.set()
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+
+def default_dbc():
+    names = sorted(f for f in os.listdir(DEFAULT_DBC_DIR) if f.lower().endswith(".dbc")) \
+        if os.path.isdir(DEFAULT_DBC_DIR) else []
+    return os.path.join(DEFAULT_DBC_DIR, names[0]) if names else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a simulated ESP32 /live endpoint.")
+    parser.add_argument("--dbc", default=default_dbc(), help="DBC used to encode frames")
+    parser.add_argument("--rate", type=float, default=200.0, help="frames/s")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8701)
+    parser.add_argument("--boot", default=None, help="boot id reported in every response")
+    parser.add_argument("--count", type=int, default=1, help="number of loggers, on consecutive ports")
+    args = parser.parse_args(argv)
+    if not args.dbc:
+        parser.error("no DBC found; pass --dbc")
+
+    loggers = []
+    try:
+        for i in range(max(1, args.count)):
+            boot = args.boot if args.count == 1 or args.boot is None else f"{args.boot}-{i + 1}"
+            logger = StandInLogger(args.dbc, rate=args.rate, boot=boot, seed=i)
+            loggers.append(logger)
+            url = logger.start(args.host, args.port + i)
+            print(f"Stand-in logger on {url}/live ({args.rate:g} frames/s, {os.path.basename(args.dbc)})")
+        print("Ctrl+C to stop.")
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for logger in loggers:
+            logger.stop()
+
+
+if __name__ == "__main__":
+    main()
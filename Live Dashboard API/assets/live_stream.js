@@ -0,0 +1,68 @@
+// Live value push for the CAN Live Dashboard.
+//
+// Listens to the server-sent events from /stream (one compact delta per
+// decoded batch: {"q": seq, "ts": sent, "s": {signal: [value, time]}}) and
+// writes the values straight into the message cards, without waiting for the
+// next Dash refresh. The cards mark their value/time elements with
+// data-signal-value / data-signal-time (build_message_cards).
+//
+// The stream is the one of this page's ingest (logger URL + DBC): the
+// clientside callback live.connect reopens it whenever the ingest-key store
+// changes.
+(function () {
+    "use strict";
+
+    function escapeName(name) {
+        return window.CSS && CSS.escape ? CSS.escape(name) : name.replace(/["\\]/g, "\\$&");
+    }
+
+    function setText(selector, text) {
+        var nodes = document.querySelectorAll(selector);
+        for (var i = 0; i < nodes.length; i++) {
+            if (nodes[i].textContent !== text) {
+                nodes[i].textContent = text;
+            }
+        }
+    }
+
+    function applyDelta(delta) {
+        var values = delta.s || {};
+        Object.keys(values).forEach(function (name) {
+            var key = escapeName(name);
+            setText('[data-signal-value="' + key + '"]', values[name][0]);
+            setText('[data-signal-time="' + key + '"]', values[name][1]);
+        });
+        // Exposed for debugging: last pushed seq and server-to-page delay (ms)
+        window.liveStream = {seq: delta.q, delayMs: Date.now() - delta.ts * 1000};
+    }
+
+    function onMessage(event) {
+        var delta;
+        try {
+            delta = JSON.parse(event.data);
+        } catch (err) {
+            return;
+        }
+        applyDelta(delta);
+    }
+
+    var source = null;
+
+    function connect(key) {
+        if (source) {
+            source.close();
+            source = null;
+        }
+        if (key && key.dbc && window.EventSource) {
+            source = new EventSource(
+                "/stream?url=" + encodeURIComponent(key.url) + "&dbc=" + encodeURIComponent(key.dbc)
+            );
+            source.onmessage = onMessage;
+        }
+        return window.dash_clientside.no_update;
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        live: {connect: connect},
+    });
+})();